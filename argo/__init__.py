@@ -1,13 +1,16 @@
-from .schema import Schema, Attr, Accessor
+from .schema import Schema, Attr, Accessor, Constant
+from .profiling import profile
 from . import types
 from . import exceptions
 from . import validators
 
 __all__ = [
     "Accessor",
+    "Constant",
     "Schema",
     "Attr",
     "types",
     "exceptions",
     "validators",
+    "profile",
 ]
@@ -0,0 +1,99 @@
+"""Asyncio serialization of schemas with awaitable accessors."""
+
+import asyncio
+import inspect
+
+from . import compiler
+from . import types
+
+_SKIP = object()
+
+
+class _Unlimited(object):
+
+    """Concurrency limiter that doesn't limit anything."""
+
+    async def __aenter__(self):
+        pass
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+async def _resolve(value, limiter):
+    """Await the value if it is awaitable, holding a slot of the limiter."""
+    if not inspect.isawaitable(value):
+        return value
+    async with limiter:
+        return await value
+
+
+async def _get(field, value, kwargs, limiter):
+    try:
+        return await _resolve(field.accessor.get(value, **kwargs), limiter)
+    except (AttributeError, KeyError):
+        if not field.has_default:
+            raise
+        return field.default
+
+
+async def _serialize_field(field, value, kwargs, limiter):
+    """Serialize the attribute, `_SKIP` if the optional attribute is missing."""
+    try:
+        if field.generic:
+            return await _resolve(field.attr.serialize(value, **kwargs), limiter)
+        if not field.is_type:
+            return field.attr_type
+
+        value = await _get(field, value, kwargs, limiter)
+
+        nested = compiler.schema_type(field.attr_type)
+        if nested is not None:
+            return await _serialize(nested, value, kwargs, limiter)
+        items = compiler.list_item_schema(field.attr_type)
+        if items is not None:
+            return await _serialize_many(items, value, kwargs, limiter)
+        result = await _resolve(field.convert(value, kwargs), limiter)
+        if isinstance(field.attr_type, types.List) and isinstance(result, list):
+            # Items of the lists of other types are resolved concurrently as well.
+            return list(await asyncio.gather(*[_resolve(item, limiter) for item in result]))
+        return result
+    except (AttributeError, KeyError):
+        if field.required:
+            raise
+        return _SKIP
+
+
+async def _serialize(schema, value, kwargs, limiter):
+    value = await _resolve(value, limiter)
+    fields = schema.__plan__.fields
+    serialized = await asyncio.gather(*[_serialize_field(field, value, kwargs, limiter) for field in fields])
+
+    result = {}
+    for field, attr_value in zip(fields, serialized):
+        compartment = result
+        if field.compartment is not None:
+            compartment = result.setdefault(field.compartment, {})
+        if attr_value is not _SKIP:
+            compartment[field.key] = attr_value
+    return result
+
+
+async def _serialize_many(schema, values, kwargs, limiter):
+    return list(await asyncio.gather(*[_serialize(schema, value, kwargs, limiter) for value in values]))
+
+
+async def serialize(schema, value, kwargs, limit=None):
+    """Serialize the value with the schema resolving the awaitable attribute values.
+
+    Sibling attributes and list items are serialized concurrently. The result is the same as the synchronous
+    serialization would give if all the awaitables were already resolved.
+
+    :param schema: Schema class.
+    :param value: Dict or object to serialize, or an awaitable of it.
+    :param kwargs: Serialization context.
+    :param limit: Maximum number of the awaitables resolved at once, unlimited if None.
+    :return: Serialized value.
+    """
+    limiter = _Unlimited() if limit is None else asyncio.Semaphore(limit)
+    return await _serialize(schema, value, kwargs, limiter)
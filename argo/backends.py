@@ -0,0 +1,165 @@
+"""JSON backends."""
+
+import json
+
+from . import compiler
+from . import lazy
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover
+    ujson = None
+
+_encoder = json.JSONEncoder()
+
+
+def _encode_float(value):
+    # Infinity and NaN are the only floats where value - value is not 0.
+    if value - value == 0:
+        return float.__repr__(value)
+    return _encoder.encode(value)
+
+
+_ENCODERS = {
+    str: json.encoder.encode_basestring_ascii,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+}
+
+
+def encode_value(value):
+    """Encode a serialized value into JSON the same way as `json.dumps`.
+
+    The most common scalar types are encoded directly, the rest is passed to the JSON encoder.
+    """
+    encode = _ENCODERS.get(type(value))
+    if encode is not None:
+        return encode(value)
+    return _encoder.encode(value)
+
+
+class Backend(object):
+
+    """JSON backend used by `Schema.dumps`."""
+
+    name = None
+
+    def dumps(self, value):
+        """Encode the value into JSON bytes."""
+        raise NotImplementedError
+
+    def loads(self, data):
+        """Decode JSON bytes or string."""
+        raise NotImplementedError
+
+    def dumps_schema(self, schema, value, kwargs):
+        """Serialize the value with the schema into JSON bytes.
+
+        :param schema: Schema class.
+        :param value: Dict or object to serialize.
+        :param kwargs: Serialization context.
+        """
+        result = schema.serialize(value, **kwargs)
+        if schema.__plan__.lazy:
+            lazy.resolve(result)
+        return self.dumps(result)
+
+
+class Json(Backend):
+
+    """Standard library `json` backend.
+
+    The schemas are compiled into encoders that write JSON directly from the attribute values,
+    which is faster than building the serialized dict and encoding it.
+    """
+
+    name = "json"
+
+    def dumps(self, value):
+        return json.dumps(value).encode("utf-8")
+
+    def loads(self, data):
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data)
+
+    def dumps_schema(self, schema, value, kwargs):
+        encode = compiler.encoder(schema, encode_value)
+        if encode is None:
+            return super(Json, self).dumps_schema(schema, value, kwargs)
+        return encode(value, kwargs).encode("utf-8")
+
+
+class Orjson(Backend):
+
+    """`orjson` backend.
+
+    Encoding of the serialized dict in C is faster than writing JSON fragments in Python.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed.")
+
+    def dumps(self, value):
+        return orjson.dumps(value)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class Ujson(Backend):
+
+    """`ujson` backend."""
+
+    name = "ujson"
+
+    def __init__(self):
+        if ujson is None:
+            raise ImportError("ujson is not installed.")
+
+    def dumps(self, value):
+        return ujson.dumps(value, escape_forward_slashes=False).encode("utf-8")
+
+    def loads(self, data):
+        return ujson.loads(data)
+
+
+BACKENDS = dict((backend.name, backend) for backend in (Json, Orjson, Ujson))
+
+_backends = {}
+_default = "json"
+
+
+def set_default(backend):
+    """Set the default JSON backend.
+
+    :param backend: Backend name ("json", "orjson" or "ujson") or a `Backend` instance.
+    """
+    global _default
+    get_backend(backend)
+    _default = backend
+
+
+def get_backend(backend=None):
+    """Get the JSON backend.
+
+    :param backend: Backend name or a `Backend` instance, the default backend if None.
+    :return: `Backend` instance.
+    """
+    if backend is None:
+        backend = _default
+    if isinstance(backend, Backend):
+        return backend
+    if backend not in _backends:
+        _backends[backend] = BACKENDS[backend]()
+    return _backends[backend]
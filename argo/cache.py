@@ -0,0 +1,205 @@
+"""Cache of the serialized representations across calls."""
+
+import collections
+import threading
+import time
+import uuid
+import weakref
+
+from .schema import Accessor
+
+
+class MemoryBackend(object):
+
+    """In-process storage with the least recently used eviction."""
+
+    def __init__(self, maxsize=1024):
+        """Memory backend constructor.
+
+        :param maxsize: Maximum number of the entries kept.
+        """
+        self.maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get the entry, None if it is missing or expired."""
+        with self._lock:
+            try:
+                expires, entry = self._entries.pop(key)
+            except KeyError:
+                return None
+            if expires is not None and expires <= time.time():
+                return None
+            self._entries[key] = expires, entry
+            return entry
+
+    def set(self, key, entry, ttl=None):
+        """Store the entry evicting the least recently used ones."""
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = expires, entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Remove the entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend(object):
+
+    """Storage in Redis or any client with the same `get`, `set(ex=)` and `delete` methods.
+
+    Eviction is left to the server, e.g. with the `allkeys-lru` policy. Entries are stored as the length-prefixed
+    version followed by the JSON bytes, nothing read from the server is unpickled or executed.
+    """
+
+    def __init__(self, client, prefix="argo:"):
+        """Redis backend constructor.
+
+        :param client: Redis client, e.g. `redis.Redis()`.
+        :param prefix: Prefix of the keys, all the keys with it are removed by `clear`.
+        """
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        data = self.client.get(self.prefix + key)
+        if data is None:
+            return None
+        if data[:1] == b"-":
+            return None, data[1:]
+        size, sep, rest = data.partition(b":")
+        try:
+            size = int(size)
+        except ValueError:
+            return None
+        if not sep or len(rest) < size:
+            return None
+        return rest[:size].decode("utf-8"), rest[size:]
+
+    def set(self, key, entry, ttl=None):
+        version, data = entry
+        if version is None:
+            header = b"-"
+        else:
+            version = version.encode("utf-8")
+            header = str(len(version)).encode("ascii") + b":" + version
+        self.client.set(self.prefix + key, header + data, ex=ttl)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        keys = list(self.client.scan_iter(self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class LRUCache(object):
+
+    """Cache of the encoded JSON of the schema values.
+
+    Entries are stored by the schema class and the key of the value. Each class object has its own entries, so
+    schemas with the same name never share them, even in a shared backend. When the value has a version (e.g. updated
+    timestamp or etag) the entry is only used if its version is the same, so changed values are re-serialized
+    even without the explicit invalidation. Versions are compared by their `repr`, the same way as the keys.
+
+    Only the top-level `Schema.dumps` calls are cached, so the cached bytes are always what the schema would
+    encode. `serialize`, `serialize_many`, `List` items and nested schemas serialize the values every time.
+
+    .. code-block:: python
+
+        class Book(argo.Schema):
+            __cache__ = LRUCache(maxsize=10000, ttl=300, key="id", version="updated_at")
+    """
+
+    def __init__(self, maxsize=1024, ttl=None, key="id", version=None, vary=(), backend=None):
+        """LRU cache constructor.
+
+        :param maxsize: Maximum number of the entries of the default memory backend.
+        :param ttl: Time to live of the entries in seconds, None for no expiration.
+        :param key: Function or dot-separated path to get the key of the value.
+        :param version: Function or dot-separated path to get the version of the value.
+        :param vary: Names of the serialization context arguments the representation depends on.
+            Other context arguments are not part of the key.
+        :param backend: Storage of the entries, `MemoryBackend(maxsize)` by default.
+        """
+        self.ttl = ttl
+        self.key = Accessor(key)
+        self.version = None if version is None else Accessor(version)
+        self.vary = tuple(vary)
+        self.backend = MemoryBackend(maxsize) if backend is None else backend
+        self.hits = 0
+        self.misses = 0
+        self._schemas = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def schema_key(self, schema):
+        """Unique key of the schema class, never reused by another class or process."""
+        try:
+            return self._schemas[schema]
+        except KeyError:
+            pass
+        with self._lock:
+            return self._schemas.setdefault(schema, "{0}.{1}#{2}".format(
+                schema.__module__, getattr(schema, "__qualname__", schema.__name__), uuid.uuid4().hex))
+
+    def entry_key(self, schema, value, kwargs=None):
+        """Key of the stored entry of the value."""
+        key = "{0}:{1!r}".format(self.schema_key(schema), self.key.get(value))
+        if self.vary:
+            kwargs = kwargs or {}
+            key += ":" + repr(tuple(kwargs.get(name) for name in self.vary))
+        return key
+
+    def lookup(self, schema, value, kwargs):
+        """Find the encoded JSON of the value.
+
+        :return: Tuple of the entry key, version of the value and the JSON bytes or None if not cached.
+            The key is None when the value has no key or version, such values are not cached.
+        """
+        try:
+            key = self.entry_key(schema, value, kwargs)
+            version = None if self.version is None else repr(self.version.get(value))
+        except (AttributeError, KeyError):
+            return None, None, None
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return key, version, entry[1]
+        self.misses += 1
+        return key, version, None
+
+    def dumps(self, schema, value, kwargs):
+        """Serialize the value into JSON, returning the cached JSON if present."""
+        key, version, data = self.lookup(schema, value, kwargs)
+        if data is None:
+            data = schema._dumps(value, kwargs)
+            if key is not None:
+                self.backend.set(key, (version, data), self.ttl)
+        return data
+
+    def invalidate(self, schema, value, **kwargs):
+        """Remove the cached representation of the value, e.g. when it is changed or deleted.
+
+        :param schema: Schema class.
+        :param value: Value or anything that has the same key.
+        :param kwargs: Serialization context values of the `vary` arguments.
+        """
+        self.backend.delete(self.entry_key(schema, value, kwargs))
+
+    def clear(self):
+        """Remove all the cached representations."""
+        self.backend.clear()
@@ -0,0 +1,142 @@
+"""Persistent cache of the compiled code of the schemas for fast startup.
+
+.. code-block:: python
+
+    argo.codecache.enable("/var/cache/service/argo")
+
+    from service import schemas
+
+Schemas are compiled on their first use, and most of that time is spent compiling the generated serializer into
+bytecode. The cache keeps the bytecode on disk, so the processes started later (e.g. the workers of a service) load
+it instead of compiling the same source again.
+
+Entries are keyed by the hash of the generated source, which is derived from the structure of the schema, and of
+the Python bytecode version. When a definition changes its source changes as well, so stale entries are never
+loaded. Functions, nested schemas and other objects used by the code are still bound when the schema is compiled,
+only the compilation into bytecode is skipped.
+
+The cache has to be enabled before the schemas are used, either with `enable` or with the ``ARGO_CODE_CACHE``
+environment variable set to the cache directory.
+"""
+
+import glob
+import hashlib
+import marshal
+import os
+import tempfile
+
+try:
+    from importlib.util import MAGIC_NUMBER
+except ImportError:  # pragma: no cover
+    import imp
+
+    MAGIC_NUMBER = imp.get_magic()
+
+
+class CodeCache(object):
+
+    """Directory of the compiled code objects."""
+
+    def __init__(self, path):
+        """Code cache constructor.
+
+        :param path: Cache directory, created if it doesn't exist.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        try:
+            os.makedirs(path)
+        except OSError:
+            if not os.path.isdir(path):
+                raise
+
+    def key(self, source, filename):
+        """Key of the entry of the generated source."""
+        digest = hashlib.sha1(MAGIC_NUMBER)
+        digest.update(filename.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(source.encode("utf-8"))
+        return digest.hexdigest()
+
+    def compile(self, source, filename):
+        """Load the code of the source from the cache, compile and store it if it is missing.
+
+        :param source: Generated source of a module.
+        :param filename: Filename of the code shown in the tracebacks.
+        :return: Code object.
+        """
+        path = os.path.join(self.path, self.key(source, filename) + ".code")
+        try:
+            with open(path, "rb") as f:
+                code = marshal.loads(f.read())
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            # Missing or corrupted entry.
+            pass
+        else:
+            self.hits += 1
+            return code
+
+        self.misses += 1
+        code = compile(source, filename, "exec")
+        self._write(path, marshal.dumps(code))
+        return code
+
+    def _write(self, path, data):
+        """Write the entry atomically, so that the concurrent processes never read a partial entry."""
+        try:
+            fd, temp = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        except (IOError, OSError):
+            # Read-only cache, the code is only compiled.
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            getattr(os, "replace", os.rename)(temp, path)
+        except (IOError, OSError):
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all the entries."""
+        for path in glob.glob(os.path.join(self.path, "*.code")):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+_cache = None
+
+
+def enable(path):
+    """Cache the compiled code of the schemas defined from now on.
+
+    :param path: Cache directory.
+    :return: The `CodeCache`.
+    """
+    global _cache
+    _cache = CodeCache(path)
+    return _cache
+
+
+def disable():
+    """Stop caching the compiled code."""
+    global _cache
+    _cache = None
+
+
+def compile_code(source, filename):
+    """Compile the generated source using the cache if it is enabled.
+
+    :return: Code object.
+    """
+    if _cache is None:
+        return compile(source, filename, "exec")
+    return _cache.compile(source, filename)
+
+
+if os.environ.get("ARGO_CODE_CACHE"):
+    enable(os.environ["ARGO_CODE_CACHE"])
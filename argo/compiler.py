@@ -0,0 +1,927 @@
+"""Compilation of schemas into specialized serializer functions.
+
+Instead of walking the schema attributes and asking every attribute for its compartment, key, accessor and type
+on each call, the schema is compiled once into a flat Python function. All the lookups are resolved while the
+schema class is being built and only the work that depends on the serialized value is left for the runtime.
+"""
+
+import copy
+import functools
+import json
+import keyword
+import re
+
+from . import codecache
+from . import exceptions
+from . import lazy
+from . import schema
+from . import types
+
+_MISSING = object()
+
+# Original implementations, captured before anyone gets a chance to override or patch them. Attributes that
+# use exactly these implementations can be inlined, anything else is called as is.
+_ATTR_SERIALIZE = schema.Attr.serialize
+_ATTR_DESERIALIZE = schema.Attr.deserialize
+_ACCESSOR_GET = schema.Accessor.get
+_TYPE_SERIALIZE = types.Type.serialize
+_LIST_SERIALIZE = types.List.serialize
+_LIST_DESERIALIZE = types.List.deserialize
+_SCHEMA_SERIALIZE = schema._Schema.serialize.__func__
+_SCHEMA_DESERIALIZE = schema._Schema.deserialize.__func__
+_TYPE_DESERIALIZE = types.Type.deserialize
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _is_identifier(name):
+    """Check if the name can be used as a Python attribute in the generated code."""
+    return bool(_IDENTIFIER.match(name)) and not keyword.iskeyword(name)
+
+
+def _overrides(obj, name, original):
+    """Check if the object's class overrides the original implementation of a method."""
+    return getattr(type(obj), name, None) is not original
+
+
+def schema_type(attr_type):
+    """Return the attribute type if it is a schema that doesn't override the serialization, otherwise None."""
+    if not isinstance(attr_type, type) or not issubclass(attr_type, schema._Schema):
+        return None
+    if getattr(attr_type.serialize, "__func__", None) is not _SCHEMA_SERIALIZE:
+        return None
+    return attr_type
+
+
+def list_item_schema(attr_type):
+    """Return the item schema if the attribute type is a list of schemas, otherwise None.
+
+    Parallel lists are not inlined, they are serialized by their process pool.
+    """
+    if not isinstance(attr_type, types.List) or _overrides(attr_type, "serialize", _LIST_SERIALIZE):
+        return None
+    if attr_type.parallel is not None:
+        return None
+    return schema_type(attr_type.item_type)
+
+
+def _compiled_schema(attr_type):
+    """Return the schema if its compiled serializer can be called directly, otherwise None."""
+    if attr_type is None or attr_type.__serializer__ is None:
+        return None
+    return attr_type
+
+
+class Field(object):
+
+    """Single attribute of the schema with its compartment, key, accessor and type resolved."""
+
+    __slots__ = (
+        "attr", "name", "compartment", "key", "required", "has_default", "default", "attr_type", "is_type", "generic",
+        "accessor", "source", "deserializable", "lazy", "generic_deserialize", "static", "rendered",
+    )
+
+    def __init__(self, attr, source=None):
+        """Resolve the attribute.
+
+        :param attr: Schema attribute.
+        :param source: Shape of the serialized values declared by the schema.
+        """
+        self.attr = attr
+        self.name = attr.name
+        self.compartment = attr.compartment
+        self.key = attr.key
+        self.required = attr.required
+        self.has_default = hasattr(attr, "default")
+        self.default = getattr(attr, "default", None)
+        self.attr_type = attr.attr_type
+        self.is_type = types.Type.is_type(attr.attr_type)
+        self.generic = _overrides(attr, "serialize", _ATTR_SERIALIZE)
+        self.accessor = attr.accessor if self.is_type and not self.generic else None
+        self.source = getattr(self.accessor, "source", None) or source
+        self.deserializable = attr.deserializable
+        self.lazy = getattr(attr, "lazy", False)
+        self.generic_deserialize = _overrides(attr, "deserialize", _ATTR_DESERIALIZE)
+        self.static, self.rendered = self._render()
+
+    def _render(self):
+        """Serialize the attribute once if its value doesn't depend on the serialized value.
+
+        Attributes with the `Constant` accessor are static, as well as the attributes of the whole value
+        (e.g. links with constant href) serialized by the schemas that only have static attributes.
+
+        :return: Tuple of the static flag and the serialized value.
+        """
+        if self.accessor is None:
+            return False, None
+        if not isinstance(self.accessor, schema.Constant):
+            nested = _compiled_schema(schema_type(self.attr_type))
+            if self.accessor.getter is not schema.BYPASS or nested is None or not nested.__plan__.static:
+                return False, None
+        try:
+            return True, self.serialize(None, {})
+        except (AttributeError, KeyError):
+            return False, None
+
+    def get(self, value, kwargs):
+        """Get the attribute value from the serialized value.
+
+        :raises: AttributeError or KeyError when the value can't be accessed and there is no default.
+        """
+        try:
+            return self.accessor.get(value, **kwargs)
+        except (AttributeError, KeyError):
+            if not self.has_default:
+                raise
+            return self.default
+
+    def convert(self, value, kwargs):
+        """Convert the attribute value using the attribute type."""
+        serialize = self.attr_type.serialize
+        return serialize(value, **schema._get_context(serialize, kwargs))
+
+    def serialize(self, value, kwargs):
+        """Serialize the attribute of the serialized value the same way as `Attr.serialize` does.
+
+        :raises: AttributeError or KeyError when the attribute can't be serialized.
+            The schema skips the optional attributes in this case.
+        """
+        if self.generic:
+            return self.attr.serialize(value, **kwargs)
+        if not self.is_type:
+            return self.attr_type
+        return self.convert(self.get(value, kwargs), kwargs)
+
+    def deserialize(self, value, result, errors, fail_fast=False):
+        """Deserialize the attribute the same way as the schema does with `Attr.deserialize`.
+
+        :param value: Dict of already loaded json.
+        :param result: Dict to put the deserialized attribute value to.
+        :param errors: List to append the validation error to.
+        :param fail_fast: Nested schemas and lists stop at their first error.
+        """
+        try:
+            loaded = self.load(value, fail_fast)
+        except NotImplementedError:
+            pass
+        except exceptions.ValidationError as e:
+            e.attr = self.name
+            errors.append(e)
+        except KeyError:
+            self.missing(errors)
+        else:
+            if loaded is _MISSING:
+                self.missing(errors)
+            else:
+                result[self.name] = loaded
+
+    def load(self, value, fail_fast=False):
+        """Get the attribute value from the loaded json and deserialize it.
+
+        Keys are looked up with `dict.get` instead of raising and catching KeyError.
+
+        :param fail_fast: Nested schemas and lists stop at their first error.
+        :return: Deserialized attribute value or `_MISSING` if the attribute is missing.
+        """
+        if self.generic_deserialize or not isinstance(value, dict):
+            if fail_fast:
+                return self.attr.deserialize(value, fail_fast=True)
+            return self.attr.deserialize(value)
+
+        compartment = value
+        if self.compartment is not None:
+            compartment = value.get(self.compartment, _MISSING)
+            if compartment is _MISSING:
+                return _MISSING
+            if not isinstance(compartment, dict):
+                if fail_fast:
+                    return self.attr.deserialize(value, fail_fast=True)
+                return self.attr.deserialize(value)
+
+        raw = compartment.get(self.key, _MISSING)
+        if raw is _MISSING:
+            if not self.has_default:
+                return _MISSING
+            raw = self.default
+        return self.attr.deserialize_value(raw, fail_fast)
+
+    def missing(self, errors):
+        """Report the missing attribute if it is required."""
+        if self.required:
+            e = exceptions.ValidationError("Missing attribute.", self.name)
+            e.attr = self.name
+            errors.append(e)
+
+    @property
+    def bypass(self):
+        """Type serialization doesn't change the value."""
+        return not _overrides(self.attr_type, "serialize", _TYPE_SERIALIZE)
+
+    @property
+    def path(self):
+        """Attribute path of the accessor getter if it can be inlined, otherwise None."""
+        if _overrides(self.accessor, "get", _ACCESSOR_GET):
+            return None
+        if callable(self.accessor.getter):
+            return None
+        return self.accessor.path
+
+
+class Plan(object):
+
+    """Resolved attributes of the schema grouped by their compartments."""
+
+    def __init__(self, schema):
+        """Build the plan of a schema.
+
+        :param schema: Schema class.
+        """
+        self.schema = schema
+        self.fields = [Field(attr, schema.__source__) for attr in schema.__attrs__]
+        self.readable = [field for field in self.fields if field.deserializable]
+        self.static = all(field.static or not (field.is_type or field.generic) for field in self.fields)
+        self._batched = None
+        self._memoized = None
+        self._lazy = None
+
+    @property
+    def batched(self):
+        """Serialization loads related objects in batches, see `argo.loader.Batch`."""
+        if self._batched is None:
+            from . import loader
+
+            self._batched = loader.batched(self)
+        return self._batched
+
+    @property
+    def memoized(self):
+        """Serialization reuses the serialized values of the schemas with `__memoize__`."""
+        if self._memoized is None:
+            from . import loader
+
+            self._memoized = loader.memoized(self)
+        return self._memoized
+
+    @property
+    def lazy(self):
+        """Serialization can return lazy values, including the values of nested schemas."""
+        if self._lazy is None:
+            nested = (schema_type(field.attr_type) or list_item_schema(field.attr_type) for field in self.fields)
+            self._lazy = (
+                any(field.lazy and not field.static for field in self.fields)
+                or any(item.__plan__.lazy for item in nested if item is not None)
+            )
+        return self._lazy
+
+    @property
+    def scoped(self):
+        """Serialization has to run within a `argo.loader.session`."""
+        return self.batched or self.memoized
+
+    def deserialize(self, value, output=None, fail_fast=False):
+        """Deserialize the loaded JSON the same way as `Schema.deserialize`.
+
+        Only the attributes that support deserialization are read, each compartment is looked up
+        without raising exceptions for the missing keys. Compiled schemas use the compiled deserializer.
+
+        :param value: Dict of already loaded json.
+        :param output: If present, the output object will be updated instead of returning the deserialized data.
+        :param fail_fast: Stop at the first error.
+        :return: Dict of deserialized value for attributes.
+        """
+        deserialize = deserializer(self.schema)
+        if deserialize is not None:
+            result = deserialize(value, fail_fast)
+        else:
+            result = self.load(value, fail_fast)
+
+        if output is None:
+            return result
+        for field in self.readable:
+            if field.name in result:
+                field.attr.accessor.set(output, result[field.name])
+
+    def load(self, value, fail_fast=False):
+        """Deserialize the loaded JSON field by field.
+
+        :param fail_fast: Stop at the first error of the fields.
+        :return: Dict of deserialized value for attributes.
+        :raises: ValidationError.
+        """
+        errors = []
+        result = {}
+        for field in self.readable:
+            field.deserialize(value, result, errors, fail_fast)
+            if fail_fast and errors:
+                break
+
+        if errors:
+            raise exceptions.ValidationError(errors)
+        return result
+
+    @property
+    def layout(self):
+        """Fields in the output order.
+
+        Compartments are placed where their first attribute is met, the same way the dict would be built
+        attribute by attribute.
+
+        :return: List of (compartment, fields) tuples. Compartment is None for the root level fields.
+        """
+        layout = []
+        compartments = {}
+        for field in self.fields:
+            if field.compartment is None:
+                layout.append((None, [field]))
+            elif field.compartment in compartments:
+                compartments[field.compartment].append(field)
+            else:
+                compartments[field.compartment] = [field]
+                layout.append((field.compartment, compartments[field.compartment]))
+        return layout
+
+
+class Writer(object):
+
+    """Source code writer of the generated functions."""
+
+    def __init__(self):
+        self.lines = []
+        self.setup = []
+        self.namespace = {}
+        self.indent = 0
+        self.locals = 0
+        self.contexts = {}
+
+    def bind(self, obj, prefix):
+        """Make an object available to the generated code under a unique name."""
+        name = "{0}{1}".format(prefix, len(self.namespace))
+        self.namespace[name] = obj
+        return name
+
+    def local(self, prefix):
+        """Unique name of a local variable."""
+        self.locals += 1
+        return "{0}{1}".format(prefix, self.locals)
+
+    def literal(self, value):
+        """Source representation of a dict key."""
+        if isinstance(value, schema.string_types):
+            return repr(value)
+        return self.bind(value, "_k")
+
+    def call(self, func, arg, prefix):
+        """Expression calling the function with the context keyword arguments it accepts.
+
+        The context plan of the function is resolved at the compile time and the selection of the context
+        is done once per call of the generated function.
+        """
+        name = self.bind(func, prefix)
+        try:
+            plan = schema._get_context_plan(func)
+        except TypeError:
+            # Signature can't be inspected, let it fail at runtime the way the interpreted serialization does.
+            return "{0}({1}, **_get_context({0}, kwargs))".format(name, arg)
+
+        if plan is None:
+            return "{0}({1}, **kwargs)".format(name, arg)
+        if plan not in self.contexts:
+            self.contexts[plan] = self.local("x")
+            self.setup.append("{0} = _select_context({1!r}, kwargs)".format(self.contexts[plan], plan))
+        return "{0}({1}, **{2})".format(name, arg, self.contexts[plan])
+
+    def line(self, line):
+        self.lines.append("    " * self.indent + line)
+
+    def block(self, line):
+        self.line(line)
+        self.indent += 1
+
+    def end(self):
+        self.indent -= 1
+
+
+def _write_get(w, field):
+    """Write the code getting the attribute value into `v`."""
+    path = field.path
+    if path is None:
+        if _overrides(field.accessor, "get", _ACCESSOR_GET):
+            accessor = w.bind(field.accessor, "_a")
+            w.line("v = {0}.get(value, **kwargs)".format(accessor))
+        else:
+            w.line("v = {0}".format(w.call(field.accessor.getter, "value", "_g")))
+        return
+    write_path(w, path, field.source)
+
+
+def write_path(w, path, source):
+    """Write the code getting the value at the attribute path into `v` the same way as `schema.Accessor` does.
+
+    :param path: Tuple of the path components.
+    :param source: `dict`, `object` or None if the shape of the value is unknown.
+    """
+    obj = "value"
+    for attr in path:
+        get_item = "{0}[{1!r}]".format(obj, attr)
+        if _is_identifier(attr):
+            get_attr = "{0}.{1}".format(obj, attr)
+        else:
+            get_attr = "getattr({0}, {1!r})".format(obj, attr)
+
+        if source is dict:
+            obj = get_item
+        elif source is object:
+            obj = get_attr
+        else:
+            w.line("v = {0} if isinstance({1}, dict) else {2}".format(get_item, obj, get_attr))
+            obj = "v"
+
+    if obj != "v":
+        w.line("v = {0}".format(obj))
+    w.line("if callable(v):")
+    w.line("    v = v()")
+
+
+def _write_field(w, field, emit):
+    """Write the code serializing a single field.
+
+    :param emit: Function of (kind, expr) that writes the code storing the serialized value. Kind is "schema" or
+        "list" when the expr is the name of a compiled schema that has to be called for the attribute value `v`
+        or for each of its items, otherwise expr is the serialized value itself.
+    """
+    if field.generic:
+        # Optional attributes are skipped when they can't be accessed or converted.
+        if not field.required:
+            w.block("try:")
+        emit("value", "{0}.serialize(value, **kwargs)".format(w.bind(field.attr, "_attr")))
+        if not field.required:
+            w.end()
+            w.line("except (AttributeError, KeyError):")
+            w.line("    pass")
+        return
+
+    if not field.is_type:
+        emit("value", w.bind(field.attr_type, "_c"))
+        return
+
+    if field.static:
+        emit("static", w.bind(field.rendered, "_r"))
+        return
+
+    if not field.required:
+        w.block("try:")
+
+    if field.has_default:
+        w.block("try:")
+        _write_get(w, field)
+        w.end()
+        w.line("except (AttributeError, KeyError):")
+        w.line("    v = {0}".format(w.bind(field.default, "_d")))
+    else:
+        _write_get(w, field)
+
+    from . import uritemplate
+
+    nested = _compiled_schema(schema_type(field.attr_type))
+    items = _compiled_schema(list_item_schema(field.attr_type))
+
+    if field.bypass:
+        emit("value", "v")
+    elif nested is not None:
+        emit("schema", w.bind(nested, "_s"))
+    elif items is not None:
+        emit("list", w.bind(items, "_s"))
+    elif type(field.attr_type) is uritemplate.URITemplate:
+        # URI templates are compiled into formatters of their own.
+        emit("value", "{0}(v)".format(w.bind(field.attr_type.format, "_u")))
+    else:
+        emit("value", w.call(field.attr_type.serialize, "v", "_t"))
+
+    if not field.required:
+        w.end()
+        w.line("except (AttributeError, KeyError):")
+        w.line("    pass")
+
+
+_SCALAR_TYPES = (type(None), bool, int) + schema.string_types
+
+
+def _literal_source(value):
+    """Source code of the literal that builds a copy of the JSON-like value, None if there is no such literal."""
+    if type(value) in _SCALAR_TYPES:
+        return repr(value)
+    if type(value) is float:
+        return repr(value) if value - value == 0 else None
+    if type(value) in (list, tuple):
+        items = [_literal_source(item) for item in value]
+        if None in items:
+            return None
+        if type(value) is tuple:
+            return "({0})".format("".join(item + ", " for item in items))
+        return "[{0}]".format(", ".join(items))
+    if type(value) is dict:
+        items = [(_literal_source(key), _literal_source(item)) for key, item in value.items()]
+        if any(None in item for item in items):
+            return None
+        return "{{{0}}}".format(", ".join("{0}: {1}".format(*item) for item in items))
+    return None
+
+
+def _write_store(w, field, target):
+    """Write the code serializing a single field into the target dict."""
+    key = w.literal(field.key)
+    if field.lazy and not field.static:
+        w.line("{0}.lazy({1}, partial({2}.serialize, value, kwargs), {3!r})".format(
+            target, key, w.bind(field, "_f"), field.required))
+        return
+
+    def emit(kind, expr):
+        if kind == "schema":
+            expr = "{0}.__serializer__(v, kwargs)".format(expr)
+        elif kind == "list":
+            expr = "{0}.__many_serializer__(v, kwargs)".format(expr)
+        elif kind == "static":
+            # Literals build a fresh copy of the pre-rendered value, other values are deep copied.
+            expr = _literal_source(field.rendered) or "{0}({1})".format(w.bind(copy.deepcopy, "_deepcopy"), expr)
+        w.line("{0}[{1}] = {2}".format(target, key, expr))
+
+    _write_field(w, field, emit)
+
+
+_SERIALIZER = """\
+def serialize(value, kwargs):
+{setup}
+{body}
+    return result
+
+
+def serialize_many(values, kwargs):
+{setup}
+    results = []
+    append = results.append
+    for value in values:
+{body_many}
+        append(result)
+    return results
+"""
+
+
+def indent(lines, level):
+    """Join the source lines indented by the level."""
+    return "\n".join("    " * level + line for line in lines)
+
+
+def compile_serializer(plan):
+    """Generate the serializer functions of the schema plan.
+
+    The context selection and all the other setup is done once per call, so serializing many values
+    at once amortizes it across all the values.
+
+    :param plan: `Plan` of the schema.
+    :return: Tuple of the `serialize(value, kwargs)` and `serialize_many(values, kwargs)` functions that
+        return the same result as the interpreted serialization of a value or each of the values.
+    """
+    w = Writer()
+    w.namespace["_get_context"] = schema._get_context
+    w.namespace["_select_context"] = schema._select_context
+    w.namespace["partial"] = functools.partial
+    w.namespace["LazyDict"] = lazy.LazyDict
+    layout = plan.layout
+
+    def new_dict(fields):
+        # Only the dicts that have lazy values are lazy.
+        return "LazyDict()" if any(field.lazy for field in fields) else "{}"
+
+    w.line("result = {0}".format(new_dict(dict(layout).get(None, ()))))
+    for compartment, fields in layout:
+        target = "result"
+        if compartment is not None:
+            target = w.local("c")
+            w.line("{0} = result[{1}] = {2}".format(target, w.literal(compartment), new_dict(fields)))
+        for field in fields:
+            w.line("# {0!r}".format(field.name))
+            _write_store(w, field, target)
+
+    source = _SERIALIZER.format(
+        setup=indent(w.setup, 1),
+        body=indent(w.lines, 1),
+        body_many=indent(w.lines, 2),
+    )
+    filename = "<argo serializer {0}>".format(plan.schema.__name__)
+    exec(codecache.compile_code(source, filename), w.namespace)
+
+    serialize = w.namespace["serialize"]
+    serialize_many = w.namespace["serialize_many"]
+    serialize.__source__ = serialize_many.__source__ = source
+    return serialize, serialize_many
+
+
+def encoded_key(key):
+    """JSON of a dict key including the conversion of the non-string keys, followed by the colon."""
+    return json.dumps({key: None})[1:-len("null}")]
+
+
+class _Separator(object):
+
+    """Tracks if the JSON object being written has any members, to put the separators between them.
+
+    It is known at the compile time unless there are optional attributes, then it is tracked at runtime.
+    """
+
+    EMPTY, NONEMPTY, UNKNOWN = range(3)
+
+    def __init__(self, w):
+        self.w = w
+        self.state = self.EMPTY
+        self.name = None
+
+    def prefix(self, member):
+        """Expression of the member JSON preceded by the separator.
+
+        :param member: Encoded JSON text that starts the member.
+        """
+        if self.state == self.EMPTY:
+            return repr(member)
+        if self.state == self.NONEMPTY:
+            return repr(", " + member)
+        return "{0} + {1!r}".format(self.name, member)
+
+    def before(self, always):
+        """Write the code before the member is written."""
+        if not always and self.state == self.EMPTY:
+            self.name = self.w.local("sep")
+            self.w.line("{0} = ''".format(self.name))
+
+    def after(self, always):
+        """Write the code after the member is successfully written."""
+        if always:
+            self.state = self.NONEMPTY
+        elif self.state != self.NONEMPTY:
+            self.w.line("{0} = ', '".format(self.name))
+            self.state = self.UNKNOWN
+
+
+def _write_encode(w, field, separator):
+    """Write the code encoding a single field into the JSON string `s`."""
+    # Only the required attributes and constants are guaranteed to be written.
+    always = field.required or field.static or not (field.is_type or field.generic)
+    separator.before(always)
+    prefix = separator.prefix(encoded_key(field.key))
+
+    def emit(kind, expr):
+        if kind in ("schema", "list"):
+            # Nested encoders are called directly, so they have to be compiled first.
+            encoder(w.namespace[expr], w.namespace["_encode_value"])
+        if kind == "schema":
+            expr = "{0}.__encoder__(v, kwargs)".format(expr)
+        elif kind == "list":
+            expr = "'[' + ', '.join({0}.__many_encoder__(v, kwargs)) + ']'".format(expr)
+        elif kind == "static":
+            expr = repr(w.namespace["_encode_value"](field.rendered))
+        else:
+            expr = "_encode_value({0})".format(expr)
+        w.line("s += {0} + {1}".format(prefix, expr))
+        separator.after(always)
+
+    _write_field(w, field, emit)
+
+
+_ENCODER = """\
+def encode(value, kwargs):
+{setup}
+{body}
+    return s
+
+
+def encode_many(values, kwargs):
+{setup}
+    results = []
+    append = results.append
+    for value in values:
+{body_many}
+        append(s)
+    return results
+"""
+
+
+def compile_encoder(plan, encode_value):
+    """Generate the JSON encoder functions of the schema plan.
+
+    The JSON is written directly from the attribute values, without building the serialized dict first.
+    The keys are encoded at the compile time.
+
+    :param plan: `Plan` of the schema.
+    :param encode_value: Function that encodes a serialized value into JSON.
+    :return: Tuple of the `encode(value, kwargs)` and `encode_many(values, kwargs)` functions that return
+        the JSON string of the value or the list of JSON strings of the values.
+    """
+    w = Writer()
+    w.namespace["_get_context"] = schema._get_context
+    w.namespace["_select_context"] = schema._select_context
+    w.namespace["_encode_value"] = encode_value
+    w.line("s = '{'")
+    root = _Separator(w)
+    for compartment, fields in plan.layout:
+        if compartment is not None:
+            w.line("s += {0}".format(root.prefix(encoded_key(compartment) + "{")))
+            separator = _Separator(w)
+        else:
+            separator = root
+        for field in fields:
+            w.line("# {0!r}".format(field.name))
+            _write_encode(w, field, separator)
+        if compartment is not None:
+            w.line("s += '}'")
+            root.after(True)
+    w.line("s += '}'")
+
+    source = _ENCODER.format(
+        setup=indent(w.setup, 1),
+        body=indent(w.lines, 1),
+        body_many=indent(w.lines, 2),
+    )
+    filename = "<argo encoder {0}>".format(plan.schema.__name__)
+    exec(codecache.compile_code(source, filename), w.namespace)
+
+    encode = w.namespace["encode"]
+    encode_many = w.namespace["encode_many"]
+    encode.__source__ = encode_many.__source__ = source
+    return encode, encode_many
+
+
+def encoder(schema, encode_value):
+    """Get the compiled JSON encoder of the schema, compiling it on the first use.
+
+    :param schema: Schema class.
+    :param encode_value: Function that encodes a serialized value into JSON.
+    :return: Encoder function or None if the schema is not compiled.
+    """
+    if schema.__serializer__ is None:
+        return None
+    if schema.__encoder__ is None:
+        encode, encode_many = compile_encoder(schema.__plan__, encode_value)
+        if schema.__memoize__:
+            from . import loader
+
+            encode = loader.memoize(schema, encode, "encoded")
+            encode_many = loader.memoize_many(encode)
+        schema.__encoder__ = staticmethod(encode)
+        schema.__many_encoder__ = staticmethod(encode_many)
+    return schema.__encoder__
+
+
+_DESERIALIZER = """\
+def deserialize(value, fail_fast=False):
+    if not isinstance(value, dict):
+        return _load(value, fail_fast)
+{compartments}    result = {{}}
+    errors = []
+{body}
+    if errors:
+        raise ValidationError(errors)
+    return result
+"""
+
+
+def _write_missing(w, field):
+    """Write the code reporting the missing attribute."""
+    if field.required:
+        w.line("errors.append(ValidationError('Missing attribute.', {0}))".format(w.literal(field.name)))
+        _write_fail_fast(w)
+    else:
+        w.line("pass")
+
+
+def _write_fail_fast(w):
+    """Write the code raising the first error in the fail fast mode."""
+    w.line("if fail_fast:")
+    w.line("    raise ValidationError(errors)")
+
+
+def _write_load(w, field, compartment):
+    """Write the code deserializing a single field from the compartment dict into the result.
+
+    :param compartment: Name of the local variable of the compartment dict.
+    """
+    name = w.literal(field.name)
+    if field.generic_deserialize or not field.is_type:
+        w.line("{0}.deserialize(value, result, errors)".format(w.bind(field, "_f")))
+        w.line("if fail_fast and errors:")
+        w.line("    raise ValidationError(errors)")
+        return
+
+    if not field.has_default:
+        missing = "_MISSING"
+    elif compartment == "value":
+        missing = w.bind(field.default, "_d")
+    else:
+        # The default is not used when the whole compartment is missing.
+        missing = "_MISSING if {0} is _EMPTY else {1}".format(compartment, w.bind(field.default, "_d"))
+    w.line("raw = {0}.get({1}, {2})".format(compartment, w.literal(field.key), missing))
+    checked = missing != "_MISSING" and compartment == "value"
+    if not checked and field.required:
+        w.block("if raw is _MISSING:")
+        _write_missing(w, field)
+        w.end()
+        w.block("else:")
+    elif not checked:
+        w.block("if raw is not _MISSING:")
+
+    attr_type = field.attr_type
+    nested = schema_type(attr_type)
+    if nested is not None and getattr(nested.deserialize, "__func__", None) is _SCHEMA_DESERIALIZE \
+            and deserializer(nested) is not None:
+        expr = "{0}.__deserializer__(raw, fail_fast)".format(w.bind(nested, "_s"))
+        validators = []
+    elif nested is not None and getattr(nested.deserialize, "__func__", None) is _SCHEMA_DESERIALIZE:
+        # Interpreted nested schema.
+        expr = "{0}(raw, mode={1!r} if fail_fast else {2!r})".format(
+            w.bind(nested.deserialize, "_t"), schema.FAIL_FAST, schema.COLLECT)
+        validators = []
+    elif isinstance(attr_type, types.List) and not _overrides(attr_type, "deserialize", _LIST_DESERIALIZE):
+        expr = "{0}(raw, fail_fast)".format(w.bind(attr_type.deserialize, "_t"))
+        validators = []
+    elif isinstance(attr_type, types.Type) and not _overrides(attr_type, "deserialize", _TYPE_DESERIALIZE):
+        expr = "raw"
+        validators = attr_type.validators
+    else:
+        expr = "{0}(raw)".format(w.bind(attr_type.deserialize, "_t"))
+        validators = []
+
+    if expr == "raw" and not validators:
+        w.line("result[{0}] = raw".format(name))
+    else:
+        w.block("try:")
+        for validator in validators:
+            w.line("{0}.validate(raw)".format(w.bind(validator, "_v")))
+        w.line("result[{0}] = {1}".format(name, expr))
+        w.end()
+        w.line("except NotImplementedError:")
+        w.line("    pass")
+        w.block("except ValidationError as e:")
+        w.line("e.attr = {0}".format(name))
+        w.line("errors.append(e)")
+        _write_fail_fast(w)
+        w.end()
+        w.block("except KeyError:")
+        _write_missing(w, field)
+        w.end()
+
+    if not checked:
+        w.end()
+
+
+def compile_deserializer(plan):
+    """Generate the deserializer function of the schema plan.
+
+    Links are excluded, the compartments are looked up once, the missing keys are detected with `dict.get`
+    and the defaults are resolved at the compile time, so no exceptions are raised for the missing or not
+    deserializable attributes. Values that aren't dicts (or have compartments that aren't dicts) are
+    deserialized field by field.
+
+    :param plan: `Plan` of the schema.
+    :return: `deserialize(value)` function that returns the same result and raises the same errors as
+        `Schema.deserialize`.
+    """
+    w = Writer()
+    w.namespace["ValidationError"] = exceptions.ValidationError
+    w.namespace["_MISSING"] = _MISSING
+    w.namespace["_EMPTY"] = {}
+    w.namespace["_load"] = plan.load
+
+    compartments = {}
+    lookups = []
+    for field in plan.readable:
+        if field.compartment is not None and field.compartment not in compartments:
+            local = compartments[field.compartment] = w.local("c")
+            lookups.append("{0} = value.get({1}, _EMPTY)".format(local, w.literal(field.compartment)))
+            lookups.append("if not isinstance({0}, dict):".format(local))
+            lookups.append("    return _load(value, fail_fast)")
+
+    for field in plan.readable:
+        w.line("# {0!r}".format(field.name))
+        _write_load(w, field, compartments.get(field.compartment, "value"))
+
+    source = _DESERIALIZER.format(
+        compartments=indent(lookups, 1) + "\n" if lookups else "",
+        body=indent(w.lines, 1),
+    )
+    filename = "<argo deserializer {0}>".format(plan.schema.__name__)
+    exec(codecache.compile_code(source, filename), w.namespace)
+
+    deserialize = w.namespace["deserialize"]
+    deserialize.__source__ = source
+    return deserialize
+
+
+def deserializer(schema):
+    """Get the compiled deserializer of the schema, compiling it on the first use.
+
+    :param schema: Schema class.
+    :return: Deserializer function or None if the schema is not compiled.
+    """
+    if not schema.__compiled__:
+        return None
+    if schema.__deserializer__ is None:
+        schema.__deserializer__ = staticmethod(compile_deserializer(schema.__plan__))
+    return schema.__deserializer__
@@ -1,6 +1,44 @@
 """Argo exceptions."""
 
 
+class Message(object):
+
+    """Error message that is formatted only when it is converted to a string.
+
+    Validators raise the messages, `ValidationError.errors` formats them into strings when the errors are
+    read, so errors that are only caught and dropped are never formatted. Messages are equal to their
+    formatted strings.
+    """
+
+    __slots__ = ("template", "args")
+
+    def __init__(self, template, *args):
+        """Message constructor.
+
+        :param template: Message template in the `str.format` syntax.
+        :param args: Positional arguments of the template.
+        """
+        self.template = template
+        self.args = args
+
+    def __str__(self):
+        return self.template.format(*self.args)
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __eq__(self, other):
+        if isinstance(other, Message):
+            other = str(other)
+        return str(self) == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+
 class ValidationError(Exception):
 
     """Validation failed."""
@@ -8,9 +46,25 @@ class ValidationError(Exception):
     def __init__(self, errors, attr=None):
         self.attr = attr
         if isinstance(errors, list):
-            self.errors = errors
+            self._errors = errors
         else:
-            self.errors = [errors]
+            self._errors = [errors]
+
+    @property
+    def errors(self):
+        """List of the error message strings and of the nested `ValidationError`s.
+
+        Messages are formatted on the first access.
+        """
+        errors = self._errors
+        for index, error in enumerate(errors):
+            if type(error) is Message:
+                errors[index] = str(error)
+        return errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._errors = errors
 
     @staticmethod
     def dump(error):
@@ -18,8 +72,28 @@ class ValidationError(Exception):
             return error.to_dict()
         return error
 
+    @classmethod
+    def dump_all(cls, errors):
+        """List representation of the errors of an attribute.
+
+        Messages are formatted, the nested errors of the attributes or of the list items are grouped into one dict
+        by their attr.
+        """
+        nested = [error for error in errors if isinstance(error, ValidationError)]
+        result = [ValidationError(nested).to_dict()] if nested else []
+        result.extend(cls.dump(error) for error in errors if not isinstance(error, ValidationError))
+        return result
+
     def to_dict(self):
-        """Dictionary representation of the error."""
-        return {
-            "errors": dict((e.attr, [self.dump(error) for error in e.errors]) for e in self.errors),
-        }
+        """Dictionary representation of the error.
+
+        Errors of the nested schemas and of the list items are represented at any depth, the dicts are built and
+        the messages are formatted only when it is called.
+        """
+        errors = {}
+        for error in self.errors:
+            if isinstance(error, ValidationError):
+                errors.setdefault(error.attr, []).extend(self.dump_all(error.errors))
+            else:
+                errors.setdefault(None, []).append(self.dump(error))
+        return {"errors": errors}
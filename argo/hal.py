@@ -1,17 +1,63 @@
 """HAL related attributes."""
 
+import weakref
+
 from . import schema
 from . import types
+from . import uritemplate
+
+
+BYPASS = schema.BYPASS
+
+
+_link_schemas = weakref.WeakValueDictionary()
+"""Link schemas shared by the links, kept only while a link uses them."""
+
+
+def _link_schema(href_type, templated, type):
+    """Schema of the link object, shared by the links with the same href type, templated and type.
+
+    :param href_type: Type or constant of the href.
+    :param templated: Is the link templated, omitted if None.
+    :param type: Media type of the link, omitted if None.
+    """
+    # Constants that are equal but of different types (1 and True) are rendered differently.
+    key = (href_type, href_type.__class__, templated, templated.__class__, type)
+    try:
+        return _link_schemas[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable href constants get their own schema.
+        key = None
+
+    attrs = {
+        'templated': templated,
+        'type': type,
+    }
+
+    class LinkSchema(schema.Schema):
+        href = schema.Attr(attr_type=href_type, attr=BYPASS)
+
+        if attrs['templated'] is not None:
+            templated = schema.Attr(attr=schema.Constant(attrs['templated']))
 
+        if attrs['type'] is not None:
+            type = schema.Attr(attr=schema.Constant(attrs['type']))
 
-BYPASS = lambda value: value
+    if key is not None:
+        _link_schemas[key] = LinkSchema
+    return LinkSchema
 
 
 class Link(schema.Attr):
 
     """Link attribute of a schema."""
 
-    def __init__(self, attr_type=None, attr=None, key=None, required=True, curie=None, templated=None, type=None):
+    __slots__ = ("curie", "_key")
+
+    def __init__(self, attr_type=None, attr=None, key=None, required=True, curie=None, templated=None, type=None,
+                 lazy=False, template=None):
         """Link constructor.
 
         :param attr_type: Type, Schema or constant that does the type conversion of the attribute.
@@ -22,32 +68,34 @@ class Link(schema.Attr):
         :param templated: Is this link templated.
         :param type: Its value is a string used as a hint to indicate the media type expected when dereferencing
                            the target resource.
+        :param lazy: Serialize the link only when it is accessed or encoded.
+        :param template: URI template (RFC 6570, levels 1 to 3) of the href, expanded with the attributes of the
+            value (see `argo.uritemplate.URITemplate`). Templated links are emitted verbatim.
         """
+        if template is not None:
+            if templated:
+                attr_type = template
+            else:
+                attr_type = _link_schema(uritemplate.URITemplate(template), templated, type)
+                if attr is None:
+                    attr = BYPASS
+
         if not types.Type.is_type(attr_type):
 
             if attr_type is not None:
                 attr = BYPASS
 
-            attrs = {
-                'templated': templated,
-                'type': type,
-            }
-
-            class LinkSchema(schema.Schema):
-                href = schema.Attr(attr_type=attr_type, attr=BYPASS)
-
-                if attrs['templated'] is not None:
-                    templated = schema.Attr(attr=lambda value: templated)
-
-                if attrs['type'] is not None:
-                    type = schema.Attr(attr=lambda value: type)
-
-            attr_type = LinkSchema
+            attr_type = _link_schema(attr_type, templated, type)
 
-        super(Link, self).__init__(attr_type=attr_type, attr=attr, required=required)
+        super(Link, self).__init__(attr_type=attr_type, attr=attr, required=required, lazy=lazy)
         self.curie = curie
         self._key = key
 
+    @property
+    def deserializable(self):
+        """Only the links that override the deserialization are read, the others are skipped up front."""
+        return type(self).deserialize is not Link.deserialize
+
     @property
     def compartment(self):
         """Return the compartment in which Links are placed (_links)."""
@@ -63,7 +111,7 @@ class Link(schema.Attr):
             return self._key or self.name
         return ":".join((self.curie.name, self.name))
 
-    def deserialize(self, value):
+    def deserialize(self, value, fail_fast=False):
         """Link doesn't support deserialization."""
         raise NotImplementedError
 
@@ -72,15 +120,21 @@ class LinkList(Link):
 
     """List of links attribute of a schema."""
 
-    def __init__(self, attr_type=None, attr=None, required=True, curie=None):
+    __slots__ = ()
+
+    def __init__(self, attr_type=None, attr=None, required=True, curie=None, lazy=False, template=None):
         """LinkList constructor.
 
         :param attr_type: Type, Schema or constant that does item type conversion of the attribute.
         :param attr: Attribute name, dot-separated attribute path or an `Accessor` instance.
         :param required: Is this list of links required to be present.
         :param curie: Link namespace prefix (e.g. "<prefix>:<name>") or Curie object.
+        :param lazy: Serialize the links only when they are accessed or encoded.
+        :param template: URI template of the hrefs, expanded with the attributes of each item of the list.
         """
-        super(LinkList, self).__init__(attr_type=attr_type, attr=attr, required=required, curie=curie)
+        if template is not None:
+            attr_type = _link_schema(uritemplate.URITemplate(template), None, None)
+        super(LinkList, self).__init__(attr_type=attr_type, attr=attr, required=required, curie=curie, lazy=lazy)
         self.attr_type = types.List(self.attr_type)
 
 
@@ -88,6 +142,8 @@ class Curie(object):
 
     """Curie object."""
 
+    __slots__ = ("name", "href", "templated", "type")
+
     def __init__(self, name, href, templated=None, type=None):
         """Curie constructor.
 
@@ -110,14 +166,17 @@ class Embedded(schema.Attr):
 
     """Embedded attribute of schema."""
 
-    def __init__(self, attr_type=None, attr=None, curie=None):
+    __slots__ = ("curie", )
+
+    def __init__(self, attr_type=None, attr=None, curie=None, lazy=False):
         """Embedded constructor.
 
         :param attr_type: Type, Schema or constant that does the type conversion of the attribute.
         :param attr: Attribute name, dot-separated attribute path or an `Accessor` instance.
         :param curie: The curie used for this embedded attribute.
+        :param lazy: Serialize the embedded attribute only when it is accessed or encoded.
         """
-        super(Embedded, self).__init__(attr_type, attr)
+        super(Embedded, self).__init__(attr_type, attr, lazy=lazy)
         self.curie = curie
 
     @property
@@ -138,7 +197,7 @@ class _SchemaType(schema._SchemaType):
     """HAL schema implementation with CURIEs support."""
 
     def __init__(cls, name, bases, clsattrs):
-        super(_SchemaType, cls).__init__(cls, name, bases, clsattrs)
+        super(_SchemaType, cls).__init__(name, bases, clsattrs)
         curies = set([])
 
         # Collect CURIEs
@@ -157,7 +216,7 @@ class _SchemaType(schema._SchemaType):
                     templated=schema.Attr(required=False),
                     type=schema.Attr(required=False),
                 ),
-                attr=lambda value: list(curies),
+                attr=schema.Constant(list(curies)),
                 required=False,
             )
             link.name = "curies"
@@ -0,0 +1,164 @@
+"""Serialized dicts with lazily evaluated attributes."""
+
+
+class LazyDict(dict):
+
+    """Dict which lazy values are computed on the first access.
+
+    Lazy keys are present in the dict from the start. Their values are computed when they are accessed, or all at
+    once when the items or values are requested, e.g. by the JSON encoder. Optional attributes that turn out to be
+    missing are removed from the dict when they are computed, so the optional values are computed before the keys
+    are checked, counted or iterated.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(LazyDict, self).__init__(*args, **kwargs)
+        self.thunks = {}
+
+    def lazy(self, key, thunk, required=True):
+        """Set the lazy value.
+
+        :param key: Key of the value.
+        :param thunk: Function without arguments that computes the value.
+        :param required: If False, AttributeError or KeyError raised by the thunk removes the key.
+        """
+        self.thunks[key] = thunk, required
+        dict.__setitem__(self, key, None)
+
+    def resolve(self, key):
+        """Compute the lazy value of the key if it isn't computed yet."""
+        thunk, required = self.thunks.pop(key)
+        try:
+            value = thunk()
+        except (AttributeError, KeyError):
+            if required:
+                raise
+            dict.__delitem__(self, key)
+        else:
+            dict.__setitem__(self, key, value)
+
+    def resolve_all(self):
+        """Compute all the lazy values."""
+        for key in list(self.thunks):
+            self.resolve(key)
+
+    def resolve_optional(self):
+        """Compute the optional lazy values, which may remove their keys."""
+        for key, (_, required) in list(self.thunks.items()):
+            if not required:
+                self.resolve(key)
+
+    def __getitem__(self, key):
+        if key in self.thunks:
+            self.resolve(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        self.thunks.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.thunks.pop(key, None)
+        dict.__delitem__(self, key)
+
+    def __contains__(self, key):
+        if key in self.thunks and not self.thunks[key][1]:
+            self.resolve(key)
+        return dict.__contains__(self, key)
+
+    def __len__(self):
+        self.resolve_optional()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        # Overriding the iteration also makes dict(lazy) and {**lazy} use keys() and __getitem__.
+        self.resolve_optional()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.resolve_optional()
+        return dict.keys(self)
+
+    def __eq__(self, other):
+        self.resolve_all()
+        if isinstance(other, LazyDict):
+            other.resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        self.resolve_all()
+        return dict.__repr__(self)
+
+    def get(self, key, default=None):
+        if key in self.thunks:
+            self.resolve(key)
+        return dict.get(self, key, default)
+
+    def setdefault(self, key, default=None):
+        if key in self.thunks:
+            self.resolve(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key, *default):
+        if key in self.thunks:
+            self.resolve(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self.resolve_all()
+        return dict.popitem(self)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def items(self):
+        self.resolve_all()
+        return dict.items(self)
+
+    def values(self):
+        self.resolve_all()
+        return dict.values(self)
+
+    def copy(self):
+        self.resolve_all()
+        return dict(self)
+
+    def __reduce__(self):
+        return dict, (self.items(), )
+
+    # Python 2 dict API
+    def has_key(self, key):
+        return key in self
+
+    def iterkeys(self):
+        return iter(self)
+
+    def iteritems(self):
+        self.resolve_all()
+        return iter(dict.items(self))
+
+    def itervalues(self):
+        self.resolve_all()
+        return iter(dict.values(self))
+
+
+def resolve(value):
+    """Compute the lazy values of the serialized value and of the values nested in it.
+
+    Encoders that read the dicts directly, e.g. orjson, would otherwise see the placeholders of the lazy values.
+
+    :return: The value.
+    """
+    if isinstance(value, LazyDict):
+        value.resolve_all()
+    if isinstance(value, dict):
+        for item in dict.values(value):
+            resolve(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            resolve(item)
+    return value
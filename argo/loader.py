@@ -0,0 +1,266 @@
+"""Batched loading of the related objects and memoization of the serialized values."""
+
+import contextlib
+import threading
+
+try:
+    from collections.abc import Mapping
+except ImportError:  # pragma: no cover
+    from collections import Mapping
+
+from . import compiler
+from . import schema
+
+_local = threading.local()
+_MISSING = object()
+
+
+class Session(object):
+
+    """Memo of the loaded objects and of the serialized values.
+
+    Every key of a batch accessor is loaded once per session, so the same related object is shared by all the
+    values serialized within the session. Values of the schemas with `__memoize__` are serialized once per
+    session as well.
+    """
+
+    def __init__(self):
+        self.loaded = {}
+        self.memo = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """Share of the memoized serializations that were reused, 0 if there were none."""
+        total = self.hits + self.misses
+        return float(self.hits) / total if total else 0.0
+
+    def load(self, batch, keys):
+        """Load the keys that are not loaded yet with one call of the batch function.
+
+        :param batch: `Batch` accessor.
+        :param keys: Iterable of the keys.
+        """
+        loaded = self.loaded.setdefault(batch, {})
+        missing = []
+        for key in keys:
+            if key not in loaded:
+                loaded[key] = _MISSING
+                missing.append(key)
+        if missing:
+            try:
+                loaded.update(batch.load(missing))
+            except Exception:
+                # The keys are loaded again on the next use instead of being reported as missing.
+                for key in missing:
+                    loaded.pop(key, None)
+                raise
+
+    def get(self, batch, key):
+        """Get the loaded object, loading the key alone if it wasn't prefetched.
+
+        :raises: KeyError if the batch function didn't return the key.
+        """
+        loaded = self.loaded.get(batch)
+        if loaded is None or key not in loaded:
+            self.load(batch, [key])
+            loaded = self.loaded[batch]
+        value = loaded[key]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+
+def current():
+    """Session of the current thread, None if there is no session."""
+    return getattr(_local, "session", None)
+
+
+@contextlib.contextmanager
+def session():
+    """Scope of the loaded objects, e.g. a request.
+
+    Nested scopes share the outermost session.
+    """
+    outer = current()
+    if outer is not None:
+        yield outer
+        return
+
+    _local.session = Session()
+    try:
+        yield _local.session
+    finally:
+        _local.session = None
+
+
+class Batch(schema.Accessor):
+
+    """Accessor that loads the related objects of many values at once.
+
+    The getter returns the batch key of the serialized value (e.g. a foreign key), the load function gets a list
+    of keys and returns a dict of the loaded objects by the key. Keys missing in the dict are treated as missing
+    attributes.
+
+    .. code-block:: python
+
+        author = argo.Attr(Author, attr=Batch("author_id", lambda ids: {a.id: a for a in Author.query(ids)}))
+    """
+
+    __slots__ = ("load", )
+
+    def __init__(self, key, load, setter=None, source=None):
+        """Batch accessor constructor.
+
+        :param key: Function or dot-separated path to get the batch key of the value.
+        :param load: Function of a list of keys that returns a dict of the loaded objects by the key.
+        :param setter: Function or dot-separated path to set the attribute value.
+        :param source: Shape of the values: `dict`, `object` or None if unknown.
+        """
+        super(Batch, self).__init__(getter=key, setter=setter, source=source)
+        self.load = load
+
+    def key(self, obj, **kwargs):
+        """Get the batch key of the value."""
+        return super(Batch, self).get(obj, **kwargs)
+
+    def get(self, obj, **kwargs):
+        """Get the loaded object of the value."""
+        return (current() or Session()).get(self, self.key(obj, **kwargs))
+
+    def prefetch(self, values, kwargs, loader_session):
+        """Load the objects of all the values with one call of the load function."""
+        keys = []
+        for value in values:
+            try:
+                keys.append(self.key(value, **kwargs))
+            except (AttributeError, KeyError):
+                continue
+        loader_session.load(self, keys)
+
+
+def memoize(schema, func, kind):
+    """Wrap the compiled function of the schema to reuse its results within the session.
+
+    Memoized values are kept alive by the session, so their identity can't be reused by other values. Results are
+    only reused for the same serialization context, calls with unhashable context values are not memoized.
+
+    :param schema: Schema class with `__memoize__` set to True or to a key function.
+    :param func: Function of (value, kwargs), e.g. the compiled serializer.
+    :param kind: Kind of the result, e.g. "serialized" or "encoded".
+    :return: Memoized function of (value, kwargs).
+    """
+    key = schema.__memoize__
+    if not callable(key):
+        key = id
+
+    def memoized(value, kwargs):
+        loader_session = current()
+        if loader_session is None:
+            return func(value, kwargs)
+        try:
+            memo_key = (kind, schema, frozenset(kwargs.items()))
+            memo = loader_session.memo.get(memo_key)
+        except TypeError:
+            # Unhashable context values.
+            return func(value, kwargs)
+        if memo is None:
+            memo = loader_session.memo[memo_key] = {}
+        value_key = key(value)
+        try:
+            result = memo[value_key][1]
+        except KeyError:
+            loader_session.misses += 1
+            result = func(value, kwargs)
+            memo[value_key] = (value, result)
+        else:
+            loader_session.hits += 1
+        return result
+
+    return memoized
+
+
+def memoize_many(func):
+    """Function of (values, kwargs) calling the memoized function for each of the values."""
+    return lambda values, kwargs: [func(value, kwargs) for value in values]
+
+
+def _nested(plan):
+    for field in plan.fields:
+        nested = compiler.schema_type(field.attr_type) or compiler.list_item_schema(field.attr_type)
+        if nested is not None:
+            yield nested
+
+
+def batched(plan):
+    """Does serialization of the plan load anything in batches, including nested schemas."""
+    if any(isinstance(field.accessor, Batch) for field in plan.fields):
+        return True
+    return any(nested.__plan__.batched for nested in _nested(plan))
+
+
+def memoized(plan):
+    """Does serialization of the plan memoize anything, including nested schemas."""
+    if plan.schema.__memoize__ and plan.schema.__serializer__ is not None:
+        return True
+    return any(nested.__plan__.memoized for nested in _nested(plan))
+
+
+def prefetch(schema, values, kwargs, loader_session):
+    """Load the objects of the values and of their nested values level by level.
+
+    :param schema: Schema class.
+    :param values: List of the values to serialize.
+    :param kwargs: Serialization context.
+    :param loader_session: Session to load the objects into.
+    """
+    fields = schema.__plan__.fields
+    for field in fields:
+        if isinstance(field.accessor, Batch):
+            field.accessor.prefetch(values, kwargs, loader_session)
+
+    for field in fields:
+        nested = compiler.schema_type(field.attr_type)
+        items = compiler.list_item_schema(field.attr_type)
+        if nested is not None and nested.__plan__.batched:
+            prefetch(nested, list(_children(field, values, kwargs)), kwargs, loader_session)
+        elif items is not None and items.__plan__.batched:
+            children = []
+            for child in _children(field, values, kwargs):
+                if _batchable(child):
+                    children.extend(child)
+            prefetch(items, children, kwargs, loader_session)
+
+
+def _batchable(items):
+    """Can the items be walked before they are serialized.
+
+    Any collection can, except for strings and mappings. Iterators (e.g. generators) can't be walked twice,
+    their items are loaded one by one when they are serialized.
+    """
+    if isinstance(items, schema.string_types + (bytes, Mapping)):
+        return False
+    try:
+        return iter(items) is not items
+    except TypeError:
+        return False
+
+
+def _children(field, values, kwargs):
+    for value in values:
+        try:
+            yield field.get(value, kwargs)
+        except (AttributeError, KeyError):
+            continue
+
+
+def serialize_many(schema, values, kwargs):
+    """Serialize the values within a session, loading the related objects in batches first."""
+    with session() as loader_session:
+        values = list(values)
+        if schema.__plan__.batched:
+            prefetch(schema, values, kwargs, loader_session)
+        if schema.__many_serializer__ is not None:
+            return schema.__many_serializer__(values, kwargs)
+        return [schema.interpret(value, **kwargs) for value in values]
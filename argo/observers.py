@@ -0,0 +1,265 @@
+"""Observers of the schema operations, e.g. for metrics and tracing in production.
+
+.. code-block:: python
+
+    argo.observers.register(argo.observers.PrometheusObserver())
+
+Observers are notified about `Schema.serialize`, `serialize_many`, `dumps`, `deserialize` and `loads` calls
+with the schema, the duration, the size of the JSON payload (`dumps` and `loads`) and the error if the operation
+failed. Only the outermost operation is observed, schemas serialized or deserialized by other schemas are a part
+of it. When no observers are registered the schemas only check one global variable per call.
+"""
+
+import collections
+import contextlib
+import threading
+import timeit
+
+from . import exceptions
+from . import schema
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+try:
+    from opentelemetry import trace
+except ImportError:  # pragma: no cover
+    trace = None
+
+
+def failed_attrs(error):
+    """Get the dot-separated paths of the attributes that failed the validation.
+
+    :param error: `ValidationError` raised by the deserialization.
+    :return: List of the attribute paths, e.g. `author.name`.
+    """
+    paths = []
+
+    def walk(error, path):
+        nested = False
+        for child in error.errors:
+            if isinstance(child, exceptions.ValidationError):
+                nested = True
+                walk(child, path + [child.attr] if child.attr is not None else path)
+        if not nested and path:
+            paths.append(".".join(str(attr) for attr in path))
+
+    walk(error, [])
+    return paths
+
+
+class Observer(object):
+
+    """Base observer, all the notifications are ignored."""
+
+    def start(self, schema, operation):
+        """Operation is started.
+
+        :param schema: Schema class.
+        :param operation: Name of the schema method, e.g. `serialize`.
+        :return: State of the operation passed to `finish`, e.g. a span.
+        """
+
+    def finish(self, state, schema, operation, duration, size=None, error=None):
+        """Operation is finished.
+
+        :param state: The result of `start`.
+        :param schema: Schema class.
+        :param operation: Name of the schema method.
+        :param duration: Duration of the operation in seconds.
+        :param size: Size of the JSON payload of `dumps` and `loads`, None for other operations.
+        :param error: Exception raised by the operation, None if it succeeded.
+        """
+
+
+Event = collections.namedtuple("Event", ("schema", "operation", "duration", "size", "error"))
+
+
+class Collector(Observer):
+
+    """Observer that keeps the events in memory, e.g. for tests."""
+
+    def __init__(self):
+        self.events = []
+
+    def finish(self, state, schema, operation, duration, size=None, error=None):
+        self.events.append(Event(schema, operation, duration, size, error))
+
+    @property
+    def failures(self):
+        """Number of the validation failures by the schema name and the attribute path."""
+        failures = collections.Counter()
+        for event in self.events:
+            if isinstance(event.error, exceptions.ValidationError):
+                failures.update((event.schema.__name__, path) for path in failed_attrs(event.error))
+        return failures
+
+    def clear(self):
+        """Forget the collected events."""
+        del self.events[:]
+
+
+class PrometheusObserver(Observer):
+
+    """Observer that records Prometheus metrics.
+
+    * ``<prefix>_duration_seconds`` histogram of the duration by schema and operation,
+    * ``<prefix>_payload_bytes`` histogram of the JSON payload size by schema and operation,
+    * ``<prefix>_validation_failures_total`` counter of the failed attributes by schema and attribute path.
+
+    Metric objects with the `prometheus_client` interface (``labels(...).observe()``, ``labels(...).inc()``)
+    can be passed instead of creating them.
+    """
+
+    def __init__(self, prefix="argo", registry=None, duration=None, payload=None, failures=None):
+        """Prometheus observer constructor.
+
+        :param prefix: Prefix of the metric names.
+        :param registry: `prometheus_client` registry, the default registry if None.
+        :param duration: Histogram of the duration labeled by schema and operation.
+        :param payload: Histogram of the payload size labeled by schema and operation.
+        :param failures: Counter of the validation failures labeled by schema and attr.
+        """
+        if None in (duration, payload, failures):
+            if prometheus_client is None:
+                raise ImportError("prometheus_client is not installed.")
+            options = {} if registry is None else {"registry": registry}
+            if duration is None:
+                duration = prometheus_client.Histogram(
+                    prefix + "_duration_seconds", "Duration of the schema operations.",
+                    ["schema", "operation"], **options)
+            if payload is None:
+                payload = prometheus_client.Histogram(
+                    prefix + "_payload_bytes", "Size of the JSON payloads.", ["schema", "operation"],
+                    buckets=(2 ** 8, 2 ** 10, 2 ** 12, 2 ** 14, 2 ** 16, 2 ** 18, 2 ** 20, 2 ** 22, float("inf")),
+                    **options)
+            if failures is None:
+                failures = prometheus_client.Counter(
+                    prefix + "_validation_failures", "Attributes that failed the validation.",
+                    ["schema", "attr"], **options)
+        self.duration = duration
+        self.payload = payload
+        self.failures = failures
+
+    def finish(self, state, schema, operation, duration, size=None, error=None):
+        name = schema.__name__
+        self.duration.labels(name, operation).observe(duration)
+        if size is not None:
+            self.payload.labels(name, operation).observe(size)
+        if isinstance(error, exceptions.ValidationError):
+            for path in failed_attrs(error):
+                self.failures.labels(name, path).inc()
+
+
+class OpenTelemetryObserver(Observer):
+
+    """Observer that traces the operations as OpenTelemetry spans named ``argo.<operation>``.
+
+    Spans have the ``argo.schema`` attribute, ``argo.payload_bytes`` of `dumps` and `loads` and
+    ``argo.failed_attrs`` of the validation errors. The span is current during the operation, so the spans started
+    by the accessors and loaders are its children.
+    """
+
+    def __init__(self, tracer=None):
+        """OpenTelemetry observer constructor.
+
+        :param tracer: Tracer with the `opentelemetry.trace.Tracer` interface, the `argo` tracer if None.
+        """
+        if tracer is None:
+            if trace is None:
+                raise ImportError("opentelemetry-api is not installed.")
+            tracer = trace.get_tracer("argo")
+        self.tracer = tracer
+
+    def start(self, schema, operation):
+        span = self.tracer.start_span("argo." + operation, attributes={"argo.schema": schema.__name__})
+        if trace is None:
+            return span, None
+        current = trace.use_span(span, end_on_exit=False)
+        current.__enter__()
+        return span, current
+
+    def finish(self, state, schema, operation, duration, size=None, error=None):
+        span, current = state
+        if current is not None:
+            current.__exit__(None, None, None)
+        if size is not None:
+            span.set_attribute("argo.payload_bytes", size)
+        if error is not None:
+            span.record_exception(error)
+            if isinstance(error, exceptions.ValidationError):
+                span.set_attribute("argo.failed_attrs", failed_attrs(error))
+            if trace is not None:
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(error)))
+        span.end()
+
+
+class _Dispatcher(object):
+
+    """Notifies the registered observers about the outermost operations of the thread."""
+
+    def __init__(self, observers):
+        self.observers = observers
+        self.local = threading.local()
+
+    @property
+    def busy(self):
+        """An operation of the current thread is already observed."""
+        return getattr(self.local, "busy", False)
+
+    def observe(self, schema_cls, operation, func, *args, **kwargs):
+        """Call the schema method notifying the observers.
+
+        :param schema_cls: Schema class.
+        :param operation: Name of the schema method.
+        :param func: The schema method, called again while the dispatcher is busy.
+        :return: Result of the method.
+        """
+        states = [observer.start(schema_cls, operation) for observer in self.observers]
+        size = len(args[0]) if operation == "loads" else None
+        error = None
+        self.local.busy = True
+        start = timeit.default_timer()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            duration = timeit.default_timer() - start
+            self.local.busy = False
+            if error is None and operation == "dumps":
+                size = len(result)
+            for observer, state in zip(self.observers, states):
+                observer.finish(state, schema_cls, operation, duration, size, error)
+        return result
+
+
+_observers = []
+
+
+def register(observer):
+    """Notify the observer about the schema operations."""
+    _observers.append(observer)
+    schema._observer = _Dispatcher(tuple(_observers))
+
+
+def unregister(observer):
+    """Stop notifying the observer."""
+    _observers.remove(observer)
+    schema._observer = _Dispatcher(tuple(_observers)) if _observers else None
+
+
+@contextlib.contextmanager
+def observe(observer):
+    """Register the observer within the block.
+
+    :return: Context manager of the observer.
+    """
+    register(observer)
+    try:
+        yield observer
+    finally:
+        unregister(observer)
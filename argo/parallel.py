@@ -0,0 +1,93 @@
+"""Parallel serialization of large lists in worker processes."""
+
+import multiprocessing
+import pickle
+
+_in_worker = False
+
+
+def _init_worker():
+    """Mark the process as a worker, parallel lists are serialized serially inside workers."""
+    global _in_worker
+    _in_worker = True
+
+
+def _serialize_chunk(args):
+    """Serialize the chunk of values in the worker process."""
+    schema, values, kwargs = args
+    return schema.serialize_many(values, **kwargs)
+
+
+def _picklable(obj):
+    try:
+        pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+class ProcessPool(object):
+
+    """Pool of worker processes that serializes large lists of schemas in chunks.
+
+    Schemas are shipped to the workers by reference (module and class name), so they have to be defined at the
+    module level. The chunks of values and the serialization context are pickled. Results are reassembled in
+    the order of the values.
+    """
+
+    def __init__(self, workers=None, chunksize=1000, threshold=10000):
+        """Process pool constructor.
+
+        :param workers: Number of worker processes, the number of CPUs by default.
+        :param chunksize: Number of values serialized by a worker at once.
+        :param threshold: Lists shorter than this are serialized in the current process.
+        """
+        self.workers = workers or multiprocessing.cpu_count()
+        self.chunksize = chunksize
+        self.threshold = threshold
+        self._pool = None
+
+    @property
+    def pool(self):
+        """Worker processes, started on the first parallel serialization."""
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(self.workers, initializer=_init_worker)
+        return self._pool
+
+    def serialize_many(self, schema, values, **kwargs):
+        """Serialize the values with the schema.
+
+        Falls back to the serialization in the current process when the list is short, when called from a
+        worker process, or when the schema or the context can't be pickled.
+
+        :param schema: Schema class.
+        :param values: Iterable of dicts or objects to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: List of serialized values.
+        """
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+        if _in_worker or len(values) < self.threshold or not _picklable((schema, kwargs)):
+            return schema.serialize_many(values, **kwargs)
+
+        chunks = [
+            (schema, values[start:start + self.chunksize], kwargs)
+            for start in range(0, len(values), self.chunksize)
+        ]
+        result = []
+        for serialized in self.pool.imap(_serialize_chunk, chunks):
+            result.extend(serialized)
+        return result
+
+    def close(self):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,247 @@
+"""Profiling of the serialization and deserialization cost per schema attribute.
+
+.. code-block:: python
+
+    with argo.profile() as profiler:
+        Post.serialize(post)
+    print(profiler.table())
+
+While profiling, `Schema.serialize`, `serialize_many`, `dumps`, `deserialize` and `loads` walk the attributes
+one by one instead of running the compiled code, and record the calls, the cumulative time and optionally the
+allocated memory of every phase of every attribute:
+
+* ``access`` - getting the attribute value with the accessor (serialization) or reading it from the
+  deserialized data (deserialization),
+* ``convert`` - serialization or deserialization of the value by the attribute type,
+* ``validate`` - validators of the types that don't override the deserialization.
+
+Nested schemas are profiled as well, so the time of the ``convert`` phase of the attribute that holds a nested
+schema includes the time of the nested attributes. Cache hits of `Schema.__cache__` are not profiled.
+
+When no profiler is active the schemas only check one global variable per call.
+"""
+
+import contextlib
+import json
+import timeit
+
+from . import exceptions
+from . import schema
+from . import types
+
+PHASES = ("access", "convert", "validate")
+
+
+class Stat(object):
+
+    """Statistics of one phase of one attribute."""
+
+    __slots__ = ("calls", "time", "allocated")
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.allocated = 0
+
+
+class Profiler(object):
+
+    """Recorder of the attribute statistics."""
+
+    def __init__(self, memory=False):
+        """Profiler constructor.
+
+        :param memory: Record the memory allocated by every phase with `tracemalloc`, which is considerably slower.
+        """
+        self.memory = memory
+        self.stats = {}
+
+    def measure(self, schema_cls, attr, phase, func, *args, **kwargs):
+        """Call the function and record its time and allocated memory.
+
+        :param schema_cls: Schema class.
+        :param attr: Attribute of the schema.
+        :param phase: One of the `PHASES`.
+        :return: Result of the function.
+        """
+        key = (schema_cls, attr.name, phase)
+        stat = self.stats.get(key)
+        if stat is None:
+            stat = self.stats[key] = Stat()
+
+        if self.memory:
+            import tracemalloc
+
+            allocated = tracemalloc.get_traced_memory()[0]
+        start = timeit.default_timer()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stat.time += timeit.default_timer() - start
+            stat.calls += 1
+            if self.memory:
+                stat.allocated += tracemalloc.get_traced_memory()[0] - allocated
+
+    def serialize(self, schema_cls, value, kwargs):
+        """Serialize the value recording the statistics of the attributes."""
+        result = {}
+        for attr in schema_cls.__attrs__:
+            compartment = result
+            if attr.compartment is not None:
+                compartment = result.setdefault(attr.compartment, {})
+            try:
+                compartment[attr.key] = self.serialize_attr(schema_cls, attr, value, kwargs)
+            except (AttributeError, KeyError):
+                if attr.required:
+                    raise
+
+        return result
+
+    def serialize_attr(self, schema_cls, attr, value, kwargs):
+        """Serialize the attribute the same way `Attr.serialize` does, phase by phase."""
+        if type(attr).serialize is not schema.Attr.serialize:
+            return self.measure(schema_cls, attr, "convert", attr.serialize, value, **kwargs)
+
+        attr_type = attr.attr_type
+        if not types.Type.is_type(attr_type):
+            return attr_type
+
+        try:
+            value = self.measure(schema_cls, attr, "access", attr.accessor.get, value, **kwargs)
+        except (AttributeError, KeyError):
+            if not hasattr(attr, "default") and attr.required:
+                raise
+            value = attr.default
+
+        context = schema._get_context(attr_type.serialize, kwargs)
+        return self.measure(schema_cls, attr, "convert", attr_type.serialize, value, **context)
+
+    def deserialize(self, schema_cls, value, output=None, fail_fast=False):
+        """Deserialize the value recording the statistics of the attributes.
+
+        :param fail_fast: Stop at the first error of the attributes.
+        """
+        errors = []
+        result = {}
+        for attr in schema_cls.__attrs__:
+            if not attr.deserializable:
+                continue
+            try:
+                result[attr.name] = self.deserialize_attr(schema_cls, attr, value, fail_fast)
+            except NotImplementedError:
+                continue
+            except exceptions.ValidationError as e:
+                e.attr = attr.name
+                errors.append(e)
+            except KeyError:
+                if attr.required:
+                    e = exceptions.ValidationError("Missing attribute.", attr.name)
+                    e.attr = attr.name
+                    errors.append(e)
+            if fail_fast and errors:
+                break
+
+        if errors:
+            raise exceptions.ValidationError(errors)
+
+        if output is None:
+            return result
+        for attr in schema_cls.__attrs__:
+            if attr.name in result:
+                attr.accessor.set(output, result[attr.name])
+
+    def deserialize_attr(self, schema_cls, attr, value, fail_fast=False):
+        """Deserialize the attribute the same way `Attr.deserialize` does, phase by phase."""
+        if type(attr).deserialize is not schema.Attr.deserialize:
+            if fail_fast:
+                return self.measure(schema_cls, attr, "convert", attr.deserialize, value, fail_fast=True)
+            return self.measure(schema_cls, attr, "convert", attr.deserialize, value)
+
+        value = self.measure(schema_cls, attr, "access", _read, attr, value)
+
+        attr_type = attr.attr_type
+        if isinstance(attr_type, types.Type) and type(attr_type).deserialize is types.Type.deserialize:
+            for validator in attr_type.validators:
+                self.measure(schema_cls, attr, "validate", validator.validate, value)
+            return value
+        return self.measure(schema_cls, attr, "convert", attr.deserialize_value, value, fail_fast)
+
+    def rows(self):
+        """Statistics as a list of dicts, the most expensive first.
+
+        Schemas are reported by their qualified names, the classes with the same name have separate rows.
+        """
+        rows = [
+            {
+                "schema": getattr(schema_cls, "__qualname__", schema_cls.__name__),
+                "attr": attr_name,
+                "phase": phase,
+                "calls": stat.calls,
+                "time": stat.time,
+                "allocated": stat.allocated,
+            }
+            for (schema_cls, attr_name, phase), stat in self.stats.items()
+        ]
+        rows.sort(key=lambda row: (-row["time"], row["schema"], row["attr"], PHASES.index(row["phase"])))
+        return rows
+
+    def table(self, limit=None):
+        """Statistics as a text table.
+
+        :param limit: Maximum number of the rows, all if None.
+        """
+        lines = ["{0:<24} {1:<24} {2:<9} {3:>10} {4:>12} {5:>12}".format(
+            "schema", "attr", "phase", "calls", "time, ms", "allocated")]
+        for row in self.rows()[:limit]:
+            lines.append("{schema:<24} {attr:<24} {phase:<9} {calls:>10} {0:>12.3f} {allocated:>12}".format(
+                row["time"] * 1000, **row))
+        return "\n".join(lines)
+
+    def to_json(self):
+        """Statistics as a JSON string."""
+        return json.dumps(self.rows())
+
+    def clear(self):
+        """Forget the recorded statistics."""
+        self.stats.clear()
+
+
+def _read(attr, value):
+    """Read the attribute value from the deserialized data."""
+    compartment = value
+    if attr.compartment is not None:
+        compartment = value[attr.compartment]
+    try:
+        return compartment[attr.key]
+    except KeyError:
+        if hasattr(attr, "default"):
+            return attr.default
+        raise
+
+
+@contextlib.contextmanager
+def profile(memory=False):
+    """Profile the schemas used within the block.
+
+    The profiler is global to the process, profiles can't be nested.
+
+    :param memory: Record the allocated memory, see `Profiler`.
+    :return: Context manager of the `Profiler`.
+    """
+    assert schema._profiler is None, "Profiler is already active."
+
+    tracing = False
+    if memory:
+        import tracemalloc
+
+        tracing = not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+
+    schema._profiler = Profiler(memory)
+    try:
+        yield schema._profiler
+    finally:
+        schema._profiler = None
+        if tracing:
+            tracemalloc.stop()
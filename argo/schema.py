@@ -2,6 +2,7 @@
 
 import sys
 import inspect
+import operator
 
 from . import types
 from . import exceptions
@@ -10,8 +11,80 @@ PY2 = sys.version_info[0] == 2
 
 if not PY2:
     string_types = (str,)
+    getargspec = inspect.getfullargspec
 else:
     string_types = (str, unicode)
+    getargspec = inspect.getargspec
+
+CONTEXT_PLANS_MAXSIZE = 4096
+"""Maximum number of callables which context plans are memoized."""
+
+_context_plans = {}
+
+_profiler = None
+"""Active `argo.profiling.Profiler`, see `argo.profiling.profile`."""
+
+_observer = None
+"""Dispatcher of the registered `argo.observers`, None if there are no observers."""
+
+COLLECT = "collect"
+"""Deserialization mode that reports the errors of all the attributes."""
+
+FAIL_FAST = "fail_fast"
+"""Deserialization mode that stops at the first error and only reports it."""
+
+
+def _fail_fast(mode):
+    """Check the deserialization mode.
+
+    :param mode: `COLLECT` or `FAIL_FAST`.
+    :return: True if the deserialization stops at the first error.
+    :raises: ValueError if the mode is unknown.
+    """
+    if mode == COLLECT:
+        return False
+    if mode == FAIL_FAST:
+        return True
+    raise ValueError("Unknown deserialization mode: {0!r}".format(mode))
+
+
+def _get_context_plan(func):
+    """Get the names of the context keyword arguments that the function accepts.
+
+    Signature introspection is expensive, so the plan is computed once per function and memoized.
+
+    :param func: Function which needs or does not need kwargs.
+    :return: None if the function accepts any keyword arguments, otherwise tuple of the argument names.
+    """
+    # Bound methods are created on every attribute access, but share the function.
+    key = getattr(func, "__func__", func)
+    try:
+        return _context_plans[key]
+    except KeyError:
+        pass
+
+    argspec = getargspec(func)
+    if getattr(argspec, "varkw", getattr(argspec, "keywords", None)) is not None:
+        plan = None
+    else:
+        plan = tuple(argspec.args) + tuple(getattr(argspec, "kwonlyargs", None) or ())
+
+    if len(_context_plans) >= CONTEXT_PLANS_MAXSIZE:
+        _context_plans.clear()
+    _context_plans[key] = plan
+    return plan
+
+
+def _select_context(plan, kwargs):
+    """Select the keyword arguments of the context plan.
+
+    :param plan: Context plan, see `_get_context_plan`.
+    :param kwargs: Dict with context.
+    :return: Keywords arguments that function can accept.
+    """
+    if plan is None or not kwargs:
+        return kwargs
+    return dict((arg, kwargs[arg]) for arg in plan if arg in kwargs)
 
 
 def _get_context(func, kwargs):
@@ -21,38 +94,108 @@ def _get_context(func, kwargs):
     :param kwargs: Dict with context
     :return: Keywords arguments that function can accept.
     """
-    argspec = inspect.getargspec(func)
-    if argspec.keywords is not None:
+    if not kwargs:
         return kwargs
-    return dict((arg, kwargs[arg]) for arg in argspec.args if arg in kwargs)
+    return _select_context(_get_context_plan(func), kwargs)
+
+
+def _split_path(path):
+    """Split the dot-separated path, or return None if the accessor is not a path."""
+    if isinstance(path, string_types):
+        return tuple(path.split("."))
+    return None
+
+
+def _compile_path(path, source):
+    """Compile the path into a getter function when the shape of the source is known.
+
+    :param path: Tuple of the path components.
+    :param source: `dict` if the source and all the nested values are dicts, `object` if they are objects.
+    :return: Getter function or None when the shape of the source is unknown.
+    """
+    if path is None or source is None:
+        return None
+
+    if source is dict:
+        if len(path) == 1:
+            return operator.itemgetter(path[0])
+
+        getters = [operator.itemgetter(attr) for attr in path]
+
+        def get(obj):
+            for getter in getters:
+                obj = getter(obj)
+            return obj
+        return get
+
+    return operator.attrgetter(".".join(path))
+
+
+def BYPASS(value):
+    """Getter of the serialized value itself."""
+    return value
 
 
 class Accessor(object):
 
     """Object that encapsulates the getter and the setter of the attribute."""
 
-    def __init__(self, getter=None, setter=None):
-        """Initialize an Accessor object."""
+    __slots__ = ("source", "path", "_getter", "_get_path", "_setter", "_set_path")
+
+    def __init__(self, getter=None, setter=None, source=None):
+        """Initialize an Accessor object.
+
+        :param getter: Function or dot-separated path to get the attribute value.
+        :param setter: Function or dot-separated path to set the attribute value.
+        :param source: Shape of the source values if known: `dict` or `object`. Path getters are then compiled
+            into `operator.itemgetter` or `operator.attrgetter` calls instead of checking the type of every value.
+        """
+        self.source = source
         self.getter = getter
         self.setter = setter
 
+    @property
+    def getter(self):
+        """Function or dot-separated path to get the attribute value."""
+        return self._getter
+
+    @getter.setter
+    def getter(self, getter):
+        self._getter = getter
+        self.path = _split_path(getter)
+        self._get_path = _compile_path(self.path, self.source)
+
+    @property
+    def setter(self):
+        """Function or dot-separated path to set the attribute value."""
+        return self._setter
+
+    @setter.setter
+    def setter(self, setter):
+        self._setter = setter
+        self._set_path = _split_path(setter)
+
     def get(self, obj, **kwargs):
         """Get an attribute from a value.
 
         :param obj: Object to get the attribute value from.
         :return: Value of object's attribute.
         """
-        assert self.getter is not None, "Getter accessor is not specified."
-        if callable(self.getter):
-            return self.getter(obj, **_get_context(self.getter, kwargs))
-
-        assert isinstance(self.getter, string_types), "Accessor must be a function or a dot-separated string."
-
-        for attr in self.getter.split("."):
-            if isinstance(obj, dict):
-                obj = obj[attr]
-            else:
-                obj = getattr(obj, attr)
+        getter = self._getter
+        assert getter is not None, "Getter accessor is not specified."
+        if callable(getter):
+            return getter(obj, **_get_context(getter, kwargs))
+
+        assert self.path is not None, "Accessor must be a function or a dot-separated string."
+
+        if self._get_path is not None:
+            obj = self._get_path(obj)
+        else:
+            for attr in self.path:
+                if isinstance(obj, dict):
+                    obj = obj[attr]
+                else:
+                    obj = getattr(obj, attr)
 
         if callable(obj):
             return obj()
@@ -69,7 +212,7 @@ class Accessor(object):
         if callable(self.setter):
             return self.setter(obj, value)
 
-        assert isinstance(self.setter, string_types), "Accessor must be a function or a dot-separated string."
+        assert self._set_path is not None, "Accessor must be a function or a dot-separated string."
 
         def _set(obj, attr, value):
             if isinstance(obj, dict):
@@ -78,7 +221,7 @@ class Accessor(object):
                 setattr(obj, attr, value)
             return value
 
-        path = self.setter.split(".")
+        path = self._set_path
         for attr in path[:-1]:
             obj = _set(obj, attr, {})
 
@@ -93,20 +236,51 @@ class Accessor(object):
         )
 
 
+class Constant(Accessor):
+
+    """Accessor of a value that doesn't depend on the serialized value.
+
+    Compiled schemas serialize attributes with constant accessors once, when the schema is compiled, without
+    the serialization context.
+    """
+
+    __slots__ = ("value", )
+
+    def __init__(self, value):
+        """Constant accessor constructor.
+
+        :param value: The attribute value.
+        """
+        super(Constant, self).__init__()
+        self.value = value
+
+    def get(self, obj, **kwargs):
+        """Get the constant value."""
+        return self.value
+
+
 class Attr(object):
 
     """Schema attribute."""
 
-    def __init__(self, attr_type=None, attr=None, required=True, **kwargs):
+    __slots__ = ("name", "attr_type", "required", "lazy", "default", "_attr", "_accessor")
+
+    deserializable = True
+    """Attribute is read from the deserialized data."""
+
+    def __init__(self, attr_type=None, attr=None, required=True, lazy=False, **kwargs):
         """Attribute constructor.
 
         :param attr_type: Type, Schema or constant that does the type conversion of the attribute.
         :param attr: Attribute name, dot-separated attribute path or an `Accessor` instance.
         :param required: Is attribute required to be present.
+        :param lazy: Serialize the attribute only when its value is accessed in the serialized dict or encoded
+            (see `argo.lazy.LazyDict`). Compiled schemas only.
         """
         self.attr_type = attr_type or types.Type()
         self.attr = attr
         self.required = required
+        self.lazy = lazy
 
         if "default" in kwargs:
             self.default = kwargs["default"]
@@ -121,20 +295,33 @@ class Attr(object):
         """The key of the this attribute will be placed into (within it's compartment)."""
         return self.name
 
+    @property
+    def attr(self):
+        """Attribute name, dot-separated attribute path, callable or an `Accessor` instance."""
+        return self._attr
+
+    @attr.setter
+    def attr(self, attr):
+        self._attr = attr
+        self._accessor = None
+
     @property
     def accessor(self):
         """Get an attribute's accessor with the getter and the setter.
 
+        The accessor is resolved once and reused until the `attr` is changed.
+
         :return: `Accessor` instance.
         """
-        if isinstance(self.attr, Accessor):
-            return self.attr
-
-        if callable(self.attr):
-            return Accessor(getter=self.attr)
-
-        attr = self.attr or self.name
-        return Accessor(getter=attr, setter=attr)
+        if self._accessor is None:
+            if isinstance(self.attr, Accessor):
+                self._accessor = self.attr
+            elif callable(self.attr):
+                self._accessor = Accessor(getter=self.attr)
+            else:
+                attr = self.attr or self.name
+                self._accessor = Accessor(getter=attr, setter=attr)
+        return self._accessor
 
     def serialize(self, value, **kwargs):
         """Serialize the attribute of the input data.
@@ -159,7 +346,7 @@ class Attr(object):
 
         return self.attr_type
 
-    def deserialize(self, value):
+    def deserialize(self, value, fail_fast=False):
         """Deserialize the attribute from a HAL structure.
 
         Get the value from the HAL structure from the attribute's compartment
@@ -168,6 +355,7 @@ class Attr(object):
         to the output value if specified using the attribute's accessor setter.
 
         :param value: HAL structure to get the value from.
+        :param fail_fast: Nested schemas and lists stop at their first error, see `FAIL_FAST`.
         :return: Deserialized attribute value.
         :raises: ValidationError.
         """
@@ -184,7 +372,23 @@ class Attr(object):
             else:
                 raise
 
-        return self.attr_type.deserialize(value)
+        return self.deserialize_value(value, fail_fast)
+
+    def deserialize_value(self, value, fail_fast=False):
+        """Deserialize the value read from the HAL structure with the attribute type.
+
+        :param value: Attribute value.
+        :param fail_fast: Nested schemas and lists stop at their first error, see `FAIL_FAST`.
+        :return: Deserialized attribute value.
+        :raises: ValidationError.
+        """
+        attr_type = self.attr_type
+        if fail_fast:
+            if getattr(attr_type.deserialize, "__func__", None) is _Schema.deserialize.__func__:
+                return attr_type.deserialize(value, mode=FAIL_FAST)
+            if isinstance(attr_type, types.List) and type(attr_type).deserialize is types.List.deserialize:
+                return attr_type.deserialize(value, fail_fast=True)
+        return attr_type.deserialize(value)
 
     def __repr__(self):
         """Attribute representation."""
@@ -194,10 +398,61 @@ class Attr(object):
         )
 
 
+_COMPILED = ("__plan__", "__serializer__", "__many_serializer__", "__encoder__", "__many_encoder__",
+             "__deserializer__")
+
+
+class _Compiled(object):
+
+    """Compiled attribute of a schema class, the schema is compiled when it is first accessed."""
+
+    __slots__ = ("name", )
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        owner.compile()
+        return getattr(owner, self.name)
+
+
 class _Schema(types.Type):
 
     """Type for creating schema."""
 
+    __compiled__ = True
+    """Compile the schema into a specialized serializer. Set to False to debug the interpreted serialization."""
+
+    __plan__ = None
+    __serializer__ = None
+    __many_serializer__ = None
+    __encoder__ = None
+    __many_encoder__ = None
+    __deserializer__ = None
+
+    __backend__ = None
+    """JSON backend name or `argo.backends.Backend` instance used by `dumps`, the default backend if None."""
+
+    __concurrency__ = None
+    """Maximum number of awaitable attribute values resolved at once by `aserialize`, unlimited if None."""
+
+    __cache__ = None
+    """Cache of the JSON encoded by the top-level `dumps` calls, see `argo.cache.LRUCache`."""
+
+    __memoize__ = False
+    """Serialize the same value once per `argo.loader.session`, e.g. an author embedded in many posts.
+
+    True memoizes by the identity of the value, a function of the value returns the memo key instead. The
+    serialized dicts are shared, so they must not be modified. Only compiled schemas are memoized.
+    """
+
+    __source__ = None
+    """Shape of the serialized values if known: `dict` or `object`.
+
+    Attribute paths are then compiled into plain item or attribute access instead of checking the type of every
+    value on the path.
+    """
+
     def __new__(cls, **kwargs):
         """Create schema from keyword arguments."""
         schema = type("Schema", (cls, ), {"__doc__": cls.__doc__})
@@ -210,8 +465,178 @@ class _Schema(types.Type):
             schema.__attrs__.append(attr)
         return schema
 
+    @classmethod
+    def compile(cls):
+        """Compile the schema attributes into a specialized serializer function.
+
+        Schemas are compiled on the first use, this has to be called again if the attributes of the schema
+        are changed afterwards. When `__compiled__` is False the schema falls back to the interpreted
+        serialization.
+        """
+        from . import compiler
+
+        # Schemas referring to themselves see the schema as not compiled while it is being compiled.
+        for name in _COMPILED:
+            setattr(cls, name, None)
+        try:
+            cls.__plan__ = compiler.Plan(cls)
+            if cls.__compiled__:
+                serialize, serialize_many = compiler.compile_serializer(cls.__plan__)
+                if cls.__memoize__:
+                    from . import loader
+
+                    serialize = loader.memoize(cls, serialize, "serialized")
+                    serialize_many = loader.memoize_many(serialize)
+                cls.__serializer__ = staticmethod(serialize)
+                cls.__many_serializer__ = staticmethod(serialize_many)
+        except Exception:
+            # Compile again on the next use rather than keep the partial result.
+            for name in _COMPILED:
+                setattr(cls, name, _Compiled(name))
+            raise
+
+    @classmethod
+    def select(cls, fields=None, embed=None):
+        """Get the schema that only serializes the selected attributes (sparse fieldset).
+
+        Links are always serialized. Projected schemas are compiled once per selection.
+
+        :param fields: Dot-separated paths of the selected attributes, e.g. `author.name`. All if None.
+        :param embed: Dot-separated paths of the selected embedded attributes, e.g. `_embedded.comments`.
+            The embedded attributes selected by `fields` if None.
+        :return: Projected schema class.
+        :raises: ValueError if the selected attribute doesn't exist.
+        """
+        from . import selection
+
+        return selection.select(cls, fields, embed)
+
     @classmethod
     def serialize(cls, value, **kwargs):
+        """Serialize the value into a dict.
+
+        :param value: Dict or object to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: Serialized value.
+        """
+        if _observer is not None and not _observer.busy:
+            return _observer.observe(cls, "serialize", cls.serialize, value, **kwargs)
+        return cls._serialize(value, kwargs)
+
+    @classmethod
+    def _serialize(cls, value, kwargs):
+        """Serialize the value without observing the call."""
+        if _profiler is not None:
+            return _profiler.serialize(cls, value, kwargs)
+        if cls.__plan__.scoped:
+            return cls.serialize_many([value], **kwargs)[0]
+        if cls.__serializer__ is not None:
+            return cls.__serializer__(value, kwargs)
+        return cls.interpret(value, **kwargs)
+
+    @classmethod
+    def aserialize(cls, value, **kwargs):
+        """Serialize the value into a dict asynchronously.
+
+        Accessors and types may return awaitables (e.g. getters can be coroutine functions). Sibling
+        attributes and list items are resolved concurrently, at most `__concurrency__` at once.
+
+        :param value: Dict or object to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: Coroutine of the serialized value.
+        """
+        from . import aio
+
+        return aio.serialize(cls, value, kwargs, cls.__concurrency__)
+
+    @classmethod
+    def serialize_many(cls, values, **kwargs):
+        """Serialize the values into a list of dicts.
+
+        Getters, types and the context selection are resolved once for all the values, which makes it
+        considerably faster than serializing the values one by one.
+
+        :param values: Iterable of dicts or objects to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: List of serialized values.
+        """
+        if _observer is not None and not _observer.busy:
+            return _observer.observe(cls, "serialize_many", cls.serialize_many, values, **kwargs)
+        if _profiler is not None:
+            return [_profiler.serialize(cls, value, kwargs) for value in values]
+        if cls.__plan__.scoped:
+            from . import loader
+
+            return loader.serialize_many(cls, values, kwargs)
+        if cls.__many_serializer__ is not None:
+            return cls.__many_serializer__(values, kwargs)
+        return [cls.interpret(value, **kwargs) for value in values]
+
+    @classmethod
+    def dumps(cls, value, **kwargs):
+        """Serialize the value into JSON.
+
+        The result is the same as encoding the serialized value with the JSON backend of the schema,
+        but the backend may write the JSON directly from the attribute values. When the schema has a
+        `__cache__` the JSON is returned from the cache if present.
+
+        :param value: Dict or object to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: JSON bytes.
+        """
+        if _observer is not None and not _observer.busy:
+            return _observer.observe(cls, "dumps", cls.dumps, value, **kwargs)
+        if cls.__cache__ is not None:
+            return cls.__cache__.dumps(cls, value, kwargs)
+        return cls._dumps(value, kwargs)
+
+    @classmethod
+    def _dumps(cls, value, kwargs):
+        """Serialize the value into JSON bypassing the cache."""
+        from . import backends
+
+        backend = backends.get_backend(cls.__backend__)
+        if _profiler is not None:
+            return backend.dumps(cls._serialize(value, kwargs))
+        if cls.__plan__.scoped:
+            from . import loader
+
+            with loader.session() as loader_session:
+                if cls.__plan__.batched:
+                    loader.prefetch(cls, [value], kwargs, loader_session)
+                return backend.dumps_schema(cls, value, kwargs)
+        return backend.dumps_schema(cls, value, kwargs)
+
+    @classmethod
+    def iter_serialize(cls, value, **kwargs):
+        """Serialize the value into JSON lazily.
+
+        Nested schemas and lists of schemas are walked as they are encoded, so the whole serialized
+        structure is never built in memory. Lists can be generators. The result is the same as
+        `json.dumps(Schema.serialize(value))`.
+
+        :param value: Dict or object to serialize.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        :return: Iterator of the JSON string chunks.
+        """
+        from . import stream
+
+        return stream.iter_serialize(cls, value, kwargs)
+
+    @classmethod
+    def dump_stream(cls, value, fp, **kwargs):
+        """Serialize the value into JSON and write it to the file-like object chunk by chunk.
+
+        :param value: Dict or object to serialize.
+        :param fp: File-like object to write the JSON string chunks to.
+        :param kwargs: Serialization context that is passed to the accessors and types that accept it.
+        """
+        for chunk in cls.iter_serialize(value, **kwargs):
+            fp.write(chunk)
+
+    @classmethod
+    def interpret(cls, value, **kwargs):
+        """Serialize the value walking the schema attributes without compilation."""
         result = {}
         for attr in cls.__attrs__:
             compartment = result
@@ -226,20 +651,77 @@ class _Schema(types.Type):
         return result
 
     @classmethod
-    def deserialize(cls, value, output=None):
+    def loads(cls, data, output=None, mode=COLLECT):
+        """Deserialize JSON into the output value.
+
+        JSON is decoded by the JSON backend of the schema, then only the attributes declared by the schema
+        are read from it in one pass. Links are not read at all.
+
+        :param data: JSON bytes or string.
+        :param output: If present, the output object will be updated instead of returning the deserialized data.
+        :param mode: `COLLECT` to report the errors of all the attributes, `FAIL_FAST` to stop at the first error.
+
+        :returns: Dict of deserialized value for attributes, the same as `deserialize` returns.
+        :raises: ValidationError when JSON is not valid or when the deserialization fails.
+        """
+        if _observer is not None and not _observer.busy:
+            return _observer.observe(cls, "loads", cls.loads, data, output, mode)
+        from . import backends
+
+        fail_fast = _fail_fast(mode)
+        try:
+            value = backends.get_backend(cls.__backend__).loads(data)
+        except ValueError as e:
+            raise exceptions.ValidationError(exceptions.Message("Invalid JSON: {0}", e))
+
+        if _profiler is not None:
+            return _profiler.deserialize(cls, value, output, fail_fast)
+        return cls.__plan__.deserialize(value, output, fail_fast)
+
+    @classmethod
+    def iter_deserialize(cls, fp, name, output=None):
+        """Deserialize the items of a list attribute lazily from the JSON document.
+
+        Items are read from the file one at a time, so the memory doesn't grow with the length of the list.
+        Validation errors of the items are collected with their indices and raised after the last item.
+
+        :param fp: File-like object to read the JSON document from.
+        :param name: Name of the list attribute, e.g. an embedded list.
+        :param output: Factory of the output objects, each item is assigned to a new one using the accessors.
+        :return: Iterator of the deserialized items or the output objects.
+        :raises: ValidationError.
+        """
+        from . import stream
+
+        return stream.iter_deserialize(cls, fp, name, output)
+
+    @classmethod
+    def deserialize(cls, value, output=None, mode=COLLECT):
         """Deserialize the HAL structure into the output value.
 
         :param value: Dict of already loaded json which will be deserialized by schema attributes.
         :param output: If present, the output object will be updated instead of returning the deserialized data.
+        :param mode: `COLLECT` to report the errors of all the attributes, `FAIL_FAST` to stop at the first error.
+            Nested schemas and lists also stop at their first error.
 
         :returns: Dict of deserialized value for attributes. Where key is name of schema's attribute and value is
         deserialized value from value dict.
         """
+        if _observer is not None and not _observer.busy:
+            return _observer.observe(cls, "deserialize", cls.deserialize, value, output, mode)
+        fail_fast = _fail_fast(mode)
+        if _profiler is not None:
+            return _profiler.deserialize(cls, value, output, fail_fast)
+        if cls.__compiled__:
+            return cls.__plan__.deserialize(value, output, fail_fast)
         errors = []
         result = {}
         for attr in cls.__attrs__:
             try:
-                result[attr.name] = attr.deserialize(value)
+                if fail_fast:
+                    result[attr.name] = attr.deserialize(value, fail_fast=True)
+                else:
+                    result[attr.name] = attr.deserialize(value)
             except NotImplementedError:
                 # Links don't support deserialization
                 continue
@@ -251,6 +733,8 @@ class _Schema(types.Type):
                     e = exceptions.ValidationError("Missing attribute.", attr.name)
                     e.attr = attr.name
                     errors.append(e)
+            if fail_fast and errors:
+                break
 
         if errors:
             raise exceptions.ValidationError(errors)
@@ -279,5 +763,9 @@ class _SchemaType(type):
         for base in reversed(cls.__mro__):
             cls.__attrs__.extend(getattr(base, "__class_attrs__", []))
 
+        # Compile on the first use, so defining many schemas (e.g. at import) stays fast.
+        for name in _COMPILED:
+            setattr(cls, name, _Compiled(name))
+
 
 Schema = _SchemaType("Schema", (_Schema, ), {"__doc__": _Schema.__doc__})
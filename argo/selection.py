@@ -0,0 +1,125 @@
+"""Sparse fieldsets: projections of schemas to the selected attributes."""
+
+import copy
+
+from . import types
+from .schema import _Schema
+
+SELECTIONS_MAXSIZE = 1024
+"""Maximum number of the memoized projected schemas."""
+
+COMPARTMENTS = ("_links", "_embedded")
+
+_selections = {}
+
+
+def _tree(paths):
+    """Tree of the dot-separated paths, None if there is no selection.
+
+    Leading compartment names are dropped, `_embedded.comments` is the same as `comments`.
+    """
+    if paths is None:
+        return None
+    tree = {}
+    for path in paths:
+        names = path.split(".")
+        if len(names) > 1 and names[0] in COMPARTMENTS:
+            names = names[1:]
+        node = tree
+        for name in names:
+            node = node.setdefault(name, {})
+    return tree
+
+
+def _subtree(tree, name):
+    if tree is None:
+        return None
+    return tree.get(name) or None
+
+
+def _included(attr, fields, embed):
+    """Is the attribute selected.
+
+    Links are always included, embedded attributes are selected by the embed paths if there are any.
+    """
+    if attr.compartment == "_links":
+        return True
+    if attr.compartment == "_embedded" and embed is not None:
+        return attr.name in embed or "_embedded" in embed
+    if fields is None:
+        return True
+    return attr.name in fields or (attr.compartment is not None and attr.compartment in fields)
+
+
+def _project_attr(attr, fields, embed):
+    """Copy of the attribute with the projected schema type, or the attribute itself if nothing is selected."""
+    if fields is None and embed is None:
+        return attr
+
+    attr_type = attr.attr_type
+    if isinstance(attr_type, types.List):
+        attr_type = copy.copy(attr_type)
+        attr_type.item_type = _project_type(attr, attr_type.item_type, fields, embed)
+    else:
+        attr_type = _project_type(attr, attr_type, fields, embed)
+
+    attr = copy.copy(attr)
+    attr.attr_type = attr_type
+    return attr
+
+
+def _project_type(attr, attr_type, fields, embed):
+    if not (isinstance(attr_type, type) and issubclass(attr_type, _Schema)):
+        raise ValueError("Attribute {0!r} is not a schema, its attributes can't be selected.".format(attr.name))
+    return _project(attr_type, fields, embed)
+
+
+def _project(schema, fields, embed):
+    names = set(attr.name for attr in schema.__attrs__) | set(COMPARTMENTS)
+    for name in list(fields or ()) + list(embed or ()):
+        if name not in names:
+            raise ValueError("{0} has no attribute {1!r}.".format(schema.__name__, name))
+
+    attrs = [
+        _project_attr(attr, _subtree(fields, attr.name), _subtree(embed, attr.name))
+        for attr in schema.__attrs__
+        if _included(attr, fields, embed)
+    ]
+
+    projected = type(schema)(schema.__name__, (schema, ), {
+        "__module__": schema.__module__,
+        "__doc__": schema.__doc__,
+        "__cache__": None,
+    })
+    projected.__attrs__ = attrs
+    projected.compile()
+    return projected
+
+
+def select(schema, fields=None, embed=None):
+    """Get the schema projected to the selected attributes.
+
+    Projections are compiled once per selection and memoized.
+
+    :param schema: Schema class.
+    :param fields: Dot-separated paths of the selected attributes, e.g. `author.name`. All the attributes if None.
+    :param embed: Dot-separated paths of the selected embedded attributes, e.g. `comments.author`.
+        All the embedded attributes that are selected by `fields` if None.
+    :return: Schema class that only serializes the selected attributes.
+    :raises: ValueError if the selected attribute doesn't exist.
+    """
+    key = (
+        schema,
+        None if fields is None else tuple(sorted(set(fields))),
+        None if embed is None else tuple(sorted(set(embed))),
+    )
+    try:
+        return _selections[key]
+    except KeyError:
+        pass
+
+    projected = _project(schema, _tree(fields), _tree(embed))
+    if len(_selections) >= SELECTIONS_MAXSIZE:
+        _selections.clear()
+    _selections[key] = projected
+    return projected
@@ -0,0 +1,278 @@
+"""Streaming JSON serialization and deserialization of schemas."""
+
+import codecs
+import json
+import re
+import weakref
+
+from . import compiler
+from . import exceptions
+
+CHUNK_SIZE = 64 * 1024
+"""Approximate size of the chunks yielded by the streaming serialization."""
+
+_encode = json.JSONEncoder().encode
+
+_layouts = weakref.WeakKeyDictionary()
+
+
+class _Field(object):
+
+    """Field of the schema layout with the key already encoded."""
+
+    def __init__(self, field):
+        self.field = field
+        self.key = compiler.encoded_key(field.key)
+        self.required = field.required
+        # Only the required attributes are walked lazily. Optional attributes are skipped when they fail,
+        # so they have to be serialized completely before anything is written.
+        self.nested = compiler.schema_type(field.attr_type) if field.required and not field.generic else None
+        self.items = compiler.list_item_schema(field.attr_type) if field.required and not field.generic else None
+
+
+def _layout(schema):
+    """Get the schema layout with the encoded compartment names and keys."""
+    plan = schema.__plan__
+    try:
+        return _layouts[plan]
+    except KeyError:
+        layout = _layouts[plan] = [
+            (None if compartment is None else compiler.encoded_key(compartment), [_Field(field) for field in fields])
+            for compartment, fields in plan.layout
+        ]
+        return layout
+
+
+def _iter_schema(schema, value, kwargs):
+    yield "{"
+    separator = ""
+    for compartment, fields in _layout(schema):
+        if compartment is not None:
+            yield separator + compartment + "{"
+            separator = ""
+
+        for field in fields:
+            if field.nested is not None:
+                nested = field.field.get(value, kwargs)
+                yield separator + field.key
+                for chunk in _iter_schema(field.nested, nested, kwargs):
+                    yield chunk
+            elif field.items is not None:
+                items = field.field.get(value, kwargs)
+                yield separator + field.key
+                for chunk in _iter_list(field.items, items, kwargs):
+                    yield chunk
+            else:
+                try:
+                    encoded = _encode(field.field.serialize(value, kwargs))
+                except (AttributeError, KeyError):
+                    if field.required:
+                        raise
+                    continue
+                yield separator + field.key + encoded
+            separator = ", "
+
+        if compartment is not None:
+            yield "}"
+            separator = ", "
+    yield "}"
+
+
+def _iter_list(schema, values, kwargs):
+    yield "["
+    separator = ""
+    for value in values:
+        yield separator
+        for chunk in _iter_schema(schema, value, kwargs):
+            yield chunk
+        separator = ", "
+    yield "]"
+
+
+def iter_serialize(schema, value, kwargs, chunk_size=None):
+    """Serialize the value into JSON lazily.
+
+    :param schema: Schema class.
+    :param value: Dict or object to serialize.
+    :param kwargs: Serialization context.
+    :param chunk_size: Approximate size of the yielded chunks, `CHUNK_SIZE` by default.
+    :return: Iterator of the JSON string chunks.
+    """
+    chunk_size = chunk_size or CHUNK_SIZE
+    buf = []
+    size = 0
+    for fragment in _iter_schema(schema, value, kwargs):
+        buf.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield "".join(buf)
+            buf = []
+            size = 0
+    if buf:
+        yield "".join(buf)
+
+
+_decode = json.JSONDecoder().raw_decode
+_whitespace = re.compile(r"[ \t\n\r]*")
+_number_tail = re.compile(r"[0-9.eE+\-]*")
+_NUMBER_START = "-0123456789"
+
+
+class _Reader(object):
+
+    """Incremental JSON reader over a file-like object.
+
+    Only the consumed part of the document is dropped from the buffer, so the memory stays bounded by the
+    largest single value that is read.
+    """
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = None
+
+    def error(self, message):
+        """Invalid JSON document."""
+        return exceptions.ValidationError(exceptions.Message("Invalid JSON: {0}", message))
+
+    def fill(self):
+        """Read the next chunk into the buffer.
+
+        :return: False if the end of the file is reached.
+        """
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.chunk_size)
+        # Only the raw chunk tells the end of the file, the decoded one is empty for a partial UTF-8 character.
+        self.eof = not chunk
+        if isinstance(chunk, bytes):
+            if self.decoder is None:
+                self.decoder = codecs.getincrementaldecoder("utf-8")()
+            try:
+                chunk = self.decoder.decode(chunk, final=self.eof)
+            except ValueError as e:
+                raise self.error(e)
+        if self.eof:
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Skip the whitespace and return the next character, empty string at the end of the document."""
+        while True:
+            self.pos = _whitespace.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars):
+        """Consume the next character, it has to be one of the expected ones."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error("Expecting one of {0!r} at {1!r}".format(chars, self.buf[self.pos:self.pos + 20]))
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decode(self.buf, self.pos)
+            except ValueError as e:
+                if not self.fill():
+                    raise self.error(e)
+                continue
+            # A bare number that runs up to the end of the buffer may continue in the next chunk, e.g. 1 of 1.5.
+            if self.buf[self.pos] in _NUMBER_START and _number_tail.match(self.buf, end).end() == len(self.buf):
+                if self.fill():
+                    continue
+            self.pos = end
+            return value
+
+    def find(self, key):
+        """Walk the object members until the key is found.
+
+        :return: True if the reader is positioned at the value of the key.
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return False
+        while True:
+            if self.value() == key:
+                self.expect(":")
+                return True
+            self.expect(":")
+            self.value()
+            if self.expect(",}") == "}":
+                return False
+
+    def items(self):
+        """Iterate over the array items one by one."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.expect(",]") == "]":
+                return
+
+
+def _load_item(item_type, value, output):
+    plan = getattr(item_type, "__plan__", None)
+    if plan is None:
+        return item_type.deserialize(value)
+    if output is None:
+        return plan.deserialize(value)
+    result = output()
+    plan.deserialize(value, result)
+    return result
+
+
+def iter_deserialize(schema, fp, name, output=None, chunk_size=None):
+    """Deserialize the list items of the attribute one by one from the JSON document.
+
+    The document is scanned until the attribute's compartment and key are found, other members are skipped.
+    Items are deserialized as soon as they are read. Validation errors of the items are collected with the
+    item indices and raised when the list is exhausted, the valid items are yielded anyway.
+
+    :param schema: Schema class.
+    :param fp: File-like object to read the JSON document from, bytes or text.
+    :param name: Name of the schema attribute of the list type, e.g. embedded list.
+    :param output: Factory of the output objects for the items. The items are assigned to them using the
+        accessors of the item schema. When omitted dicts of deserialized values are yielded.
+    :param chunk_size: Size of the chunks read from the file, `CHUNK_SIZE` by default.
+    :return: Iterator of the deserialized items.
+    :raises: ValidationError.
+    """
+    attr = next((attr for attr in schema.__attrs__ if attr.name == name), None)
+    item_type = getattr(getattr(attr, "attr_type", None), "item_type", None)
+    if item_type is None:
+        raise ValueError("{0} has no list attribute {1!r}.".format(schema.__name__, name))
+
+    reader = _Reader(fp, chunk_size or CHUNK_SIZE)
+    found = (attr.compartment is None or reader.find(attr.compartment)) and reader.find(attr.key)
+    if not found:
+        if attr.required:
+            error = exceptions.ValidationError("Missing attribute.", attr.name)
+            error.attr = attr.name
+            raise exceptions.ValidationError([error])
+        return
+
+    errors = []
+    for index, value in enumerate(reader.items()):
+        try:
+            yield _load_item(item_type, value, output)
+        except exceptions.ValidationError as e:
+            e.attr = index
+            errors.append(e)
+
+    if errors:
+        raise exceptions.ValidationError([exceptions.ValidationError(errors, attr.name)])
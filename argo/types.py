@@ -1,10 +1,17 @@
 """Argo basic types."""
 
+import functools
+
+from . import exceptions
+from . import validators
+
 
 class Type(object):
 
     """Base class for creating types."""
 
+    __slots__ = ("validators", )
+
     def __init__(self, validators=None, *args, **kwargs):
         """Type constructor.
 
@@ -47,16 +54,90 @@ class List(Type):
 
     """List type for Argo schema attribute."""
 
-    def __init__(self, item_type=None):
-        """Create a new List."""
+    __slots__ = ("item_type", "parallel")
+
+    def __init__(self, item_type=None, parallel=None):
+        """Create a new List.
+
+        :param item_type: Type or Schema of the list items.
+        :param parallel: :class:`argo.parallel.ProcessPool` that serializes large lists of schemas in
+            worker processes.
+        """
         super(List, self).__init__()
         self.item_type = item_type or Type()
+        self.parallel = parallel
 
     def serialize(self, value, **kwargs):
-        """Overrided serialize for returning list of value's items."""
+        """Overrided serialize for returning list of value's items.
+
+        Schemas that don't override `serialize` serialize all the items at once with their `serialize_many`,
+        or with the process pool if the list is parallel.
+        """
+        from . import compiler
+
+        if compiler.schema_type(self.item_type) is not None:
+            if self.parallel is not None:
+                return self.parallel.serialize_many(self.item_type, value, **kwargs)
+            return self.item_type.serialize_many(value, **kwargs)
         return [self.item_type.serialize(val, **kwargs) for val in value]
 
+    def deserialize(self, value, fail_fast=False):
+        """Deserialize the list and its items with the item type.
+
+        Items of the types that don't override the deserialization are validated all at once with the
+        `validate_many` of the item validators. Values that aren't lists or tuples are only validated by the
+        validators of the list.
+
+        :param fail_fast: Only report the error of the first invalid item, schemas of the items stop at their
+            first error.
+
+        :raises: :class:`argo.exception.ValidationError` with the errors of all the invalid items,
+            the attr of each error is the index of the item.
+        """
+        value = super(List, self).deserialize(value)
+        if not isinstance(value, (list, tuple)):
+            return value
+
+        item_type = self.item_type
+        if isinstance(item_type, Type) and type(item_type).deserialize is Type.deserialize:
+            errors = {}
+            for validator in item_type.validators:
+                try:
+                    if hasattr(validator, "validate_many"):
+                        validator.validate_many(value)
+                    else:
+                        validators.validate_many(validator, value)
+                except exceptions.ValidationError as e:
+                    # Only the first failed validator of the item is reported, the same as for a single value.
+                    for error in e.errors:
+                        errors.setdefault(error.attr, error)
+            if errors:
+                indices = [min(errors)] if fail_fast else sorted(errors)
+                raise exceptions.ValidationError([errors[index] for index in indices])
+            return value
+
+        deserialize = item_type.deserialize
+        if fail_fast and getattr(item_type, "__plan__", None) is not None:
+            # Schemas of the items, see `argo.schema.FAIL_FAST`.
+            deserialize = functools.partial(deserialize, mode="fail_fast")
+
+        errors = []
+        result = []
+        for index, item in enumerate(value):
+            try:
+                result.append(deserialize(item))
+            except exceptions.ValidationError as e:
+                e.attr = index
+                errors.append(e)
+                if fail_fast:
+                    break
+        if errors:
+            raise exceptions.ValidationError(errors)
+        return result
+
 
 class String(Type):
 
     """String type."""
+
+    __slots__ = ()
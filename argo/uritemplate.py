@@ -0,0 +1,248 @@
+"""URI templates (RFC 6570, levels 1 to 3) compiled into formatter functions.
+
+.. code-block:: python
+
+    template = URITemplate("/spells/{uid}{?school,level}")
+    template.expand({"uid": 1, "level": 3})  # "/spells/1?level=3"
+    template.serialize(spell)  # the variables are the attributes of the spell
+
+The template is parsed once and compiled into a function that reads the variables, encodes them and joins
+them with the literal parts, so no parsing happens when the links are built. Variable names are attribute
+names or dot-separated attribute paths of the serialized value.
+
+Variables that are None or missing are undefined and are skipped according to the RFC. Lists and tuples are
+joined with commas, other values are converted to strings.
+"""
+
+import re
+
+from . import codecache
+from . import compiler
+from . import schema
+from . import types
+
+try:
+    from urllib.parse import quote
+except ImportError:  # pragma: no cover
+    from urllib import quote
+
+UNRESERVED = "-._~"
+"""Characters that are not encoded besides the letters and the digits."""
+
+RESERVED = ":/?#[]@!$&'()*+,;="
+"""Characters that are not encoded by the reserved expansion (`+` and `#` operators)."""
+
+# Operator: (first, separator, named, if empty, allow reserved)
+OPERATORS = {
+    "": ("", ",", False, "", False),
+    "+": ("", ",", False, "", True),
+    "#": ("#", ",", False, "", True),
+    ".": (".", ".", False, "", False),
+    "/": ("/", "/", False, "", False),
+    ";": (";", ";", True, "", False),
+    "?": ("?", "&", True, "=", False),
+    "&": ("&", "&", True, "=", False),
+}
+
+_EXPRESSION = re.compile(r"\{([^{}]*)\}")
+_VARNAME = re.compile(r"^(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2})+(?:\.(?:[A-Za-z0-9_]|%[0-9A-Fa-f]{2})+)*$")
+_PLAIN = re.compile(r"^[A-Za-z0-9\-._~]*$")
+_PLAIN_RESERVED = re.compile(r"^[A-Za-z0-9\-._~:/?#\[\]@!$&'()*+,;=]*$")
+_LONE_PERCENT = re.compile(r"%(?![0-9A-Fa-f]{2})")
+
+
+def _quote(text, safe):
+    if schema.PY2 and isinstance(text, unicode):  # noqa: F821
+        text = text.encode("utf-8")
+    return quote(text, safe)
+
+
+def _text(value):
+    if isinstance(value, schema.string_types):
+        return value
+    return str(value)
+
+
+def encode(value):
+    """Encode the variable value for the simple expansion.
+
+    :return: Encoded string or None if the value is undefined.
+    """
+    if type(value) is int:
+        # Digits are never encoded.
+        return str(value)
+    if isinstance(value, schema.string_types) and _PLAIN.match(value):
+        return value
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return None
+        return ",".join(_quote(_text(item), UNRESERVED) for item in value)
+    return _quote(_text(value), UNRESERVED)
+
+
+def encode_reserved(value):
+    """Encode the variable value for the reserved expansion, keeping the reserved and pct-encoded characters.
+
+    :return: Encoded string or None if the value is undefined.
+    """
+    if type(value) is int:
+        return str(value)
+    if isinstance(value, schema.string_types) and _PLAIN_RESERVED.match(value):
+        return value
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return None
+        return ",".join(encode_reserved(item) for item in value)
+    return _LONE_PERCENT.sub("%25", _quote(_text(value), UNRESERVED + RESERVED + "%"))
+
+
+def parse(template):
+    """Parse the template.
+
+    :return: List of literal strings and (operator, variable names) tuples of the expressions.
+    :raises: ValueError if the template is not valid or uses the level 4 features.
+    """
+    parts = []
+    position = 0
+    for match in _EXPRESSION.finditer(template):
+        parts.append(template[position:match.start()])
+        position = match.end()
+
+        expression = match.group(1)
+        operator = expression[:1] if expression[:1] in OPERATORS else ""
+        names = expression[len(operator):].split(",")
+        for name in names:
+            if name.endswith("*") or ":" in name:
+                raise ValueError("Value modifiers are not supported: {0!r}".format(template))
+            if not _VARNAME.match(name):
+                raise ValueError("Invalid expression {0!r} of the template {1!r}".format(expression, template))
+        parts.append((operator, names))
+    parts.append(template[position:])
+
+    for part in parts:
+        if isinstance(part, schema.string_types) and ("{" in part or "}" in part):
+            raise ValueError("Unbalanced braces in the template {0!r}".format(template))
+    return [part for part in parts if part != ""]
+
+
+_FUNCTION = """\
+def {name}({arg}):
+    s = ''
+{body}
+    return s
+"""
+
+
+def _get_path(w, name):
+    """Write the code getting the variable from the attribute path of the serialized value into `v`.
+
+    Paths are read the same way as by `schema.Accessor`, missing attributes are undefined variables.
+    """
+    w.block("try:")
+    compiler.write_path(w, name.split("."), None)
+    w.end()
+    w.line("except (AttributeError, KeyError):")
+    w.line("    v = None")
+
+
+def _get_variable(w, name):
+    """Write the code getting the variable from the dict of the variables into `v`."""
+    w.line("v = variables.get({0!r})".format(name))
+
+
+def _write(w, parts, get):
+    """Write the body of the formatter function.
+
+    :param get: Function of the writer and the variable name that writes the code getting its value into `v`.
+    """
+    for part in parts:
+        if not isinstance(part, tuple):
+            w.line("s += {0!r}".format(encode_reserved(part)))
+            continue
+
+        first, separator, named, empty, reserved = OPERATORS[part[0]]
+        encoder = "_encode_reserved" if reserved else "_encode"
+        if len(part[1]) == 1:
+            name = part[1][0]
+            get(w, name)
+            w.line("t = {0}(v)".format(encoder))
+            w.line("if t is not None:")
+            if named:
+                w.line("    s += {0!r} + t if t else {1!r}".format(first + name + "=", first + name + empty))
+            else:
+                w.line("    s += {0!r} + t".format(first) if first else "    s += t")
+            continue
+
+        w.line("p = []")
+        for name in part[1]:
+            get(w, name)
+            w.line("t = {0}(v)".format(encoder))
+            w.line("if t is not None:")
+            if named:
+                w.line("    p.append({0!r} + t if t else {1!r})".format(name + "=", name + empty))
+            else:
+                w.line("    p.append(t)")
+        w.line("if p:")
+        w.line("    s += {0!r} + {1!r}.join(p)".format(first, separator))
+
+
+def _function(name, arg, parts, get):
+    """Source of the formatter function."""
+    w = compiler.Writer()
+    _write(w, parts, get)
+    return _FUNCTION.format(name=name, arg=arg, body=compiler.indent(w.lines, 1))
+
+
+class URITemplate(types.Type):
+
+    """URI template type that serializes the value into the expanded URI.
+
+    Templates are equal if their strings are equal, so the links with the same template share their link schema.
+    """
+
+    __slots__ = ("template", "variables", "format", "render")
+
+    def __init__(self, template, validators=None):
+        """Parse and compile the template.
+
+        :param template: URI template string.
+        :raises: ValueError if the template is not valid.
+        """
+        super(URITemplate, self).__init__(validators)
+        self.template = template
+
+        parts = parse(template)
+        self.variables = [name for part in parts if isinstance(part, tuple) for name in part[1]]
+
+        namespace = {"_encode": encode, "_encode_reserved": encode_reserved}
+        source = "\n".join((
+            _function("format", "value", parts, _get_path),
+            _function("render", "variables", parts, _get_variable),
+        ))
+        exec(codecache.compile_code(source, "<argo uri template {0!r}>".format(template)), namespace)
+        self.format = namespace["format"]
+        self.render = namespace["render"]
+
+    def serialize(self, value):
+        """Expand the template with the attributes of the value."""
+        return self.format(value)
+
+    def expand(self, variables):
+        """Expand the template with the dict of the variables."""
+        return self.render(variables)
+
+    def __eq__(self, other):
+        return isinstance(other, URITemplate) and self.template == other.template
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((URITemplate, self.template))
+
+    def __repr__(self):
+        return "<{0} {1!r}>".format(self.__class__.__name__, self.template)
@@ -1,12 +1,72 @@
 """Halogen basic type validators."""
 
+import itertools
+import operator
+
 from argo import exceptions
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def _outside(values, low, high):
+    """Find the values outside of the range.
+
+    Numeric values are compared at once with NumPy when it is installed, other values are compared without
+    a Python loop.
+
+    :return: Tuple of the lists of the indices of the values less than low and greater than high.
+    """
+    if numpy is not None:
+        array = numpy.asarray(values)
+        if array.ndim == 1 and array.dtype.kind in "biuf":
+            less = numpy.flatnonzero(array < low).tolist() if low is not None else []
+            greater = numpy.flatnonzero(array > high).tolist() if high is not None else []
+            return less, greater
+
+    less = greater = []
+    if low is not None:
+        less = list(itertools.compress(itertools.count(), map(operator.lt, values, itertools.repeat(low))))
+    if high is not None:
+        greater = list(itertools.compress(itertools.count(), map(operator.gt, values, itertools.repeat(high))))
+    return less, greater
+
+
+def _raise_many(failures):
+    """Raise the validation error of the values.
+
+    :param failures: List of (index, message) tuples.
+    :raises: ValidationError which errors are the errors of the values with the index as the attr.
+    """
+    if failures:
+        failures.sort(key=lambda failure: failure[0])
+        raise exceptions.ValidationError([exceptions.ValidationError(message, index) for index, message in failures])
+
+
+def validate_many(validator, values):
+    """Validate every value of the list one by one with the validator, see `Validator.validate_many`.
+
+    Validators that don't implement `validate_many` are applied with this function.
+    """
+    errors = []
+    for index, value in enumerate(values):
+        try:
+            validator.validate(value)
+        except exceptions.ValidationError as e:
+            e.attr = index
+            errors.append(e)
+    if errors:
+        raise exceptions.ValidationError(errors)
+
 
 class Validator(object):
 
     """Base validator."""
 
+    __slots__ = ()
+
     @classmethod
     def validate(cls, value):
         """Validate the value.
@@ -16,11 +76,26 @@ class Validator(object):
         :raises: :class:`halogen.exception.ValidationError` exception when value is invalid.
         """
 
+    def validate_many(self, values):
+        """Validate every value of the list.
+
+        :param values: List of values to validate.
+
+        :raises: :class:`argo.exception.ValidationError` exception with the errors of all the invalid values,
+            the attr of each error is the index of the value.
+        """
+        validate_many(self, values)
+
 
 class Length(Validator):
 
     """Length validator that checks the length of a List-like type."""
 
+    __slots__ = ("min", "max")
+
+    min_message = "Length is less than {0}"
+    max_message = "Length is greater than {0}"
+
     def __init__(self, min=None, max=None):
         """Length validator constructor.
 
@@ -44,16 +119,36 @@ class Length(Validator):
             length = 0
 
         if self.min is not None and length < self.min:
-            raise exceptions.ValidationError("Length is less than {0}".format(self.min))
+            raise exceptions.ValidationError(exceptions.Message(self.min_message, self.min))
 
         if self.max is not None and length > self.max:
-            raise exceptions.ValidationError("Length is greater than {0}".format(self.max))
+            raise exceptions.ValidationError(exceptions.Message(self.max_message, self.max))
+
+    def validate_many(self, values):
+        """Validate the lengths of all the lists at once, see `Validator.validate_many`."""
+        lengths = []
+        for value in values:
+            try:
+                lengths.append(len(value))
+            except TypeError:
+                lengths.append(0)
 
+        less, greater = _outside(lengths, self.min, self.max)
+        _raise_many(
+            [(index, exceptions.Message(self.min_message, self.min)) for index in less] +
+            [(index, exceptions.Message(self.max_message, self.max)) for index in greater]
+        )
 
-class Range(object):
+
+class Range(Validator):
 
     """Range validator."""
 
+    __slots__ = ("min", "max")
+
+    min_message = "Value is less than minimum value '{0}'."
+    max_message = "Value is greater than maximum value '{0}'."
+
     def __init__(self, min=None, max=None):
         """Range validator constructor.
 
@@ -73,8 +168,16 @@ class Range(object):
         """
         if self.min is not None:
             if value < self.min:
-                raise exceptions.ValidationError("Value is less than minimum value '{0}'.".format(self.min))
+                raise exceptions.ValidationError(exceptions.Message(self.min_message, self.min))
 
         if self.max is not None:
             if value > self.max:
-                raise exceptions.ValidationError("Value is greater than maximum value '{0}'.".format(self.max))
+                raise exceptions.ValidationError(exceptions.Message(self.max_message, self.max))
+
+    def validate_many(self, values):
+        """Validate all the values at once, see `Validator.validate_many`."""
+        less, greater = _outside(values, self.min, self.max)
+        _raise_many(
+            [(index, exceptions.Message(self.min_message, self.min)) for index in less] +
+            [(index, exceptions.Message(self.max_message, self.max)) for index in greater]
+        )
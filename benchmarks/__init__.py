@@ -0,0 +1,4 @@
+"""Benchmarks of argo.
+
+Run the whole suite offline with ``python -m benchmarks``.
+"""
@@ -0,0 +1,101 @@
+"""Run the benchmark suite and report the operations per second and the allocations per operation.
+
+Usage::
+
+    python -m benchmarks [-k PATTERN] [--quick] [--json PATH] [--compare PATH]
+
+Results saved with ``--json`` can be compared against with ``--compare`` to see the speedup of a change.
+"""
+
+from __future__ import print_function, division
+
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+from benchmarks.suite import CASES
+
+
+def measure_time(func, repeat, min_time):
+    """Measure the best operations per second.
+
+    :param func: Operation to measure.
+    :param repeat: Number of the measurements.
+    :param min_time: Minimal duration of one measurement in seconds.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        duration = timer.timeit(number)
+        if duration >= min_time:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+    best = min([duration] + timer.repeat(repeat - 1, number))
+    return number / best
+
+
+def measure_memory(func, number=100):
+    """Measure the bytes and the blocks allocated per operation."""
+    func()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        results = [func() for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del results
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    count = sum(stat.count_diff for stat in stats)
+    return size / number, count / number
+
+
+def run(pattern=None, quick=False):
+    """Run the cases which names contain the pattern."""
+    results = {}
+    for name, setup in CASES:
+        if pattern and pattern not in name:
+            continue
+        func = setup()
+        ops = measure_time(func, repeat=3 if quick else 5, min_time=0.05 if quick else 0.2)
+        size, blocks = measure_memory(func, number=10 if quick else 100)
+        results[name] = {"ops": ops, "bytes": size, "blocks": blocks}
+        yield name, results[name]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("-k", dest="pattern", help="Run only the cases which names contain the pattern.")
+    parser.add_argument("--quick", action="store_true", help="Shorter and less precise measurements.")
+    parser.add_argument("--json", dest="output", help="Save the results to the JSON file.")
+    parser.add_argument("--compare", dest="baseline", help="Compare with the results saved to the JSON file.")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as fp:
+            baseline = json.load(fp)
+
+    print("{0:<32} {1:>14} {2:>12} {3:>10}{4}".format(
+        "case", "ops/s", "bytes/op", "blocks/op", "  vs baseline" if baseline else ""))
+    results = {}
+    for name, result in run(args.pattern, args.quick):
+        results[name] = result
+        ratio = ""
+        if name in baseline:
+            ratio = "  {0:>10.2f}x".format(result["ops"] / baseline[name]["ops"])
+        print("{0:<32} {ops:>14,.0f} {bytes:>12,.0f} {blocks:>10,.1f}{1}".format(name, ratio, **result))
+        sys.stdout.flush()
+
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
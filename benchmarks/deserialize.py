@@ -0,0 +1,66 @@
+"""Throughput of deserializing sparse and link-heavy documents.
+
+Compares the interpreted deserialization, which raises and catches an exception for every link and every
+missing optional attribute, with the compiled deserialization plan.
+
+Usage::
+
+    python benchmarks/deserialize.py [size]
+"""
+
+import sys
+import timeit
+
+import argo
+import argo.hal
+
+
+def sparse_schema(**options):
+    """Schema with many optional attributes."""
+    attrs = dict(("field{0}".format(index), argo.Attr(required=False)) for index in range(20))
+    attrs["uid"] = argo.Attr()
+    attrs.update(options)
+    return type(argo.Schema)("Sparse", (argo.Schema, ), attrs)
+
+
+def links_schema(**options):
+    """HAL schema with many links and a few attributes."""
+    attrs = dict(
+        ("link{0}".format(index), argo.hal.Link(attr="link{0}".format(index))) for index in range(10))
+    attrs.update(uid=argo.Attr(), title=argo.Attr(), price=argo.Attr(default=0))
+    attrs.update(options)
+    return type(argo.hal.Schema)("Links", (argo.hal.Schema, ), attrs)
+
+
+def sparse(size):
+    """Documents with two of the twenty optional attributes."""
+    return [{"uid": i, "field3": "a", "field17": "b"} for i in range(size)]
+
+
+def links(size):
+    """Documents with ten links."""
+    return [
+        {
+            "_links": dict(("link{0}".format(index), {"href": "/links/{0}".format(index)}) for index in range(10)),
+            "uid": i,
+            "title": "Title {0}".format(i),
+        }
+        for i in range(size)
+    ]
+
+
+def main(size):
+    """Run the benchmark and print documents per second."""
+    for make_schema, documents in ((sparse_schema, sparse), (links_schema, links)):
+        values = documents(size)
+        for name, schema in (
+            ("interpreted", make_schema(__compiled__=False)),
+            ("compiled", make_schema()),
+        ):
+            seconds = min(timeit.repeat(lambda: [schema.deserialize(value) for value in values], number=1, repeat=3))
+            print("{0:<7} {1:>9} documents  {2:<12} {3:>12,.0f} documents/s".format(
+                schema.__name__, size, name, size / seconds))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if sys.argv[1:] else 100000)
@@ -0,0 +1,39 @@
+"""Throughput of encoding schemas into JSON.
+
+Compares encoding the serialized dict with ``json.dumps`` against ``Schema.dumps`` with the available backends.
+
+Usage::
+
+    python benchmarks/dumps.py [size ...]
+"""
+
+import json
+import sys
+import timeit
+
+from argo import backends
+
+from serialize_many import Book, Flat, books
+
+
+def main(sizes):
+    """Run the benchmark and print items per second."""
+    names = [name for name in sorted(backends.BACKENDS) if name == "json" or getattr(backends, name) is not None]
+    for schema in (Flat, Book):
+        cases = [("json.dumps(serialize)", lambda values: [json.dumps(schema.serialize(value)) for value in values])]
+        for name in names:
+            backend = backends.get_backend(name)
+            cases.append((
+                "dumps[{0}]".format(name),
+                lambda values, backend=backend: [backend.dumps_schema(schema, value, {}) for value in values],
+            ))
+        for size in sizes:
+            values = books(size)
+            for name, func in cases:
+                seconds = min(timeit.repeat(lambda: func(values), number=1, repeat=3))
+                print("{0:<5} {1:>9} items  {2:<22} {3:>12,.0f} items/s".format(
+                    schema.__name__, size, name, size / seconds))
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10000, 100000])
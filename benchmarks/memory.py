@@ -0,0 +1,52 @@
+"""Memory used by the schema definitions.
+
+Builds many HAL schemas with links, curies, embedded and plain attributes, the way services that generate
+schemas per tenant do, and reports the memory allocated per schema.
+
+Usage::
+
+    python benchmarks/memory.py [count]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+import argo
+import argo.hal
+
+
+def make_schema(index):
+    """Create a schema with the typical mix of attributes."""
+    curie = argo.hal.Curie("doc", "/docs/{rel}", templated=True)
+    attrs = {
+        "self": argo.hal.Link(attr=lambda value: "/items/{0}".format(value["uid"])),
+        "parent": argo.hal.Link(attr="parent", required=False),
+        "search": argo.hal.Link(attr=lambda value: "/search{?q}", templated=True),
+        "help": argo.hal.Link("/help", type="text/html"),
+        "rel": argo.hal.Link(attr="rel", curie=curie),
+        "tags": argo.hal.Embedded(argo.types.List(argo.Schema)),
+    }
+    for field in range(10):
+        attrs["field{0}".format(field)] = argo.Attr(attr="field{0}".format(field), required=False)
+    return type(argo.hal.Schema)("Tenant{0}".format(index), (argo.hal.Schema, ), attrs)
+
+
+def main(count):
+    """Create the schemas and print the allocated memory."""
+    make_schema(-1)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    schemas = [make_schema(index) for index in range(count)]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print("{0} schemas  {1:>10,.0f} KiB  {2:>8,.1f} KiB per schema".format(
+        len(schemas), size / 1024.0, size / 1024.0 / count))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if sys.argv[1:] else 1000)
@@ -0,0 +1,80 @@
+"""Throughput of serializing collections of schemas.
+
+Compares the interpreted per-item serialization (what ``List(Schema)`` used to do), the compiled per-item
+serialization and ``Schema.serialize_many``.
+
+Usage::
+
+    python benchmarks/serialize_many.py [size ...]
+"""
+
+import sys
+import timeit
+
+import argo
+import argo.hal
+
+
+class Flat(argo.Schema):
+
+    """Flat schema of dicts."""
+
+    __source__ = dict
+
+    uid = argo.Attr()
+    title = argo.Attr()
+    author = argo.Attr(attr="author.name")
+
+
+class Genre(argo.hal.Schema):
+
+    """Nested schema."""
+
+    self = argo.hal.Link(attr=lambda genre: "/genres/" + genre["uid"])
+    title = argo.Attr()
+
+
+class Book(argo.hal.Schema):
+
+    """Collection item schema."""
+
+    self = argo.hal.Link(attr=lambda book: "/books/" + book["uid"])
+    shop = argo.hal.Link("/shop")
+    title = argo.Attr()
+    author = argo.Attr(attr="author.name")
+    price = argo.Attr(required=False)
+    kind = argo.Attr("book")
+    genre = argo.hal.Embedded(Genre)
+
+
+def books(size):
+    """Generate the source data."""
+    return [
+        {
+            "uid": str(i),
+            "title": "Book {0}".format(i),
+            "author": {"name": "Author {0}".format(i % 100)},
+            "genre": {"uid": "fantasy", "title": "Fantasy"},
+        }
+        for i in range(size)
+    ]
+
+
+def main(sizes):
+    """Run the benchmark and print items per second."""
+    for schema in (Flat, Book):
+        cases = [
+            ("interpreted", lambda values: [schema.interpret(value) for value in values]),
+            ("serialize", lambda values: [schema.serialize(value) for value in values]),
+            ("serialize_many", schema.serialize_many),
+        ]
+        for size in sizes:
+            values = books(size)
+            for name, func in cases:
+                seconds = min(timeit.repeat(lambda: func(values), number=1, repeat=3))
+                print("{0:<5} {1:>9} items  {2:<16} {3:>12,.0f} items/s".format(
+                    schema.__name__, size, name, size / seconds))
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [10000, 100000])
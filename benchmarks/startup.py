@@ -0,0 +1,72 @@
+"""Startup time of the schema definitions with and without the code cache.
+
+Defines and compiles the schemas of `benchmarks/memory.py` in fresh processes: without the cache, with an empty
+(cold) cache and with the (warm) cache filled by the previous process. Reports the time of the definitions and of
+the compilation, which happens on the first use of the schemas.
+
+Usage::
+
+    python benchmarks/startup.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import timeit
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(count, path):
+    """Define and compile the schemas and print the times and the cache hits."""
+    import argo.codecache
+
+    from memory import make_schema
+
+    cache = argo.codecache.enable(path) if path else None
+    start = timeit.default_timer()
+    schemas = [make_schema(index) for index in range(count)]
+    defined = timeit.default_timer()
+    for schema in schemas:
+        schema.compile()
+    compiled = timeit.default_timer()
+    print(defined - start, compiled - defined, cache.hits if cache else 0, cache.misses if cache else 0)
+
+
+def run(count, path=""):
+    """Run the child process with this checkout of argo importable."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, env.get("PYTHONPATH")]))
+    output = subprocess.check_output([sys.executable, __file__, "--child", str(count), path], env=env)
+    defined, compiled, hits, misses = output.split()
+    return float(defined), float(compiled), int(hits), int(misses)
+
+
+def main(count):
+    """Run the processes and print the results."""
+    path = tempfile.mkdtemp()
+    try:
+        results = [
+            ("no cache", run(count)),
+            ("cold cache", run(count, path)),
+            ("warm cache", run(count, path)),
+        ]
+    finally:
+        shutil.rmtree(path)
+
+    baseline = sum(results[0][1][:2])
+    for name, (defined, compiled, hits, misses) in results:
+        print("{0:<12} {1} schemas  define {2:>7.3f} s  compile {3:>7.3f} s  {4:>6.2f}x  {5:>6} hits  "
+              "{6:>6} misses".format(name, count, defined, compiled, baseline / (defined + compiled), hits, misses))
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(int(sys.argv[2]), sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if sys.argv[1:] else 1000)
@@ -0,0 +1,245 @@
+"""Benchmark cases of the serialization, deserialization and HAL paths.
+
+Every case is a function that prepares its schemas and data and returns the operation to measure. One call of
+the operation is one op, e.g. one serialized value or one serialized list.
+"""
+
+import argo
+import argo.hal
+from argo import exceptions, validators
+
+from benchmarks import deserialize
+
+CASES = []
+
+
+def case(name):
+    """Register the benchmark case."""
+    def register(func):
+        CASES.append((name, func))
+        return func
+    return register
+
+
+class Obj(object):
+
+    """Value with the attributes instead of dict keys."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+FLAT = dict(("field{0}".format(index), index) for index in range(10))
+
+
+def flat_schema(**options):
+    attrs = dict(("field{0}".format(index), argo.Attr()) for index in range(10))
+    attrs.update(options)
+    return type(argo.Schema)("Flat", (argo.Schema, ), attrs)
+
+
+@case("serialize/flat-dict")
+def serialize_flat_dict():
+    schema = flat_schema()
+    return lambda: schema.serialize(FLAT)
+
+
+@case("serialize/flat-dict-source")
+def serialize_flat_dict_source():
+    schema = flat_schema(__source__=dict)
+    return lambda: schema.serialize(FLAT)
+
+
+@case("serialize/flat-object")
+def serialize_flat_object():
+    schema = flat_schema()
+    value = Obj(**FLAT)
+    return lambda: schema.serialize(value)
+
+
+@case("serialize/flat-interpreted")
+def serialize_flat_interpreted():
+    schema = flat_schema()
+    return lambda: schema.interpret(FLAT)
+
+
+@case("serialize/deep-path")
+def serialize_deep_path():
+    class Deep(argo.Schema):
+        dict_path = argo.Attr(attr="a.b.c.d")
+        object_path = argo.Attr(attr="o.b.c.d")
+        optional_path = argo.Attr(attr="a.b.missing.d", required=False)
+
+    value = {"a": {"b": {"c": {"d": 1}}}, "o": Obj(b=Obj(c=Obj(d=2)))}
+    return lambda: Deep.serialize(value)
+
+
+@case("serialize/callable-context")
+def serialize_callable_context():
+    class Context(argo.Schema):
+        url = argo.Attr(attr=lambda value, base="": base + value["path"])
+        name = argo.Attr(attr=lambda value: value["name"])
+
+    value = {"path": "/a", "name": "a"}
+    return lambda: Context.serialize(value, base="http://example.com", unused=None)
+
+
+class Item(argo.Schema):
+
+    """Item of the nested lists."""
+
+    uid = argo.Attr()
+    title = argo.Attr()
+    price = argo.Attr(default=0)
+
+
+ITEMS = [{"uid": index, "title": "Item {0}".format(index)} for index in range(100)]
+
+
+@case("serialize/list-100")
+def serialize_list():
+    class Order(argo.Schema):
+        uid = argo.Attr()
+        items = argo.Attr(argo.types.List(Item))
+
+    value = {"uid": 1, "items": ITEMS}
+    return lambda: Order.serialize(value)
+
+
+@case("serialize/many-100")
+def serialize_many():
+    return lambda: Item.serialize_many(ITEMS)
+
+
+CURIE = argo.hal.Curie("doc", "/docs/{rel}", templated=True)
+
+
+class Author(argo.hal.Schema):
+
+    """Embedded HAL resource."""
+
+    self = argo.hal.Link(attr=lambda author: "/authors/{0}".format(author["uid"]))
+    name = argo.Attr()
+
+
+class Book(argo.hal.Schema):
+
+    """HAL resource with links, link lists, curies and embedded resources."""
+
+    self = argo.hal.Link(attr=lambda book: "/books/{0}".format(book["uid"]))
+    search = argo.hal.Link(attr=lambda book: "/books{?q}", templated=True)
+    help = argo.hal.Link("/help", type="text/html")
+    related = argo.hal.LinkList(attr="related", curie=CURIE)
+    title = argo.Attr()
+    author = argo.hal.Embedded(Author, curie=CURIE)
+    reviews = argo.hal.Embedded(argo.types.List(Author))
+
+
+BOOK = {
+    "uid": 1,
+    "title": "Book",
+    "related": ["/books/2", "/books/3"],
+    "author": {"uid": 1, "name": "Ann"},
+    "reviews": [{"uid": index, "name": "Reviewer"} for index in range(10)],
+}
+
+
+@case("hal/serialize")
+def hal_serialize():
+    return lambda: Book.serialize(BOOK)
+
+
+@case("hal/dumps")
+def hal_dumps():
+    return lambda: Book.dumps(BOOK)
+
+
+@case("hal/iter-serialize")
+def hal_iter_serialize():
+    return lambda: "".join(Book.iter_serialize(BOOK))
+
+
+def link_schema(**links):
+    return type(argo.hal.Schema)("Links", (argo.hal.Schema, ), dict(links, uid=argo.Attr()))
+
+
+SPELL = {"uid": 1, "school": {"uid": 2}, "lang": "en", "related": [{"uid": index} for index in range(10)]}
+
+
+@case("hal/links-callable")
+def hal_links_callable():
+    schema = link_schema(
+        self=argo.hal.Link(attr=lambda spell: "/spells/{0}".format(spell["uid"])),
+        school=argo.hal.Link(attr=lambda spell: "/schools/{0}?lang={1}".format(spell["school"]["uid"], spell["lang"])),
+        related=argo.hal.LinkList(
+            attr=lambda spell: ["/spells/{0}".format(item["uid"]) for item in spell["related"]]),
+    )
+    return lambda: schema.serialize(SPELL)
+
+
+@case("hal/links-template")
+def hal_links_template():
+    schema = link_schema(
+        self=argo.hal.Link(template="/spells/{uid}"),
+        school=argo.hal.Link(template="/schools/{school.uid}{?lang}"),
+        related=argo.hal.LinkList(template="/spells/{uid}", attr="related"),
+    )
+    return lambda: schema.serialize(SPELL)
+
+
+@case("deserialize/flat")
+def deserialize_flat():
+    schema = flat_schema()
+    return lambda: schema.deserialize(FLAT)
+
+
+@case("deserialize/loads")
+def deserialize_loads():
+    schema = flat_schema()
+    data = schema.dumps(FLAT)
+    return lambda: schema.loads(data)
+
+
+@case("deserialize/sparse")
+def deserialize_sparse():
+    schema = deserialize.sparse_schema()
+    value = deserialize.sparse(1)[0]
+    return lambda: schema.deserialize(value)
+
+
+@case("deserialize/links")
+def deserialize_links():
+    schema = deserialize.links_schema()
+    value = deserialize.links(1)[0]
+    return lambda: schema.deserialize(value)
+
+
+@case("deserialize/range-100k")
+def deserialize_range():
+    class Series(argo.Schema):
+        values = argo.Attr(argo.types.List(argo.types.Type(validators=[validators.Range(min=0, max=1000)])))
+
+    value = {"values": [index % 1000 for index in range(100000)]}
+    return lambda: Series.deserialize(value)
+
+
+def deserialize_errors(mode):
+    attrs = dict(
+        ("field{0}".format(index), argo.Attr(argo.types.Type(validators=[validators.Length(max=1)])))
+        for index in range(50)
+    )
+    attrs.update(("missing{0}".format(index), argo.Attr()) for index in range(50))
+    schema = type(argo.Schema)("Errors", (argo.Schema, ), attrs)
+    value = dict(("field{0}".format(index), "too long") for index in range(50))
+
+    def run():
+        try:
+            schema.deserialize(value, mode=mode)
+        except exceptions.ValidationError as e:
+            return e
+
+    return run
+
+
+case("deserialize/errors-100")(lambda: deserialize_errors(argo.schema.COLLECT))
+case("deserialize/errors-100-fail-fast")(lambda: deserialize_errors(argo.schema.FAIL_FAST))
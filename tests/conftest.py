@@ -5,9 +5,8 @@ import pytest
 from fixtures.common import *
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def mocked_get_context():
     """Mock argo.schema._get_context for returning empty dict."""
-    patcher = mock.patch("argo.schema._get_context")
-    patcher.start()
-    patcher.return_value = {}
+    with mock.patch("argo.schema._get_context", return_value={}) as mocked:
+        yield mocked
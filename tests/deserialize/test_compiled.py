@@ -0,0 +1,123 @@
+"""Test the compiled deserialization."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import exceptions, validators
+
+
+class Tag(argo.Schema):
+
+    """Nested schema."""
+
+    name = argo.Attr(argo.types.Type(validators=[validators.Length(min=1)]))
+
+
+class Upper(argo.types.Type):
+
+    """Type with the deserialization."""
+
+    def deserialize(self, value):
+        if value == "missing":
+            raise KeyError(value)
+        return value.upper()
+
+
+class Custom(argo.Attr):
+
+    """Attribute that overrides the deserialization."""
+
+    def deserialize(self, value):
+        return value.get("custom", 0) + 1
+
+
+class Item(argo.hal.Schema):
+
+    """A schema with links, optional, default, nested, custom and embedded attributes."""
+
+    self = argo.hal.Link(attr=lambda item: "/items/{0}".format(item["uid"]))
+    related = argo.hal.LinkList(required=False)
+    title = argo.Attr(required=False)
+    code = argo.Attr(Upper(), required=False)
+    kind = argo.Attr(Upper())
+    price = argo.Attr(default=0.5)
+    tag = argo.Attr(Tag, required=False)
+    custom = Custom()
+    tags = argo.hal.Embedded(argo.types.List(Tag))
+    owner = argo.hal.Embedded(Tag)
+
+
+class Interpreted(Item):
+
+    """The same schema, not compiled."""
+
+    __compiled__ = False
+
+
+def errors(error):
+    """Comparable structure of the validation error."""
+    if not isinstance(error, exceptions.ValidationError):
+        return error
+    return error.attr, [errors(e) for e in error.errors]
+
+
+def deserialize(schema, value):
+    """Deserialized value, comparable validation error or the type of other errors."""
+    try:
+        return schema.deserialize(value)
+    except exceptions.ValidationError as e:
+        return errors(e)
+    except Exception as e:
+        return type(e)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"kind": "a", "_embedded": {"tags": [], "owner": {"name": "b"}}},
+        {"kind": "a", "title": "b", "code": "c", "price": 1, "tag": {"name": "d"}, "custom": 1,
+         "_links": {"self": {"href": "/items/1"}}, "_embedded": {"tags": [{}], "owner": {"name": "e"}}},
+        {},
+        {"kind": "missing", "code": "missing", "tag": {"name": ""}, "_embedded": {"owner": {}}},
+        {"kind": "a", "_embedded": None},
+        {"kind": "a", "_embedded": []},
+    ]
+)
+def test_deserialize(value):
+    """Test that the compiled deserialization returns the same result and errors as the interpreted one."""
+    assert deserialize(Item, value) == deserialize(Interpreted, value)
+
+
+def test_not_dict():
+    """Test that the values that are not dicts are deserialized field by field."""
+    for schema in (Item, Interpreted):
+        with pytest.raises(TypeError):
+            schema.deserialize(None)
+
+
+def test_output():
+    """Test that the output is updated with the accessors."""
+    output = {}
+    Item.deserialize({"kind": "a", "_embedded": {"tags": [], "owner": {"name": "b"}}}, output)
+    assert output == {"kind": "A", "price": 0.5, "custom": 1, "tags": [], "owner": {"name": "b"}}
+
+
+def test_link_deserialize():
+    """Test that the links overriding the deserialization are read by both the compiled and interpreted paths."""
+    class HrefLink(argo.hal.Link):
+        def deserialize(self, value):
+            return value["_links"][self.key]["href"]
+
+    class Linked(argo.hal.Schema):
+        self = argo.hal.Link(attr="url")
+        other = HrefLink(attr="other")
+
+    class InterpretedLinked(Linked):
+        __compiled__ = False
+
+    value = {"_links": {"self": {"href": "/self"}, "other": {"href": "/a"}}}
+    assert Linked.deserialize(value) == InterpretedLinked.deserialize(value) == {"other": "/a"}
+    assert Linked.loads(json.dumps(value)) == {"other": "/a"}
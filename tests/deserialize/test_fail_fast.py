@@ -0,0 +1,123 @@
+"""Test the fail fast deserialization and the lazy error messages."""
+
+import json
+
+import pytest
+
+import argo
+from argo import exceptions, schema, validators
+
+
+class Point(argo.Schema):
+
+    """Item schema."""
+
+    x = argo.Attr(argo.types.Type(validators=[validators.Range(min=0)]))
+    y = argo.Attr(argo.types.Type(validators=[validators.Range(min=0)]))
+
+
+class Shape(argo.Schema):
+
+    """Schema with a nested schema and lists."""
+
+    name = argo.Attr(argo.types.Type(validators=[validators.Length(max=3)]))
+    center = argo.Attr(Point)
+    points = argo.Attr(argo.types.List(Point))
+    weights = argo.Attr(argo.types.List(argo.types.Type(validators=[validators.Range(max=1)])))
+
+
+class Interpreted(Shape):
+
+    """The same schema, not compiled."""
+
+    __compiled__ = False
+
+
+def errors(error):
+    """Comparable structure of the validation error."""
+    if not isinstance(error, exceptions.ValidationError):
+        return error
+    return error.attr, [errors(e) for e in error.errors]
+
+
+def first_error(func, *args, **kwargs):
+    with pytest.raises(exceptions.ValidationError) as error:
+        func(*args, **kwargs)
+    return errors(error.value)
+
+
+INVALID = {
+    "name": "long",
+    "center": {"x": -1, "y": -1},
+    "points": [{"x": 0, "y": 0}, {"x": -1, "y": -1}, {}],
+    "weights": [0, 2, 3],
+}
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (INVALID, (None, [("name", ["Length is greater than 3"])])),
+        (dict(INVALID, name="a"), (None, [("center", [("x", ["Value is less than minimum value '0'."])])])),
+        (
+            dict(INVALID, name="a", center={"x": 0, "y": 0}),
+            (None, [("points", [(1, [("x", ["Value is less than minimum value '0'."])])])]),
+        ),
+        (
+            dict(INVALID, name="a", center={"x": 0, "y": 0}, points=[]),
+            (None, [("weights", [(1, ["Value is greater than maximum value '1'."])])]),
+        ),
+    ]
+)
+@pytest.mark.parametrize("shape", [Shape, Interpreted])
+def test_fail_fast(shape, value, expected):
+    """Test that only the first error is reported, also by the nested schemas and lists."""
+    assert first_error(shape.deserialize, value, mode=schema.FAIL_FAST) == expected
+    assert first_error(shape.loads, json.dumps(value), mode=schema.FAIL_FAST) == expected
+
+
+def test_fail_fast_nested():
+    """Test that the schemas nested at any depth stop at their first error."""
+    class Polygon(argo.Schema):
+        shape = argo.Attr(Interpreted)
+
+    class InterpretedPolygon(Polygon):
+        __compiled__ = False
+
+    value = {"shape": dict(INVALID, name="a", center={"x": 0, "y": 0})}
+    expected = (None, [("shape", [("points", [(1, [("x", ["Value is less than minimum value '0'."])])])])])
+    assert first_error(Polygon.deserialize, value, mode=schema.FAIL_FAST) == expected
+    assert first_error(InterpretedPolygon.deserialize, value, mode=schema.FAIL_FAST) == expected
+
+
+def test_collect():
+    """Test that all the errors are reported by default."""
+    assert first_error(Shape.deserialize, INVALID) == first_error(Interpreted.deserialize, INVALID)
+    assert len(first_error(Shape.deserialize, INVALID)[1]) == 4
+
+
+def test_unknown_mode():
+    """Test that the unknown mode is reported."""
+    with pytest.raises(ValueError):
+        Shape.deserialize({}, mode="unknown")
+
+
+def test_message():
+    """Test that the message is formatted once, when the errors are read."""
+    class Format(object):
+        calls = 0
+
+        def __format__(self, spec):
+            Format.calls += 1
+            return "formatted"
+
+    message = exceptions.Message("Value {0}", Format())
+    error = exceptions.ValidationError([exceptions.ValidationError(message, "attr")])
+    assert Format.calls == 0
+
+    assert error.to_dict() == {"errors": {"attr": ["Value formatted"]}}
+    assert Format.calls == 1
+    assert isinstance(error.errors[0].errors[0], str)
+    assert json.dumps(error.errors[0].errors) == '["Value formatted"]'
+    assert Format.calls == 1
+    assert message == "Value formatted" and message != "Value"
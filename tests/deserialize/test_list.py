@@ -0,0 +1,104 @@
+"""Test the deserialization of lists and the batch validation."""
+
+import pytest
+
+import argo
+from argo import exceptions, validators
+
+
+def errors(error):
+    """Comparable structure of the validation error."""
+    if not isinstance(error, exceptions.ValidationError):
+        return error
+    return error.attr, [errors(e) for e in error.errors]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Run with the NumPy vectorized validation if it is installed and with the pure Python one."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(validators, "numpy", None)
+    return request.param
+
+
+@pytest.mark.parametrize(
+    ("validator", "values"),
+    [
+        (validators.Range(min=0, max=10), [5, -1, 10, 11, 0.5, 100]),
+        (validators.Range(min=0), [1.5, -0.5, 2]),
+        (validators.Range(max="m"), ["a", "z", "m"]),
+        (validators.Length(min=1, max=2), [[], [1], [1, 2, 3], "ab", None]),
+    ]
+)
+def test_validate_many(backend, validator, values):
+    """Test that every offending index is reported with the same errors as validating values one by one."""
+    expected = []
+    for index, value in enumerate(values):
+        try:
+            validator.validate(value)
+        except exceptions.ValidationError as e:
+            expected.append((index, errors(e)[1]))
+
+    with pytest.raises(exceptions.ValidationError) as error:
+        validator.validate_many(values)
+    assert [(e.attr, errors(e)[1]) for e in error.value.errors] == expected
+
+
+def test_validate_many_valid(backend):
+    """Test that the valid values pass."""
+    validators.Range(min=0, max=100).validate_many(list(range(100)))
+    validators.Length(max=1).validate_many([[], "a"])
+
+
+class Point(argo.Schema):
+
+    """Item schema."""
+
+    x = argo.Attr(argo.types.Type(validators=[validators.Range(min=0)]))
+
+
+class Shape(argo.Schema):
+
+    """Schema with lists."""
+
+    points = argo.Attr(argo.types.List(Point))
+    weights = argo.Attr(argo.types.List(argo.types.Type(
+        validators=[validators.Range(min=0), validators.Range(max=1)])))
+    tags = argo.Attr(argo.types.List(), required=False)
+
+
+def test_items(backend):
+    """Test that the items are deserialized with the item type."""
+    assert Shape.deserialize({"points": [{"x": 1, "y": 2}], "weights": [0, 0.5], "tags": "a"}) == {
+        "points": [{"x": 1}], "weights": [0, 0.5], "tags": "a"}
+
+
+def test_items_errors(backend):
+    """Test that the errors of all the items are reported with their indices, the first failure per item."""
+    with pytest.raises(exceptions.ValidationError) as error:
+        Shape.deserialize({"points": [{"x": 1}, {"x": -1}, {}], "weights": [2, -1, 0.5, 3]})
+
+    assert errors(error.value) == (None, [
+        ("points", [
+            (1, [("x", ["Value is less than minimum value '0'."])]),
+            (2, [("x", ["Missing attribute."])]),
+        ]),
+        ("weights", [
+            (0, ["Value is greater than maximum value '1'."]),
+            (1, ["Value is less than minimum value '0'."]),
+            (3, ["Value is greater than maximum value '1'."]),
+        ]),
+    ])
+    assert error.value.to_dict() == {"errors": {
+        "points": [{"errors": {
+            1: [{"errors": {"x": ["Value is less than minimum value '0'."]}}],
+            2: [{"errors": {"x": ["Missing attribute."]}}],
+        }}],
+        "weights": [{"errors": {
+            0: ["Value is greater than maximum value '1'."],
+            1: ["Value is less than minimum value '0'."],
+            3: ["Value is greater than maximum value '1'."],
+        }}],
+    }}
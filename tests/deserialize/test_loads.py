@@ -0,0 +1,79 @@
+"""Test the deserialization from JSON."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import exceptions
+
+
+class Tag(argo.Schema):
+
+    """Nested schema."""
+
+    name = argo.Attr()
+
+
+class Item(argo.hal.Schema):
+
+    """A schema with links, optional, default, nested and embedded attributes."""
+
+    self = argo.hal.Link(attr=lambda item: "/items/{0}".format(item["uid"]))
+    title = argo.Attr(required=False)
+    price = argo.Attr(default=0.5)
+    tag = argo.Attr(Tag, required=False)
+    tags = argo.hal.Embedded(argo.types.List(Tag))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"_links": {"self": {"href": "/items/1"}}, "_embedded": {"tags": []}},
+        {"title": u"été", "price": 2, "tag": {"name": "a"}, "_embedded": {"tags": [{"name": "b"}]}},
+        {"title": "unknown", "ignored": [1, 2, 3], "_embedded": {"tags": [], "ignored": {}}},
+    ]
+)
+def test_loads(value):
+    """Test that loads returns the same result as deserialize of the loaded JSON."""
+    data = json.dumps(value).encode("utf-8")
+    assert Item.loads(data) == Item.deserialize(value)
+    assert Item.loads(data.decode("utf-8")) == Item.deserialize(value)
+
+
+def errors(error):
+    """Comparable structure of the validation error."""
+    if not isinstance(error, exceptions.ValidationError):
+        return error
+    return error.attr, [errors(e) for e in error.errors]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"title": "no embedded"},
+        {"_embedded": {}},
+        {"tag": {}, "_embedded": {"tags": [{}]}},
+    ]
+)
+def test_loads_errors(value):
+    """Test that loads reports the same validation errors as deserialize."""
+    with pytest.raises(exceptions.ValidationError) as expected:
+        Item.deserialize(value)
+    with pytest.raises(exceptions.ValidationError) as e:
+        Item.loads(json.dumps(value))
+    assert errors(e.value) == errors(expected.value)
+
+
+def test_loads_invalid_json():
+    """Test that invalid JSON is reported as a validation error."""
+    with pytest.raises(exceptions.ValidationError):
+        Item.loads(b"{\"title\": ")
+
+
+def test_loads_output():
+    """Test that loads updates the output object."""
+    output = {}
+    assert Item.loads(b"{\"title\": \"a\", \"_embedded\": {\"tags\": []}}", output=output) is None
+    assert output == {"title": "a", "price": 0.5, "tags": []}
@@ -0,0 +1,106 @@
+"""Test the streaming deserialization."""
+
+import io
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import exceptions
+
+
+class Tag(argo.Schema):
+
+    """Item of the embedded list."""
+
+    name = argo.Attr(attr="label")
+    weight = argo.Attr(default=1)
+
+
+class Tags(argo.hal.Schema):
+
+    """A document with the embedded list."""
+
+    self = argo.hal.Link(attr="url")
+    total = argo.Attr()
+    tags = argo.hal.Embedded(argo.types.List(Tag))
+
+
+class Output(object):
+
+    """Output object of the items."""
+
+
+DOCUMENT = {
+    "_links": {"self": {"href": "/tags"}},
+    "total": 3,
+    "_embedded": {
+        "other": [{"name": "skipped"}],
+        "tags": [{"name": u"été"}, {"name": "b", "weight": 12345}, {"name": "c", "weight": None}],
+    },
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+@pytest.mark.parametrize("binary", [True, False])
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+def test_iter_deserialize(chunk_size, binary, ensure_ascii):
+    """Test that the items are the same as deserialized one by one, regardless of the chunk boundaries.
+
+    Chunks of one byte split the multi-byte UTF-8 characters.
+    """
+    data = json.dumps(DOCUMENT, indent=2, ensure_ascii=ensure_ascii)
+    fp = io.BytesIO(data.encode("utf-8")) if binary else io.StringIO(data)
+    fp.read = lambda size=-1, read=fp.read: read(chunk_size)
+    assert list(Tags.iter_deserialize(fp, "tags")) == [
+        Tag.deserialize(item) for item in DOCUMENT["_embedded"]["tags"]
+    ]
+
+
+def test_iter_deserialize_output():
+    """Test that every item is assigned to a new output object."""
+    items = list(Tags.iter_deserialize(io.BytesIO(json.dumps(DOCUMENT).encode("utf-8")), "tags", output=Output))
+    assert [(item.label, item.weight) for item in items] == [(u"été", 1), ("b", 12345), ("c", None)]
+
+
+def test_iter_deserialize_errors():
+    """Test that the valid items are yielded and the errors are raised with the indices at the end."""
+    data = json.dumps({"_embedded": {"tags": [{"name": "a"}, {}, {"name": "c"}, {}]}})
+    items = []
+    with pytest.raises(exceptions.ValidationError) as e:
+        for item in Tags.iter_deserialize(io.StringIO(data), "tags"):
+            items.append(item)
+    assert items == [{"name": "a", "weight": 1}, {"name": "c", "weight": 1}]
+    error, = e.value.errors
+    assert error.attr == "tags"
+    assert [item.attr for item in error.errors] == [1, 3]
+
+
+@pytest.mark.parametrize("data", ["{}", "{\"_embedded\": {}}"])
+def test_iter_deserialize_missing(data):
+    """Test that the missing required list is reported."""
+    with pytest.raises(exceptions.ValidationError) as e:
+        list(Tags.iter_deserialize(io.StringIO(data), "tags"))
+    assert e.value.errors[0].attr == "tags"
+
+
+def test_iter_deserialize_invalid():
+    """Test that the invalid JSON is reported as a validation error."""
+    with pytest.raises(exceptions.ValidationError):
+        list(Tags.iter_deserialize(io.StringIO("{\"_embedded\": {\"tags\": [{}, }"), "tags"))
+
+
+NUMBERS = '{"skipped": 12.5e-1, "tags": [{"name": "a", "weight": 1.5}, 2e3, -10, 0.25E+2, 123456789]}'
+
+
+@pytest.mark.parametrize("chunk_size", range(1, len(NUMBERS) + 1))
+def test_iter_deserialize_numbers(chunk_size):
+    """Test that the numbers split by the chunk boundaries are read completely."""
+
+    class Numbers(argo.Schema):
+        tags = argo.Attr(argo.types.List())
+
+    fp = io.StringIO(NUMBERS)
+    fp.read = lambda size=-1, read=fp.read: read(chunk_size)
+    assert list(Numbers.iter_deserialize(fp, "tags")) == json.loads(NUMBERS)["tags"]
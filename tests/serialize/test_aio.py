@@ -0,0 +1,120 @@
+"""Test the asyncio serialization."""
+
+import asyncio
+
+import pytest
+
+import argo
+import argo.hal
+
+
+class Counter(object):
+
+    """Counts the awaitables resolved at the same time."""
+
+    def __init__(self):
+        self.current = 0
+        self.max = 0
+
+    async def fetch(self, result):
+        self.current += 1
+        self.max = max(self.max, self.current)
+        await asyncio.sleep(0.01)
+        self.current -= 1
+        return result
+
+
+counter = Counter()
+
+
+async def get_author(book):
+    return await counter.fetch({"name": book["author"]})
+
+
+class Author(argo.Schema):
+
+    """Nested schema."""
+
+    name = argo.Attr()
+
+
+class Book(argo.hal.Schema):
+
+    """Schema with coroutine getters."""
+
+    self = argo.hal.Link(attr=lambda book: counter.fetch("/books/{0}".format(book["uid"])))
+    title = argo.Attr()
+    year = argo.Attr(required=False)
+    author = argo.Attr(Author, attr=get_author)
+
+
+class Shelf(argo.hal.Schema):
+
+    """Schema with a list of books."""
+
+    books = argo.hal.Embedded(argo.types.List(Book))
+
+
+class LimitedShelf(Shelf):
+
+    """Schema with the limited concurrency."""
+
+    __concurrency__ = 2
+
+
+SHELF = {"books": [{"uid": uid, "title": str(uid), "author": "a{0}".format(uid)} for uid in range(5)]}
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    """Reset the counter before the test."""
+    counter.max = 0
+
+
+def test_aserialize():
+    """Test that the awaitables are resolved and the result matches the synchronous serialization."""
+    result = asyncio.run(Shelf.aserialize(SHELF))
+    assert result == {
+        "_embedded": {
+            "books": [
+                {
+                    "_links": {"self": {"href": "/books/{0}".format(uid)}},
+                    "title": str(uid),
+                    "author": {"name": "a{0}".format(uid)},
+                }
+                for uid in range(5)
+            ],
+        },
+    }
+    assert counter.max == 10
+
+
+def test_aserialize_limit():
+    """Test that no more than the limit of awaitables is resolved at once."""
+    result = asyncio.run(LimitedShelf.aserialize(SHELF))
+    assert counter.max == 2
+    assert result == asyncio.run(Shelf.aserialize(SHELF))
+
+
+def test_aserialize_sync():
+    """Test that the schema without awaitables gives the same result as serialize."""
+    value = {"title": "t", "year": 2000, "author": {"name": "n"}}
+
+    class Plain(argo.Schema):
+        title = argo.Attr()
+        year = argo.Attr(required=False)
+        missing = argo.Attr(required=False)
+        author = argo.Attr(Author)
+
+    assert asyncio.run(Plain.aserialize(value)) == Plain.serialize(value)
+
+
+def test_aserialize_list_items():
+    """Test that the awaitable items of the lists are resolved concurrently within the limit."""
+    class Tags(argo.Schema):
+        __concurrency__ = 2
+
+        tags = argo.Attr(argo.types.List(), attr=lambda value: [counter.fetch(tag) for tag in value["tags"]])
+
+    assert asyncio.run(Tags.aserialize({"tags": ["a", "b", "c"]})) == {"tags": ["a", "b", "c"]}
+    assert counter.max == 2
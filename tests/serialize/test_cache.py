@@ -0,0 +1,151 @@
+"""Test the cache of the serialized representations."""
+
+import json
+
+import pytest
+
+import argo
+from argo import cache
+
+
+class Book(argo.Schema):
+
+    """Cached schema."""
+
+    __cache__ = cache.LRUCache(maxsize=2, key="uid", version="version", vary=("lang",))
+
+    uid = argo.Attr()
+    title = argo.Attr(attr=lambda book, lang=None: book["title"].get(lang, book["title"]["en"]))
+
+
+class FakeRedis(object):
+
+    """Client with the used subset of the Redis client API."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        return [key for key in self.data if key.startswith(match[:-1])]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def book_cache(request):
+    """Cache of the book schema with the memory or redis backend."""
+    original = Book.__cache__
+    if request.param == "redis":
+        Book.__cache__ = cache.LRUCache(key="uid", version="version", vary=("lang",), backend=cache.RedisBackend(
+            FakeRedis()
+        ))
+    Book.__cache__.clear()
+    yield Book.__cache__
+    Book.__cache__ = original
+
+
+def book(uid, version=1):
+    """Book value."""
+    return {"uid": uid, "version": version, "title": {"en": "t{0}".format(uid), "nl": "n{0}".format(uid)}}
+
+
+def encoded(value):
+    """Expected JSON bytes."""
+    return json.dumps(value).encode("utf-8")
+
+
+def test_cache(book_cache):
+    """Test that the JSON is cached by the key, version and context."""
+    assert Book.dumps(book(1)) == encoded({"uid": 1, "title": "t1"})
+    assert Book.dumps(book(1)) == encoded({"uid": 1, "title": "t1"})
+    assert (book_cache.hits, book_cache.misses) == (1, 1)
+
+    assert Book.dumps(book(1), lang="nl") == encoded({"uid": 1, "title": "n1"})
+    changed = book(1, version=2)
+    changed["title"]["en"] = "changed"
+    assert Book.dumps(changed) == encoded({"uid": 1, "title": "changed"})
+    assert (book_cache.hits, book_cache.misses) == (1, 3)
+
+
+def test_serialize_not_cached(book_cache):
+    """Test that only dumps is cached, serialize always returns the current value."""
+    value = book(1)
+    Book.dumps(value)
+    calls = book_cache.hits, book_cache.misses
+    value["title"]["en"] = "changed"
+    assert Book.serialize(value) == {"uid": 1, "title": "changed"}
+    assert Book.serialize_many([value]) == [{"uid": 1, "title": "changed"}]
+    assert (book_cache.hits, book_cache.misses) == calls
+
+
+def test_invalidate(book_cache):
+    """Test that the invalidated JSON is serialized again."""
+    value = book(1)
+    Book.dumps(value)
+    value["title"]["en"] = "changed"
+    assert Book.dumps(value) == encoded({"uid": 1, "title": "t1"})
+    book_cache.invalidate(Book, {"uid": 1})
+    assert Book.dumps(value) == encoded({"uid": 1, "title": "changed"})
+
+
+def test_eviction():
+    """Test that the least recently used JSON is evicted."""
+    Book.__cache__.clear()
+    for uid in (1, 2, 1, 3):
+        Book.dumps(book(uid))
+    assert len(Book.__cache__.backend) == 2
+    assert Book.__cache__.lookup(Book, book(1), {})[2] is not None
+    assert Book.__cache__.lookup(Book, book(2), {})[2] is None
+
+
+def test_ttl(monkeypatch):
+    """Test that the expired entries are not used."""
+    backend = cache.MemoryBackend()
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    backend.set("key", "entry", ttl=10)
+    assert backend.get("key") == "entry"
+    now[0] += 10
+    assert backend.get("key") is None
+
+
+def test_redis_entries():
+    """Test that the Redis entries are the framed version and JSON, other data is not loaded."""
+    client = FakeRedis()
+    backend = cache.RedisBackend(client)
+    backend.set("a", ("'v:1'", b'{"a": 1}'))
+    backend.set("b", (None, b"{}"))
+    assert client.data["argo:a"] == b"5:'v:1'{\"a\": 1}"
+    assert backend.get("a") == ("'v:1'", b'{"a": 1}')
+    assert backend.get("b") == (None, b"{}")
+
+    client.data["argo:c"] = b"\x80\x04garbage"
+    assert backend.get("c") is None
+    assert backend.get("missing") is None
+
+
+def test_same_name():
+    """Test that the schemas with the same name don't share the entries."""
+    shared = cache.LRUCache(key="uid")
+
+    def make(field):
+        class Book(argo.Schema):
+            __cache__ = shared
+
+            uid = argo.Attr()
+            title = argo.Attr(attr=field)
+
+        return Book
+
+    first, second = make("title"), make("uid")
+    value = {"uid": 1, "title": "t1"}
+    assert first.dumps(value) == encoded({"uid": 1, "title": "t1"})
+    assert second.dumps(value) == encoded({"uid": 1, "title": 1})
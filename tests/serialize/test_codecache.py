@@ -0,0 +1,76 @@
+"""Test the persistent cache of the compiled code."""
+
+import glob
+import os
+
+import pytest
+
+import argo
+import argo.hal
+from argo import codecache
+
+
+def make_schema(**attrs):
+    """Define and compile a HAL schema with the attributes."""
+    attrs.setdefault("self", argo.hal.Link(template="/books/{uid}"))
+    schema = type(argo.hal.Schema)("Book", (argo.hal.Schema, ), attrs)
+    schema.compile()
+    return schema
+
+
+BOOK = {"uid": 1, "title": "Book"}
+
+
+@pytest.fixture
+def cache(tmpdir):
+    """Enabled code cache."""
+    cache = codecache.enable(str(tmpdir.join("cache")))
+    try:
+        yield cache
+    finally:
+        codecache.disable()
+
+
+def test_cache(cache):
+    """Test that the code of the same schema definition is loaded from the cache."""
+    schema = make_schema(title=argo.Attr())
+    assert cache.misses > 0
+    assert cache.hits == 0
+
+    misses = cache.misses
+    cached = make_schema(title=argo.Attr())
+    assert cache.misses == misses
+    assert cache.hits > 0
+    assert cached.serialize(BOOK) == schema.serialize(BOOK) == schema.interpret(BOOK)
+    assert cached.dumps(BOOK) == schema.dumps(BOOK)
+
+
+def test_invalidation(cache):
+    """Test that the changed definition is compiled again."""
+    make_schema(title=argo.Attr())
+    misses = cache.misses
+
+    schema = make_schema(title=argo.Attr(attr="name"))
+    assert cache.misses == misses + 1
+    assert schema.serialize({"uid": 1, "name": "Book"})["title"] == "Book"
+
+
+def test_corrupted(cache):
+    """Test that the corrupted entries are compiled again."""
+    make_schema(title=argo.Attr())
+    for path in glob.glob(os.path.join(cache.path, "*.code")):
+        with open(path, "wb") as f:
+            f.write(b"corrupted")
+
+    hits = cache.hits
+    schema = make_schema(title=argo.Attr())
+    assert cache.hits == hits
+    assert schema.serialize(BOOK) == schema.interpret(BOOK)
+
+
+def test_clear(cache):
+    """Test that the entries are removed."""
+    make_schema(title=argo.Attr())
+    assert glob.glob(os.path.join(cache.path, "*.code"))
+    cache.clear()
+    assert not glob.glob(os.path.join(cache.path, "*.code"))
@@ -0,0 +1,192 @@
+"""Test the compiled serialization of schemas."""
+
+import decimal
+import gc
+
+import pytest
+
+import argo
+import argo.hal
+from argo import compiler
+
+
+class Obj(object):
+
+    """Object with the attributes given as keyword arguments."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class Schema(argo.Schema):
+
+    """A schema with all kinds of simple attributes."""
+
+    name = argo.Attr()
+    nick = argo.Attr(attr="meta.nick", required=False)
+    age = argo.Attr(default=0)
+    kind = argo.Attr("person")
+
+
+@pytest.mark.parametrize(
+    ["value", "expected"],
+    [
+        (
+            {"name": "John", "meta": {"nick": "J"}, "age": 42},
+            {"name": "John", "nick": "J", "age": 42, "kind": "person"},
+        ),
+        (
+            {"name": "John"},
+            {"name": "John", "age": 0, "kind": "person"},
+        ),
+        (
+            Obj(name="John", meta=Obj(nick=lambda: "J")),
+            {"name": "John", "nick": "J", "age": 0, "kind": "person"},
+        ),
+    ]
+)
+def test_compiled(value, expected):
+    """Test that the compiled serializer resolves paths, defaults, optional and constant attributes."""
+    assert Schema.serialize(value) == expected
+
+
+def test_compiled_equals_interpreted():
+    """Test that the compiled serializer returns the same result as the interpreted one."""
+    acme = argo.hal.Curie(name="acme", href="/acme/{rel}", templated=True)
+
+    class Item(argo.hal.Schema):
+
+        """A HAL schema with links, curies and embedded objects."""
+
+        self = argo.hal.Link(attr=lambda value: "/items/" + value["uid"], type="application/json")
+        shop = argo.hal.Link("/shop", curie=acme)
+        name = argo.Attr()
+        children = argo.hal.Embedded(argo.types.List(Schema), curie=acme)
+
+    value = {"uid": "1", "name": "Item", "children": [{"name": "John"}]}
+    assert Item.serialize(value) == Item.interpret(value)
+    assert Item.serialize(value)["_links"]["self"] == {"href": "/items/1", "type": "application/json"}
+
+
+def test_required_missing():
+    """Test that a missing required attribute raises the same error as the interpreted serialization."""
+    with pytest.raises(KeyError):
+        Schema.serialize({})
+
+
+def test_not_compiled():
+    """Test that the schema can fall back to the interpreted serialization."""
+    class Interpreted(Schema):
+
+        """Schema that is not compiled."""
+
+        __compiled__ = False
+
+    assert Interpreted.__serializer__ is None
+    assert Interpreted.serialize({"name": "John"}) == {"name": "John", "age": 0, "kind": "person"}
+
+
+def test_compiled_on_first_use():
+    """Test that the schema is compiled when it is first used, not when it is defined."""
+    class Lazy(Schema):
+
+        """Schema that is not used yet."""
+
+    assert not isinstance(vars(Lazy)["__plan__"], compiler.Plan)
+    assert Lazy.serialize({"name": "John"}) == {"name": "John", "age": 0, "kind": "person"}
+    assert isinstance(vars(Lazy)["__plan__"], compiler.Plan)
+
+
+def test_attribute_name_escaped():
+    """Test that the attribute names are not copied into the generated source as is."""
+    schema = argo.Schema(**{"a\nb = 1/0": argo.Attr()})
+    assert schema.serialize({"a\nb = 1/0": 1}) == {"a\nb = 1/0": 1}
+    assert schema.dumps({"a\nb = 1/0": 1}) == b'{"a\\nb = 1/0": 1}'
+
+
+def test_serialize_many():
+    """Test that serializing many values returns the same result as serializing them one by one."""
+    values = [{"name": "John"}, {"name": "Jane", "meta": {"nick": "J"}}]
+    expected = [Schema.serialize(value) for value in values]
+
+    assert Schema.serialize_many(iter(values)) == expected
+    assert argo.types.List(Schema).serialize(values) == expected
+
+
+def test_serialize_overridden_items():
+    """Test that the list items are serialized by the overridden serialize of the item schema."""
+    class Extra(Schema):
+
+        """Schema that adds a key to the serialized value."""
+
+        @classmethod
+        def serialize(cls, value, **kwargs):
+            result = super(Extra, cls).serialize(value, **kwargs)
+            result["extra"] = 1
+            return result
+
+    assert argo.types.List(Extra).serialize([{"name": "John"}]) == [
+        {"name": "John", "age": 0, "kind": "person", "extra": 1},
+    ]
+
+
+def test_static():
+    """Test that the static attributes are rendered once and copied into every result."""
+    curie = argo.hal.Curie("doc", "/docs/{rel}", templated=True)
+
+    class Static(argo.hal.Schema):
+        self = argo.hal.Link(attr=lambda value: "/static/{0}".format(value["uid"]), templated=False)
+        docs = argo.hal.Link("/docs", type="text/html")
+        rel = argo.hal.Link(attr="rel", curie=curie)
+        tags = argo.Attr(attr=argo.Constant([{"name": "a"}, (1, 2.5, None)]))
+
+    plan = Static.__plan__
+    assert [field.name for field in plan.fields if field.static] == ["docs", "tags", "curies"]
+
+    value = {"uid": 1, "rel": "/rel"}
+    first, second = Static.serialize_many([value, value])
+    assert first == second == Static.interpret(value)
+    assert first["_links"]["curies"] == [{"href": "/docs/{rel}", "name": "doc", "templated": True}]
+    assert first["_links"]["docs"] is not second["_links"]["docs"]
+    assert first["tags"][0] is not second["tags"][0]
+
+
+def test_static_not_literal():
+    """Test that the static values that can't be written as literals are copied as well."""
+    class Static(argo.Schema):
+        prices = argo.Attr(attr=argo.Constant({"min": [decimal.Decimal("1.5")]}))
+
+    first, second = Static.serialize_many([{}, {}])
+    first["prices"]["min"].append(decimal.Decimal("2"))
+    assert second == Static.serialize({}) == {"prices": {"min": [decimal.Decimal("1.5")]}}
+
+
+def test_link_schema_shared():
+    """Test that the links share the link schema unless their constants differ in value or type."""
+    class Links(argo.hal.Schema):
+        number = argo.hal.Link(1)
+        same = argo.hal.Link(1)
+        flag = argo.hal.Link(True)
+        templated = argo.hal.Link("/a", templated=True)
+        counted = argo.hal.Link("/a", templated=1)
+
+    attrs = dict((attr.name, attr.attr_type) for attr in Links.__attrs__)
+    assert attrs["number"] is attrs["same"]
+    assert attrs["number"] is not attrs["flag"]
+    assert Links.serialize({})["_links"] == {
+        "number": {"href": 1},
+        "same": {"href": 1},
+        "flag": {"href": True},
+        "templated": {"href": "/a", "templated": True},
+        "counted": {"href": "/a", "templated": 1},
+    }
+
+
+def test_link_schema_released():
+    """Test that the link schemas are not kept when no link uses them."""
+    link = argo.hal.Link("/released")
+    assert [key for key in argo.hal._link_schemas.keys() if key[0] == "/released"]
+
+    del link
+    gc.collect()
+    assert not [key for key in argo.hal._link_schemas.keys() if key[0] == "/released"]
@@ -0,0 +1,58 @@
+"""Test the serialization into JSON."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import backends
+
+
+class Tag(argo.Schema):
+
+    """Nested schema."""
+
+    name = argo.Attr()
+
+
+class Item(argo.hal.Schema):
+
+    """A schema with optional, default, constant, nested and embedded attributes."""
+
+    self = argo.hal.Link(attr=lambda item: "/items/{0}".format(item["uid"]))
+    parent = argo.hal.Link(attr="parent", required=False)
+    title = argo.Attr(required=False)
+    price = argo.Attr(default=0.5)
+    kind = argo.Attr("item")
+    meta = argo.Attr(required=False)
+    tag = argo.Attr(Tag, required=False)
+    tags = argo.hal.Embedded(argo.types.List(Tag))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"uid": 1, "tags": []},
+        {"uid": 2, "title": u"été", "parent": "/items/1", "tags": [{"name": "a"}, {"name": "b"}]},
+        {"uid": 3, "price": float("inf"), "meta": {"a": [1, None, True]}, "tag": {"name": "a"}, "tags": []},
+        {"uid": 4, "price": None, "tag": {}, "tags": []},
+    ]
+)
+def test_dumps(value):
+    """Test that the JSON is the same as the encoded serialized value."""
+    assert Item.dumps(value) == json.dumps(Item.serialize(value)).encode("utf-8")
+
+
+def test_dumps_backend():
+    """Test that the JSON backend can be chosen by the schema."""
+    pytest.importorskip("orjson")
+
+    class OrjsonItem(Item):
+
+        """Schema using orjson."""
+
+        __backend__ = "orjson"
+
+    value = {"uid": 1, "tags": [{"name": "a"}]}
+    assert OrjsonItem.dumps(value) == backends.get_backend("orjson").dumps(Item.serialize(value))
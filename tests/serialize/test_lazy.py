@@ -0,0 +1,112 @@
+"""Test the lazy attributes."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo.lazy import LazyDict
+
+
+class Calls(object):
+
+    """Getter that records its calls."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, value):
+        self.count += 1
+        return sum(value["numbers"])
+
+
+total = Calls()
+
+
+class Stats(argo.hal.Schema):
+
+    """Schema with lazy attributes."""
+
+    self = argo.hal.Link(attr=lambda value: "/stats", lazy=True)
+    name = argo.Attr()
+    total = argo.Attr(attr=total, lazy=True)
+    missing = argo.Attr(attr="missing", required=False, lazy=True)
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    """Reset the call counter."""
+    total.count = 0
+
+
+VALUE = {"name": "a", "numbers": [1, 2, 3]}
+
+
+def test_lazy():
+    """Test that the lazy attribute is evaluated once on the first access."""
+    result = Stats.serialize(VALUE)
+    assert isinstance(result, LazyDict)
+    assert "total" in result
+    assert total.count == 0
+
+    del result["total"]
+    assert result == {"_links": {"self": {"href": "/stats"}}, "name": "a"}
+    assert total.count == 0
+
+    result = Stats.serialize(VALUE)
+    assert result["total"] == 6
+    assert result.get("total") == 6
+    assert total.count == 1
+
+
+def test_lazy_encoded():
+    """Test that the lazy attributes are evaluated by the JSON encoder and missing ones are dropped."""
+    result = Stats.serialize(VALUE)
+    assert json.loads(json.dumps(result)) == {"_links": {"self": {"href": "/stats"}}, "name": "a", "total": 6}
+    assert "missing" not in result
+    assert total.count == 1
+
+
+def test_lazy_required():
+    """Test that the missing required lazy attribute raises when it is accessed."""
+    result = Stats.serialize({"name": "a"})
+    with pytest.raises(KeyError):
+        result["total"]
+
+
+def test_lazy_equals_interpreted():
+    """Test that the result is the same as the eager interpreted serialization."""
+    assert Stats.serialize(VALUE) == Stats.interpret(VALUE)
+    assert Stats.dumps(VALUE) == json.dumps(Stats.serialize(VALUE)).encode("utf-8")
+
+
+def test_lazy_optional_missing():
+    """Test that the missing optional lazy attribute is not reported by the keys, the length or the copies."""
+    result = Stats.serialize(VALUE)
+    assert "missing" not in result
+    assert len(Stats.serialize(VALUE)) == 3
+    assert "missing" not in list(Stats.serialize(VALUE))
+    assert dict((key, result[key]) for key in Stats.serialize(VALUE)) == Stats.interpret(VALUE)
+
+
+def test_lazy_copy():
+    """Test that the copies of the dict have the values computed."""
+    assert dict(Stats.serialize(VALUE)) == Stats.interpret(VALUE)
+    assert dict(**Stats.serialize(VALUE)) == Stats.interpret(VALUE)
+
+
+class Nested(argo.Schema):
+
+    """Schema with a nested schema with lazy attributes."""
+
+    stats = argo.Attr(Stats, attr=lambda value: value)
+
+
+@pytest.mark.parametrize("schema", [Stats, Nested])
+def test_lazy_orjson(schema):
+    """Test that the lazy attributes are computed before orjson encodes the dict."""
+    orjson = pytest.importorskip("orjson")
+
+    backend_schema = type(argo.Schema)("Orjson", (schema, ), {"__backend__": "orjson"})
+    assert orjson.loads(backend_schema.dumps(VALUE)) == json.loads(json.dumps(schema.interpret(VALUE)))
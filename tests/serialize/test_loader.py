@@ -0,0 +1,134 @@
+"""Test the batched loading of related objects."""
+
+import collections
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import loader
+
+AUTHORS = {1: {"name": "Ann"}, 2: {"name": "Bob"}}
+PUBLISHERS = {10: {"name": "Pub"}}
+
+
+class Loads(object):
+
+    """Batch load function that records its calls."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.calls = []
+
+    def __call__(self, keys):
+        self.calls.append(sorted(keys))
+        return dict((key, self.objects[key]) for key in keys if key in self.objects)
+
+
+load_authors = Loads(AUTHORS)
+load_publishers = Loads(PUBLISHERS)
+
+
+class Publisher(argo.Schema):
+
+    """Publisher schema."""
+
+    name = argo.Attr()
+
+
+class Author(argo.Schema):
+
+    """Author schema with a batched nested publisher."""
+
+    name = argo.Attr()
+    publisher = argo.Attr(Publisher, attr=loader.Batch(lambda author: 10, load_publishers))
+
+
+class Book(argo.Schema):
+
+    """Book schema with a batched author."""
+
+    title = argo.Attr()
+    author = argo.Attr(Author, attr=loader.Batch("author_id", load_authors), required=False)
+
+
+class Shelf(argo.hal.Schema):
+
+    """Schema with an embedded list of books."""
+
+    books = argo.hal.Embedded(argo.types.List(Book))
+
+
+BOOKS = [
+    {"title": "a", "author_id": 1},
+    {"title": "b", "author_id": 2},
+    {"title": "c", "author_id": 1},
+    {"title": "d", "author_id": 3},
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    """Reset the recorded calls."""
+    del load_authors.calls[:]
+    del load_publishers.calls[:]
+
+
+def expected(book):
+    """Expected serialization of the book."""
+    result = {"title": book["title"]}
+    if book["author_id"] in AUTHORS:
+        result["author"] = {"name": AUTHORS[book["author_id"]]["name"], "publisher": {"name": "Pub"}}
+    return result
+
+
+def test_serialize_many():
+    """Test that the related objects of all the items are loaded with one call per level."""
+    assert Book.serialize_many(BOOKS) == [expected(book) for book in BOOKS]
+    assert load_authors.calls == [[1, 2, 3]]
+    assert load_publishers.calls == [[10]]
+
+
+def test_embedded():
+    """Test that the items of nested lists are loaded at once."""
+    assert Shelf.serialize({"books": BOOKS}) == {"_embedded": {"books": [expected(book) for book in BOOKS]}}
+    assert json.loads(Shelf.dumps({"books": BOOKS}).decode("utf-8")) == Shelf.serialize({"books": BOOKS})
+    assert load_authors.calls == [[1, 2, 3]] * 3
+    assert load_publishers.calls == [[10]] * 3
+
+
+def test_embedded_iterables():
+    """Test that the items of any collection are loaded at once, iterators are loaded when serialized."""
+    expected_books = {"_embedded": {"books": [expected(book) for book in BOOKS]}}
+    assert Shelf.serialize({"books": collections.deque(BOOKS)}) == expected_books
+    assert load_authors.calls == [[1, 2, 3]]
+
+    del load_authors.calls[:]
+    assert Shelf.serialize({"books": (book for book in BOOKS)}) == expected_books
+    assert load_authors.calls == [[1], [2], [3]]
+
+
+def test_load_error():
+    """Test that the keys of the failed load are loaded again."""
+    def load(keys):
+        if not calls:
+            calls.append(keys)
+            raise IOError("Unavailable")
+        return load_authors(keys)
+
+    calls = []
+    batch = loader.Batch("author_id", load)
+    loader_session = loader.Session()
+    with pytest.raises(IOError):
+        loader_session.load(batch, [1])
+    assert loader_session.get(batch, 1) == AUTHORS[1]
+
+
+def test_session():
+    """Test that the objects are loaded once per session."""
+    with loader.session():
+        Book.serialize(BOOKS[0])
+        Book.serialize_many(BOOKS)
+    assert load_authors.calls == [[1], [2, 3]]
+    assert load_publishers.calls == [[10]]
@@ -0,0 +1,109 @@
+"""Test the memoization of the serialized values."""
+
+import json
+
+import argo
+import argo.hal
+from argo import loader
+
+
+class Author(argo.Schema):
+
+    """Memoized by the identity."""
+
+    __memoize__ = True
+
+    name = argo.Attr()
+
+
+class Tag(argo.Schema):
+
+    """Memoized by the key."""
+
+    __memoize__ = staticmethod(lambda tag: tag["name"])
+
+    name = argo.Attr()
+
+
+class Post(argo.hal.Schema):
+
+    """Schema with the memoized nested schemas."""
+
+    title = argo.Attr()
+    author = argo.hal.Embedded(Author)
+    tags = argo.Attr(argo.types.List(Tag))
+
+
+class Feed(argo.hal.Schema):
+
+    """List of posts."""
+
+    posts = argo.hal.Embedded(argo.types.List(Post))
+
+
+ANN = {"name": "Ann"}
+BOB = {"name": "Bob"}
+FEED = {
+    "posts": [
+        {"title": "a", "author": ANN, "tags": [{"name": "x"}, {"name": "y"}]},
+        {"title": "b", "author": BOB, "tags": [{"name": "x"}]},
+        {"title": "c", "author": ANN, "tags": []},
+        {"title": "d", "author": {"name": "Ann"}, "tags": [{"name": "y"}]},
+    ],
+}
+
+
+def test_memoize():
+    """Test that the memoized values are shared and the result is the same."""
+    with loader.session() as session:
+        result = Feed.serialize(FEED)
+    posts = result["_embedded"]["posts"]
+    assert posts[0]["_embedded"]["author"] is posts[2]["_embedded"]["author"]
+    assert posts[0]["_embedded"]["author"] is not posts[3]["_embedded"]["author"]
+    assert posts[0]["tags"][0] is posts[1]["tags"][0]
+    assert (session.hits, session.misses) == (3, 5)
+    assert session.hit_rate == 3 / 8.0
+
+    Author.__memoize__ = Tag.__memoize__ = False
+    try:
+        Author.compile()
+        Tag.compile()
+        assert Feed.serialize(FEED) == result
+    finally:
+        Author.__memoize__ = True
+        Tag.__memoize__ = staticmethod(lambda tag: tag["name"])
+        Author.compile()
+        Tag.compile()
+
+
+def test_memoize_dumps():
+    """Test that the encoded JSON is shared."""
+    with loader.session() as session:
+        data = Feed.dumps(FEED)
+    assert (session.hits, session.misses) == (3, 5)
+    assert json.loads(data.decode("utf-8")) == Feed.serialize(FEED)
+
+
+def test_memoize_scope():
+    """Test that every top-level call has its own memo without the explicit session."""
+    first = Feed.serialize(FEED)
+    assert Feed.serialize(FEED) == first
+    assert Feed.serialize(FEED)["_embedded"]["posts"][0]["_embedded"]["author"] is not (
+        first["_embedded"]["posts"][0]["_embedded"]["author"]
+    )
+
+
+def test_memoize_context():
+    """Test that the values are only reused for the same serialization context."""
+    class Greeting(argo.Schema):
+        __memoize__ = True
+
+        text = argo.Attr(attr=lambda value, lang="en": "{0}-{1}".format(value["text"], lang))
+
+    value = {"text": "x"}
+    with loader.session() as session:
+        assert Greeting.serialize(value, lang="en") == {"text": "x-en"}
+        assert Greeting.serialize(value, lang="fr") == {"text": "x-fr"}
+        assert Greeting.serialize(value, lang="fr") == {"text": "x-fr"}
+        assert Greeting.serialize(value, lang=["unhashable"]) == {"text": "x-['unhashable']"}
+    assert (session.hits, session.misses) == (1, 2)
@@ -0,0 +1,174 @@
+"""Test the observers of the schema operations."""
+
+import json
+
+import pytest
+
+import argo
+from argo import exceptions, observers, validators
+
+
+class Author(argo.Schema):
+
+    """Nested schema."""
+
+    name = argo.Attr(argo.types.Type(validators=[validators.Length(min=1)]))
+
+
+class Book(argo.Schema):
+
+    """Schema with a nested schema."""
+
+    title = argo.Attr()
+    author = argo.Attr(Author)
+
+
+BOOK = {"title": "Book", "author": {"name": "Ann"}}
+
+
+@pytest.fixture
+def collector():
+    """Registered in-memory collector."""
+    with observers.observe(observers.Collector()) as collector:
+        yield collector
+
+
+def test_operations(collector):
+    """Test that the outermost operations are observed with the payload size."""
+    Book.serialize(BOOK)
+    data = Book.dumps(BOOK)
+    Book.loads(data)
+    Book.serialize_many([BOOK, BOOK])
+
+    assert [(event.schema, event.operation, event.size) for event in collector.events] == [
+        (Book, "serialize", None),
+        (Book, "dumps", len(data)),
+        (Book, "loads", len(data)),
+        (Book, "serialize_many", None),
+    ]
+    assert all(event.duration >= 0 and event.error is None for event in collector.events)
+
+
+def test_failures(collector):
+    """Test that the validation failures are counted by the attribute path."""
+    for _ in range(2):
+        with pytest.raises(exceptions.ValidationError):
+            Book.deserialize({"author": {"name": ""}})
+
+    assert collector.failures == {("Book", "title"): 2, ("Book", "author.name"): 2}
+    assert isinstance(collector.events[0].error, exceptions.ValidationError)
+
+
+def test_unregistered():
+    """Test that the unregistered observer is not notified."""
+    collector = observers.Collector()
+    with observers.observe(collector):
+        Book.serialize(BOOK)
+    Book.serialize(BOOK)
+    assert len(collector.events) == 1
+    assert argo.schema._observer is None
+
+
+class Metric(object):
+
+    """Metric with the labels recording the observed values."""
+
+    def __init__(self):
+        self.values = {}
+
+    def labels(self, *labels):
+        self.current = labels
+        return self
+
+    def observe(self, value):
+        self.values.setdefault(self.current, []).append(value)
+
+    def inc(self):
+        self.observe(1)
+
+
+def test_prometheus():
+    """Test the metrics of the Prometheus observer."""
+    observer = observers.PrometheusObserver(duration=Metric(), payload=Metric(), failures=Metric())
+    with observers.observe(observer):
+        data = Book.dumps(BOOK)
+        with pytest.raises(exceptions.ValidationError):
+            Book.loads(json.dumps({"title": "Book"}))
+
+    assert sorted(observer.duration.values) == [("Book", "dumps"), ("Book", "loads")]
+    assert observer.payload.values[("Book", "dumps")] == [len(data)]
+    assert observer.failures.values == {("Book", "author"): [1]}
+
+
+class Span(object):
+
+    """Span recording its attributes."""
+
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions = []
+        self.ended = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def record_exception(self, error):
+        self.exceptions.append(error)
+
+    def set_status(self, status):
+        self.status = status
+
+    def end(self):
+        self.ended = True
+
+
+class Tracer(object):
+
+    """Tracer keeping the started spans."""
+
+    def __init__(self):
+        self.spans = []
+
+    def start_span(self, name, attributes=None):
+        self.spans.append(Span(name, attributes or {}))
+        return self.spans[-1]
+
+
+def test_opentelemetry():
+    """Test the spans of the OpenTelemetry observer."""
+    tracer = Tracer()
+    with observers.observe(observers.OpenTelemetryObserver(tracer)):
+        Book.serialize(BOOK)
+        with pytest.raises(exceptions.ValidationError):
+            Book.deserialize({"title": "Book", "author": {"name": ""}})
+
+    serialized, deserialized = tracer.spans
+    assert serialized.name == "argo.serialize"
+    assert serialized.attributes == {"argo.schema": "Book"}
+    assert serialized.ended and not serialized.exceptions
+    assert deserialized.attributes["argo.failed_attrs"] == ["author.name"]
+    assert deserialized.ended and len(deserialized.exceptions) == 1
+
+
+def test_opentelemetry_current_span():
+    """Test that the span is current during the operation, so the nested spans are its children."""
+    trace = pytest.importorskip("opentelemetry.trace")
+    sdk = pytest.importorskip("opentelemetry.sdk.trace")
+    tracer = sdk.TracerProvider().get_tracer("test")
+    parents = []
+
+    def get_title(value):
+        with tracer.start_as_current_span("load") as span:
+            parents.append(span.parent)
+        return value["title"]
+
+    class Traced(argo.Schema):
+        title = argo.Attr(attr=get_title)
+
+    with observers.observe(observers.OpenTelemetryObserver(tracer)):
+        assert trace.get_current_span() is trace.INVALID_SPAN
+        Traced.serialize(BOOK)
+        assert trace.get_current_span() is trace.INVALID_SPAN
+
+    assert parents[0] is not None
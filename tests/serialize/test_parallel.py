@@ -0,0 +1,57 @@
+"""Test the parallel serialization of lists."""
+
+import pytest
+
+import argo
+from argo import parallel
+
+
+class Item(argo.Schema):
+
+    """Item schema, defined at the module level to be shipped to the workers by reference."""
+
+    uid = argo.Attr()
+    name = argo.Attr(attr="title")
+
+
+POOL = parallel.ProcessPool(workers=2, chunksize=3, threshold=5)
+
+
+class Items(argo.Schema):
+
+    """Schema with a parallel list."""
+
+    items = argo.Attr(argo.types.List(Item, parallel=POOL))
+
+
+@pytest.fixture
+def pool():
+    """Process pool with a small threshold."""
+    with parallel.ProcessPool(workers=2, chunksize=3, threshold=5) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("size", [0, 4, 5, 11])
+def test_serialize_many(pool, size):
+    """Test that the parallel result is the same and in order."""
+    values = [{"uid": uid, "title": str(uid)} for uid in range(size)]
+    assert pool.serialize_many(Item, iter(values)) == Item.serialize_many(values)
+
+
+def test_not_picklable(pool):
+    """Test that the schema that can't be pickled is serialized in the current process."""
+
+    class Local(argo.Schema):
+        uid = argo.Attr()
+
+    values = [{"uid": uid} for uid in range(10)]
+    assert pool.serialize_many(Local, values) == Local.serialize_many(values)
+    assert pool._pool is None
+
+
+def test_list():
+    """Test that the parallel list of the schema uses the pool."""
+    value = {"items": [{"uid": uid, "title": str(uid)} for uid in range(7)]}
+    with POOL:
+        assert Items.serialize(value) == {"items": Item.serialize_many(value["items"])}
+        assert POOL._pool is not None
@@ -0,0 +1,119 @@
+"""Test the profiling of the attributes."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import exceptions, validators
+
+
+class Author(argo.hal.Schema):
+
+    """Nested schema."""
+
+    self = argo.hal.Link(attr=lambda author: "/authors/{0}".format(author["uid"]))
+    name = argo.Attr()
+
+
+class Book(argo.hal.Schema):
+
+    """Schema with a nested schema, a list and validators."""
+
+    self = argo.hal.Link(attr=lambda book: "/books/{0}".format(book["uid"]))
+    title = argo.Attr(argo.types.Type(validators=[validators.Length(max=10)]))
+    author = argo.hal.Embedded(Author)
+    tags = argo.Attr(argo.types.List())
+
+
+BOOK = {"uid": 1, "title": "Book", "author": {"uid": 2, "name": "Ann"}, "tags": ["a"]}
+
+
+def calls(profiler):
+    """Calls by the schema, attribute and phase."""
+    return dict(((row["schema"], row["attr"], row["phase"]), row["calls"]) for row in profiler.rows())
+
+
+def test_serialize():
+    """Test that the attributes of the nested schemas are profiled and the result is the same."""
+    expected = Book.interpret(BOOK)
+    with argo.profile() as profiler:
+        assert Book.serialize(BOOK) == expected
+        assert json.loads(Book.dumps(BOOK).decode("utf-8")) == expected
+        Book.serialize_many([BOOK, BOOK])
+
+    stats = calls(profiler)
+    assert stats[("Book", "title", "access")] == 4
+    assert stats[("Book", "author", "convert")] == 4
+    assert stats[("Author", "name", "access")] == 4
+    assert ("Book", "title", "validate") not in stats
+
+    rows = json.loads(profiler.to_json())
+    assert rows == sorted(rows, key=lambda row: -row["time"])
+    assert "Author" in profiler.table()
+
+
+def test_deserialize():
+    """Test that the validation is profiled and the errors are the same."""
+    data = json.dumps(Book.interpret(BOOK))
+    expected = Book.loads(data)
+    with argo.profile() as profiler:
+        assert Book.loads(data) == expected == {"title": "Book", "author": {"name": "Ann"}, "tags": ["a"]}
+        with pytest.raises(exceptions.ValidationError) as error:
+            Book.deserialize({"title": "Long book title"})
+
+    assert sorted(e.attr for e in error.value.errors) == ["author", "tags", "title"]
+    stats = calls(profiler)
+    assert stats[("Book", "title", "validate")] == 2
+    assert stats[("Book", "author", "convert")] == 1
+    assert ("Book", "self", "access") not in stats
+
+
+def test_same_name():
+    """Test that the schemas with the same name are profiled separately."""
+    def make():
+        class Book(argo.Schema):
+            title = argo.Attr()
+
+        return Book
+
+    first, second = make(), make()
+    with argo.profile() as profiler:
+        first.serialize(BOOK)
+        second.serialize(BOOK)
+        second.serialize(BOOK)
+
+    rows = [row for row in profiler.rows() if row["attr"] == "title" and row["phase"] == "access"]
+    assert sorted(row["calls"] for row in rows) == [1, 2]
+    assert rows[0]["schema"] == "test_same_name.<locals>.make.<locals>.Book"
+
+
+def test_memory():
+    """Test that the allocated memory is recorded."""
+    with argo.profile(memory=True) as profiler:
+        Book.serialize(dict(BOOK, tags=[str(index) for index in range(1000)]))
+
+    assert max(row["allocated"] for row in profiler.rows() if row["attr"] == "tags") > 0
+
+
+def test_inactive():
+    """Test that nothing is recorded outside of the profile block."""
+    with argo.profile() as profiler:
+        pass
+    Book.serialize(BOOK)
+    assert profiler.rows() == []
+
+
+def test_serialize_overridden_attr():
+    """Test that the attributes overriding the serialization are profiled as a whole."""
+    class Upper(argo.Attr):
+        def serialize(self, value, **kwargs):
+            return super(Upper, self).serialize(value, **kwargs).upper()
+
+    class Shout(argo.Schema):
+        text = Upper()
+
+    with argo.profile() as profiler:
+        assert Shout.serialize({"text": "x"}) == {"text": "X"}
+    assert calls(profiler) == {("test_serialize_overridden_attr.<locals>.Shout", "text", "convert"): 1}
@@ -0,0 +1,110 @@
+"""Test the sparse fieldsets."""
+
+import pytest
+
+import argo
+import argo.hal
+
+
+class Author(argo.hal.Schema):
+
+    """Author schema."""
+
+    self = argo.hal.Link(attr=lambda author: "/authors/{0}".format(author["uid"]))
+    name = argo.Attr()
+    bio = argo.Attr()
+
+
+class Comment(argo.Schema):
+
+    """Comment schema."""
+
+    body = argo.Attr()
+    author = argo.Attr(Author)
+
+
+class Post(argo.hal.Schema):
+
+    """Post schema with embedded resources."""
+
+    self = argo.hal.Link(attr=lambda post: "/posts/{0}".format(post["uid"]))
+    title = argo.Attr()
+    text = argo.Attr()
+    author = argo.hal.Embedded(Author)
+    comments = argo.hal.Embedded(argo.types.List(Comment))
+
+
+AUTHOR = {"uid": 1, "name": "Ann", "bio": "..."}
+POST = {
+    "uid": 1,
+    "title": "Title",
+    "text": "Text",
+    "author": AUTHOR,
+    "comments": [{"body": "Body", "author": AUTHOR}],
+}
+
+
+@pytest.mark.parametrize(
+    ("fields", "embed", "expected"),
+    [
+        (
+            ["title"],
+            None,
+            {"_links": {"self": {"href": "/posts/1"}}, "title": "Title"},
+        ),
+        (
+            ["title", "author.name"],
+            None,
+            {
+                "_links": {"self": {"href": "/posts/1"}},
+                "title": "Title",
+                "_embedded": {"author": {"_links": {"self": {"href": "/authors/1"}}, "name": "Ann"}},
+            },
+        ),
+        (
+            ["text", "comments.body"],
+            ["_embedded.comments"],
+            {
+                "_links": {"self": {"href": "/posts/1"}},
+                "text": "Text",
+                "_embedded": {"comments": [{"body": "Body"}]},
+            },
+        ),
+        (
+            None,
+            ["author"],
+            {
+                "_links": {"self": {"href": "/posts/1"}},
+                "title": "Title",
+                "text": "Text",
+                "_embedded": {"author": Author.serialize(AUTHOR)},
+            },
+        ),
+    ]
+)
+def test_select(fields, embed, expected):
+    """Test that only the selected attributes are serialized."""
+    assert Post.select(fields=fields, embed=embed).serialize(POST) == expected
+
+
+def test_select_not_evaluated():
+    """Test that the getters of the attributes that are not selected are not called."""
+    class Lazy(argo.Schema):
+        uid = argo.Attr()
+        expensive = argo.Attr(attr=lambda value: pytest.fail("Not selected attribute is evaluated."))
+
+    assert Lazy.select(fields=["uid"]).serialize({"uid": 1}) == {"uid": 1}
+
+
+def test_select_memoized():
+    """Test that the projected schema is created once per selection."""
+    assert Post.select(fields=["title", "author.name"]) is Post.select(fields=["author.name", "title"])
+    assert Post.select() is not Post
+    assert Post.select().serialize(POST) == Post.serialize(POST)
+
+
+@pytest.mark.parametrize("fields", [["unknown"], ["author.unknown"], ["title.length"]])
+def test_select_unknown(fields):
+    """Test that the unknown attributes are reported."""
+    with pytest.raises(ValueError):
+        Post.select(fields=fields)
@@ -0,0 +1,52 @@
+"""Test the streaming JSON serialization."""
+
+import io
+import json
+
+import argo
+import argo.hal
+from argo import stream
+
+
+class Item(argo.hal.Schema):
+
+    """Collection item."""
+
+    self = argo.hal.Link(attr=lambda item: "/items/{0}".format(item["uid"]))
+    name = argo.Attr()
+
+
+class Collection(argo.hal.Schema):
+
+    """Collection with optional attributes and embedded items."""
+
+    self = argo.hal.Link("/items")
+    title = argo.Attr(required=False)
+    total = argo.Attr(required=False)
+    items = argo.hal.Embedded(argo.types.List(Item))
+
+
+def items(count):
+    """Generate the collection items."""
+    return ({"uid": i, "name": "Item {0}".format(i)} for i in range(count))
+
+
+def test_iter_serialize():
+    """Test that the streamed JSON is the same as the encoded serialized value."""
+    for value in ({"items": []}, {"total": 3, "items": list(items(3))}, {"title": "Items", "items": list(items(3))}):
+        assert "".join(Collection.iter_serialize(value)) == json.dumps(Collection.serialize(value))
+
+
+def test_iter_serialize_generator():
+    """Test that the items can be generated lazily and the JSON is yielded in chunks."""
+    chunks = list(stream.iter_serialize(Collection, {"items": items(1000)}, {}, chunk_size=1024))
+
+    assert len(chunks) > 1
+    assert len(json.loads("".join(chunks))["_embedded"]["items"]) == 1000
+
+
+def test_dump_stream():
+    """Test that the JSON is written to the file-like object."""
+    fp = io.StringIO()
+    Collection.dump_stream({"items": items(2)}, fp)
+    assert json.loads(fp.getvalue()) == Collection.serialize({"items": list(items(2))})
@@ -0,0 +1,118 @@
+"""Test the URI template links."""
+
+import json
+
+import pytest
+
+import argo
+import argo.hal
+from argo import uritemplate
+
+VARIABLES = {
+    "var": "value",
+    "hello": "Hello World!",
+    "half": "50%",
+    "path": "/foo/bar",
+    "base": "http://example.com/home/",
+    "empty": "",
+    "list": ["red", "green", "blue"],
+    "x": "1024",
+    "y": "768",
+}
+
+
+@pytest.mark.parametrize(
+    ["template", "expected"],
+    [
+        # Level 1
+        ("{var}", "value"),
+        ("{hello}", "Hello%20World%21"),
+        ("{half}", "50%25"),
+        # Level 2
+        ("{+var}", "value"),
+        ("{+hello}", "Hello%20World!"),
+        ("{+half}", "50%25"),
+        ("{+path}/here", "/foo/bar/here"),
+        ("{+base}index", "http://example.com/home/index"),
+        ("here?ref={+path}", "here?ref=/foo/bar"),
+        ("X{#var}", "X#value"),
+        ("X{#hello}", "X#Hello%20World!"),
+        # Level 3
+        ("map?{x,y}", "map?1024,768"),
+        ("{x,hello,y}", "1024,Hello%20World%21,768"),
+        ("{+x,hello,y}", "1024,Hello%20World!,768"),
+        ("{+path,x}/here", "/foo/bar,1024/here"),
+        ("{#x,hello,y}", "#1024,Hello%20World!,768"),
+        ("{#path,x}/here", "#/foo/bar,1024/here"),
+        ("X{.var}", "X.value"),
+        ("X{.x,y}", "X.1024.768"),
+        ("{/var}", "/value"),
+        ("{/var,x}/here", "/value/1024/here"),
+        ("{;x,y}", ";x=1024;y=768"),
+        ("{;x,y,empty}", ";x=1024;y=768;empty"),
+        ("{?x,y}", "?x=1024&y=768"),
+        ("{?x,y,empty}", "?x=1024&y=768&empty="),
+        ("?fixed=yes{&x}", "?fixed=yes&x=1024"),
+        ("{&x,y,empty}", "&x=1024&y=768&empty="),
+        # Undefined variables and lists
+        ("{var}{undef}", "value"),
+        ("/items{?undef,x}", "/items?x=1024"),
+        ("{?undef}", ""),
+        ("{list}", "red,green,blue"),
+    ]
+)
+def test_expand(template, expected):
+    """Test the expansion of the RFC 6570 examples."""
+    assert uritemplate.URITemplate(template).expand(VARIABLES) == expected
+
+
+@pytest.mark.parametrize("template", ["{var*}", "{var:3}", "{var", "var}", "{}", "{a b}"])
+def test_invalid(template):
+    """Test that the level 4 and the invalid templates are rejected."""
+    with pytest.raises(ValueError):
+        uritemplate.URITemplate(template)
+
+
+class Spell(argo.hal.Schema):
+
+    """A schema with the URI template links."""
+
+    self = argo.hal.Link(template="/spells/{uid}")
+    school = argo.hal.Link(template="/schools/{school.uid}{?lang}", required=False)
+    search = argo.hal.Link(template="/spells{?q}", templated=True)
+    related = argo.hal.LinkList(template="/spells/{uid}", attr="related")
+    uid = argo.Attr()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"uid": 1, "school": {"uid": "fire"}, "related": []},
+        {"uid": "a/b", "school": {"uid": "dark arts"}, "lang": "en", "related": [{"uid": 2}, {"uid": 3}]},
+        {"uid": 2, "related": [{"uid": 1}]},
+    ]
+)
+def test_link(value):
+    """Test that the template links are the same as the interpreted ones."""
+    assert Spell.serialize(value) == Spell.interpret(value)
+    assert Spell.dumps(value) == json.dumps(Spell.serialize(value)).encode("utf-8")
+
+
+def test_link_expanded():
+    """Test the expanded and the verbatim templated links."""
+    value = {"uid": 1, "school": {"uid": "dark arts"}, "lang": "en", "related": [{"uid": 2}, {"uid": 3}]}
+    assert Spell.serialize(value)["_links"] == {
+        "self": {"href": "/spells/1"},
+        "school": {"href": "/schools/dark%20arts?lang=en"},
+        "search": {"href": "/spells{?q}", "templated": True},
+        "related": [{"href": "/spells/2"}, {"href": "/spells/3"}],
+    }
+
+
+def test_link_schema_shared():
+    """Test that the links with the same template share the link schema."""
+
+    class Other(argo.hal.Schema):
+        self = argo.hal.Link(template="/spells/{uid}")
+
+    assert Other.__attrs__[0].attr_type is Spell.__attrs__[0].attr_type
@@ -0,0 +1,55 @@
+"""Test the accessors with the declared shape of the source."""
+
+from collections import namedtuple
+
+import pytest
+
+import argo
+from argo.schema import Accessor, Attr
+
+Obj = namedtuple("Obj", ["key"])
+
+
+@pytest.mark.parametrize(
+    ["source", "value"],
+    [
+        (dict, {"key": {"key": "value"}}),
+        (object, Obj(key=Obj(key="value"))),
+        (None, {"key": Obj(key="value")}),
+    ]
+)
+def test_get_source(source, value):
+    """Test that the path getter is compiled according to the shape of the source."""
+    acc = Accessor(getter="key.key", source=source)
+    assert acc.path == ("key", "key")
+    assert acc.get(value) == "value"
+
+
+def test_get_source_mismatch():
+    """Test that declaring the shape of the source skips the type checks."""
+    acc = Accessor(getter="key", source=dict)
+    with pytest.raises(TypeError):
+        acc.get(Obj(key="value"))
+
+
+def test_schema_source():
+    """Test that the schema compiles the paths according to the declared shape of the source."""
+    class Schema(argo.Schema):
+
+        """A schema for dicts."""
+
+        __source__ = dict
+
+        name = argo.Attr(attr="person.name")
+        nick = argo.Attr(required=False)
+
+    assert Schema.serialize({"person": {"name": "John"}}) == {"name": "John"}
+
+
+def test_attr_accessor_resolved_once():
+    """Test that the attribute accessor is resolved once and reset when the attr is changed."""
+    attr = Attr(attr="key")
+    assert attr.accessor is attr.accessor
+
+    attr.attr = "other"
+    assert attr.accessor.getter == "other"
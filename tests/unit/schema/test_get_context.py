@@ -0,0 +1,51 @@
+"""Tests for the context plans of the serialization."""
+
+import mock
+
+import argo
+from argo import schema
+
+
+def test_plan_keywords():
+    """Test that functions accepting any keyword arguments get the whole context."""
+    assert schema._get_context_plan(lambda value, **kwargs: value) is None
+    assert schema._get_context(lambda value, **kwargs: value, {"a": 1}) == {"a": 1}
+
+
+def test_plan_args():
+    """Test that only the accepted keyword arguments are selected from the context."""
+    def func(value, a=None):
+        return value
+
+    assert schema._get_context_plan(func) == ("value", "a")
+    assert schema._get_context(func, {"a": 1, "b": 2}) == {"a": 1}
+
+
+class Suffix(argo.types.Type):
+
+    """A type that needs context."""
+
+    def serialize(self, value, suffix=""):
+        """Add the suffix to the value."""
+        return value + suffix
+
+
+def test_no_introspection_after_warmup():
+    """Test that the signatures are not inspected again when the schema is used."""
+    class Item(argo.Schema):
+
+        """A schema with a callable accessor and a type that needs context."""
+
+        name = argo.Attr(attr=lambda value, prefix="": prefix + value["name"])
+        title = argo.Attr(Suffix(), attr="name")
+
+    items = [{"name": str(i)} for i in range(100)]
+    Item.serialize(items[0], prefix="#", suffix="!")
+    Item.interpret(items[0], prefix="#", suffix="!")
+
+    with mock.patch("argo.schema.getargspec") as getargspec:
+        result = argo.types.List(Item).serialize(items, prefix="#", suffix="!")
+        Item.interpret(items[0], prefix="#", suffix="!")
+
+    assert not getargspec.called
+    assert result[1] == {"name": "#1", "title": "1!"}